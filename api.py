@@ -1,43 +1,200 @@
 """
 Flask API Server - 백엔드 진입점
 - 프론트엔드와 통신하는 REST API 엔드포인트 제공
+- /health: 준비 상태 확인 (Electron 메인 프로세스가 시작 시 폴링)
+- /shutdown: 종료 전 작업 정리 및 WAL checkpoint (Electron 종료 시 프로세스 kill 전에 호출)
 - /api/config: 설정 관리 (GET/POST)
+- /api/analytics: 점수 통계 (/summary: 전체 요약, /<dimension>: 요구사항 계열/세션/주 단위 추이)
+- /api/history: 히스토리 저장/조회 (/page: 커서 페이지 조회, /<id>: 상세 조회, /search: 전문 검색, /import: 일괄 가져오기)
 - /api/evaluate: 요구사항 평가
+- /api/evaluate/batch: 요구사항 일괄 평가 (NDJSON 스트리밍)
 - /api/improve: 요구사항 개선
+- /api/requirements/import: 요구사항 문서(xlsx/csv/markdown) 일괄 평가/개선 후 히스토리 저장 (NDJSON 스트리밍)
+- /api/evaluate/stream, /api/improve/stream: 단계별 Server-Sent Events 스트리밍
+- /api/jobs: 백그라운드 평가/개선 작업 (등록, 상태/진행률, 결과, 취소 - 재시작 후 자동 재개)
+- 실행: waitress 멀티스레드 서버(기본) 또는 Flask 개발 서버 (--server / CODELIA_SERVER)
 """
 import sys
-import io
+import argparse
+import atexit
+import signal
+import threading
 
-sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8')
-sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8')
+# 한글 로그 출력용 UTF-8 (스트림을 다시 감싸지 않고 설정만 변경, --noconsole 빌드는 스트림이 None)
+for _stream in (sys.stdout, sys.stderr):
+    if _stream is not None and hasattr(_stream, 'reconfigure'):
+        _stream.reconfigure(encoding='utf-8', line_buffering=True)
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
-from modules.services import ConfigService, AnalysisService, DatabaseService
+from modules.services import ConfigService, AnalysisService, DatabaseService, ImportService, RequirementReader, JobService
+from modules.response_cache import ResponseCache
+import config
 import re
+import time
 import uuid
 import json
 import traceback
 
 app = Flask(__name__)
 CORS(app)
+started_at = time.time()
 
 # Initialize Services
 config_service = ConfigService()
-db_service = DatabaseService()
-analysis_service = AnalysisService(config_service)
+db_service = DatabaseService(
+    blob_codec=config.HISTORY_BLOB_CODEC,
+    cache_size_kb=config.SQLITE_CACHE_SIZE_KB,
+    mmap_size=config.SQLITE_MMAP_SIZE,
+    busy_timeout_ms=config.SQLITE_BUSY_TIMEOUT_MS,
+    checkpoint_interval=config.SQLITE_CHECKPOINT_INTERVAL_SECONDS
+)
+response_cache = ResponseCache(
+    db_service,
+    max_memory_entries=config.LLM_CACHE_MEMORY_ENTRIES,
+    max_memory_bytes=config.LLM_CACHE_MEMORY_BYTES,
+    max_disk_entries=config.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+    access_flush_size=config.LLM_CACHE_ACCESS_FLUSH_SIZE,
+    purge_batch_size=config.LLM_CACHE_PURGE_BATCH_SIZE
+) if config.LLM_CACHE_ENABLED else None
+analysis_service = AnalysisService(config_service, response_cache=response_cache)
+import_service = ImportService(analysis_service, db_service)
+job_service = JobService(analysis_service, db_service)
+
+_shutdown_lock = threading.Lock()
+_shutdown_done = False
+
+def shutdown_services():
+    """작업 실행기 정리 후 WAL checkpoint 및 DB 연결 종료 (/shutdown, 종료 시그널, atexit 중 먼저 호출된 곳에서 한 번만)"""
+    global _shutdown_done
+    with _shutdown_lock:
+        if _shutdown_done:
+            return
+        _shutdown_done = True
+    job_service.shutdown()
+    db_service.close()
+
+atexit.register(shutdown_services)
+
+def install_signal_handlers():
+    """종료 시그널에서도 정리 후 종료 (Electron의 kill()은 POSIX에서 SIGTERM - 기본 동작은 atexit 없이 종료)"""
+    def handle(signum, frame):
+        print(f"Received signal {signum}, shutting down")
+        shutdown_services()
+        sys.exit(0)
+
+    for name in ('SIGTERM', 'SIGBREAK'):  # SIGBREAK: Windows 콘솔 Ctrl+Break
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), handle)
+
+if config.JOB_RESUME_ON_START:
+    job_service.resume()
+
+if config.PREWARM_CONNECTIONS:
+    analysis_service.prewarm()
 
 # --- API Routes ---
 
+@app.route('/health', methods=['GET'])
+def health():
+    """준비 상태 - 서비스 초기화와 DB 연결이 끝났으면 200, 아니면 503"""
+    try:
+        db_service.ping()
+    except Exception as e:
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+    return jsonify({
+        'status': 'ok',
+        'server': app.config.get('SERVER_MODE', 'flask'),
+        'uptime': round(time.time() - started_at, 1)
+    })
+
+@app.route('/shutdown', methods=['POST'])
+def shutdown():
+    """
+    종료 준비 - 작업 정리 및 WAL checkpoint 후 DB 연결 종료 (프로세스 종료는 호출한 쪽에서 수행)
+    Windows의 프로세스 kill은 시그널 없이 즉시 종료되므로 Electron이 kill 전에 호출
+    """
+    if request.remote_addr not in ('127.0.0.1', '::1'):
+        return jsonify({'error': 'Forbidden'}), 403
+    shutdown_services()
+    return jsonify({'status': 'stopped'})
+
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    """Get all history from DB"""
+    """
+    전체 히스토리 목록 (full_data 제외) - 이전 버전 호환용
+    화면 목록은 /api/history/page(커서 페이지), 검색은 /api/history/search, 상세는 /api/history/<id> 사용
+    """
     try:
         history = db_service.get_history_list()
         return jsonify(history)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _float_arg(name):
+    value = request.args.get(name)
+    return float(value) if value not in (None, '') else None
+
+def _history_filter_args():
+    """페이지/검색 공통 필터 query (session_id, req_id_prefix, date_from, date_to, min_score, max_score)"""
+    return {
+        'session_id': request.args.get('session_id'),
+        'req_id_prefix': request.args.get('req_id_prefix'),
+        'date_from': request.args.get('date_from'),
+        'date_to': request.args.get('date_to'),
+        'min_score': _float_arg('min_score'),
+        'max_score': _float_arg('max_score')
+    }
+
+@app.route('/api/history/page', methods=['GET'])
+def get_history_page():
+    """
+    히스토리 페이지 조회 (full_data 제외)
+    query: limit, cursor, session_id, req_id_prefix, date_from, date_to, min_score, max_score
+    """
+    try:
+        page = db_service.get_history_page(
+            limit=request.args.get('limit', 50, type=int),
+            cursor=request.args.get('cursor'),
+            **_history_filter_args()
+        )
+        return jsonify(page)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/history/search', methods=['GET'])
+def search_history():
+    """
+    히스토리 전문 검색 (순위/스니펫 포함, full_data 제외)
+    query: q, limit, offset + /api/history/page와 같은 필터
+    """
+    try:
+        result = db_service.search_history(
+            request.args.get('q', ''),
+            limit=request.args.get('limit', 20, type=int),
+            offset=request.args.get('offset', 0, type=int),
+            **_history_filter_args()
+        )
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/history/<int:history_id>', methods=['GET'])
+def get_history_item(history_id):
+    """히스토리 단건 조회 (full_data 포함)"""
+    try:
+        item = db_service.get_history_item(history_id)
+        if item is None:
+            return jsonify({'error': 'History item not found'}), 404
+        return jsonify(item)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/history', methods=['POST'])
 def save_history():
     """Save analysis results to DB (Handles multiple requirement splitting)"""
@@ -63,6 +220,8 @@ def save_history():
 
         # 한 세션 내에서 중복 저장을 방지하기 위한 세트
         saved_req_ids = set()
+        # 세션 전체를 한 트랜잭션으로 저장하기 위해 모아둠
+        items = []
 
         if not req_headers:
             # 요구사항 태그가 없는 경우 (단일 요구사항으로 처리)
@@ -78,7 +237,7 @@ def save_history():
                 'session_id': session_id,
                 'full_data': full_data
             }
-            db_service.save_history_item(item)
+            items.append(item)
         else:
             # 각 요구사항별로 개별 레코드 저장
             for i, (num, content) in enumerate(zip(req_headers, req_sections)):
@@ -112,14 +271,55 @@ def save_history():
                     'session_id': session_id,
                     'full_data': full_data
                 }
-                db_service.save_history_item(item)
+                items.append(item)
 
+        db_service.save_history_batch(items)
         return jsonify({'status': 'success', 'message': 'History saved to SQLite'})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"Error saving history: {e}")
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/history/import', methods=['POST'])
+def import_history():
+    """
+    히스토리 일괄 가져오기 (복원/마이그레이션) - 전체를 하나의 트랜잭션으로 저장
+    body: {items: [{req_id, original_text, improved_text, original_score, improved_score,
+                    session_id, full_data, created_at}, ...]}
+          (GET /api/history 응답 형식과 동일, full_data는 선택 - 포함하려면 /api/history/<id> 상세 응답 사용)
+    점수는 숫자 또는 숫자 문자열 ("80")만 허용 - 아니면 아무것도 저장하지 않고 400
+    """
+    data = request.json or {}
+    records = data.get('items')
+    if not isinstance(records, list):
+        return jsonify({'error': 'items must be a list'}), 400
+
+    items = []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict) or not record.get('req_id'):
+            return jsonify({'error': f'items[{index}]: req_id is required'}), 400
+        items.append({
+            'req_id': record.get('req_id'),
+            'original': record.get('original_text', record.get('original')),
+            'improved': record.get('improved_text', record.get('improved')),
+            'original_score': record.get('original_score'),
+            'improved_score': record.get('improved_score'),
+            'session_id': record.get('session_id') or str(uuid.uuid4()),
+            'full_data': record.get('full_data'),
+            'created_at': record.get('created_at')
+        })
+
+    try:
+        count = db_service.save_history_batch(items)
+        return jsonify({'status': 'success', 'imported': count})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/history/delete', methods=['POST'])
 def delete_history():
     """Delete a history item"""
@@ -131,6 +331,33 @@ def delete_history():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/analytics/summary', methods=['GET'])
+def get_analytics_summary():
+    """전체 히스토리 평균 점수 및 카테고리별 점수 (증분 집계 테이블에서 조회)"""
+    try:
+        return jsonify(db_service.get_analytics_summary())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/<dimension>', methods=['GET'])
+def get_analytics(dimension):
+    """
+    차원별 점수 통계
+    dimension: all | family | session | week
+    query: limit (기본 100), categories (0이면 카테고리 점수 제외)
+    """
+    try:
+        result = db_service.get_analytics(
+            dimension,
+            limit=request.args.get('limit', 100, type=int),
+            include_categories=request.args.get('categories', '1') not in ('0', 'false')
+        )
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/config', methods=['GET'])
 def get_config():
     cfg = config_service.load_config()
@@ -148,10 +375,9 @@ def get_config():
 def update_config():
     """Update configuration"""
     data = request.json
-    current_config = config_service.load_config()
-    current_config.update(data)
     
-    if config_service.save_config(current_config):
+    # 변경 알림은 ConfigService 구독자(AnalysisService)가 처리
+    if config_service.update_config(data):
         return jsonify({'status': 'success', 'message': 'Configuration saved'})
     return jsonify({'status': 'error', 'message': 'Failed to save config'}), 500
 
@@ -159,28 +385,285 @@ def update_config():
 def evaluate():
     data = request.json
     text = data.get('text')
+    use_cache = data.get('use_cache', True)  # false: 캐시 우회 (강제 재평가)
+    mode = data.get('mode')  # 'full' | 'fast' (로컬 규칙 사전 채점, API 키 없이도 동작) | 'sharded' (카테고리별 동시 채점)
     
     try:
-        result = analysis_service.evaluate(text)
+        result = analysis_service.evaluate(text, use_cache, mode)
         return jsonify(result)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/evaluate/batch', methods=['POST'])
+def evaluate_batch():
+    """
+    요구사항 일괄 평가 - 결과를 NDJSON(한 줄에 하나의 JSON)으로 스트리밍
+    body: {texts: [...], concurrency: 4, order: 'input'|'completion', use_cache: true, mode: 'full'|'fast'|'sharded'}
+    """
+    data = request.json or {}
+    texts = data.get('texts')
+    if not isinstance(texts, list) or not texts:
+        return jsonify({'error': 'texts must be a non-empty list'}), 400
+
+    try:
+        results = analysis_service.evaluate_batch(
+            texts,
+            concurrency=data.get('concurrency'),
+            order=data.get('order', 'input'),
+            use_cache=data.get('use_cache', True),
+            mode=data.get('mode')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
+
+    def generate():
+        started = time.perf_counter()
+        count = errors = 0
+        for item in results:
+            count += 1
+            if 'error' in item:
+                errors += 1
+            yield json.dumps(item, ensure_ascii=False) + '\n'
+        yield json.dumps({
+            'done': True,
+            'count': count,
+            'errors': errors,
+            'elapsed': round(time.perf_counter() - started, 3)
+        }) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/improve', methods=['POST'])
 def improve():
     data = request.json
     text = data.get('text')
     pattern_data = data.get('pattern_data', {})
+    pipeline = data.get('pipeline')  # 'concurrent' | 'sequential' (기본값: config.IMPROVE_PIPELINE_MODE)
+    use_cache = data.get('use_cache', True)
     
     try:
-        result = analysis_service.improve(text, pattern_data)
+        result = analysis_service.improve(text, pattern_data, pipeline, use_cache)
         return jsonify(result)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/requirements/import', methods=['POST'])
+def import_requirements():
+    """
+    요구사항 문서 가져오기 - 행 단위로 읽어 일괄 평가/개선하고 완료되는 대로 히스토리에 저장 (NDJSON 스트리밍)
+    form-data: file (.xlsx/.csv/.tsv/.md), action: 'evaluate'|'improve', id_column, text_column, sheet, id_prefix,
+               concurrency, mode, pipeline, pattern_data (JSON 문자열), use_cache, save
+    """
+    upload = request.files.get('file')
+    if upload is None or not upload.filename:
+        return jsonify({'error': 'file is required'}), 400
+    form = request.form
+
+    def flag(name, default=True):
+        return form.get(name, str(default)).lower() not in ('0', 'false', 'no')
+
+    try:
+        reader = RequirementReader(
+            upload.stream,
+            upload.filename,
+            id_column=form.get('id_column'),
+            text_column=form.get('text_column'),
+            sheet=form.get('sheet'),
+            id_prefix=form.get('id_prefix', 'REQ')
+        )
+        results = import_service.run(
+            reader,
+            action=form.get('action', 'evaluate'),
+            concurrency=form.get('concurrency', type=int),
+            mode=form.get('mode'),
+            pipeline=form.get('pipeline'),
+            pattern_data=json.loads(form.get('pattern_data') or '{}'),
+            use_cache=flag('use_cache'),
+            save=flag('save')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+    def generate():
+        try:
+            for item in results:
+                yield json.dumps(item, ensure_ascii=False) + '\n'
+        except Exception as e:
+            traceback.print_exc()
+            yield json.dumps({'error': str(e)}, ensure_ascii=False) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """LLM 응답 캐시 적중/실패 통계"""
+    if response_cache is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **response_cache.stats()})
+
+@app.route('/api/cache/clear', methods=['POST'])
+def clear_cache():
+    if response_cache is not None:
+        response_cache.clear()
+    return jsonify({'status': 'success'})
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _sse_response(events):
+    """(event, data) 이벤트를 text/event-stream 응답으로 변환 (스트림 중 오류는 error 이벤트로 전달)"""
+    def generate():
+        try:
+            for event, data in events:
+                yield _sse(event, data)
+        except Exception as e:
+            traceback.print_exc()
+            yield _sse('error', {'error': str(e)})
+        yield _sse('done', {})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/evaluate/stream', methods=['POST'])
+def evaluate_stream():
+    """요구사항 평가 (SSE) - (fast 모드: local) token ... scored 이벤트 (sharded 모드: shard ... scored)"""
+    data = request.json or {}
+    try:
+        events = analysis_service.evaluate_stream(data.get('text'), data.get('use_cache', True), data.get('mode'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
+    return _sse_response(events)
+
+@app.route('/api/improve/stream', methods=['POST'])
+def improve_stream():
+    """요구사항 개선 (SSE) - original_scored / improvement_token / improved_scored / result 이벤트"""
+    data = request.json or {}
+    try:
+        events = analysis_service.improve_stream(
+            data.get('text'),
+            data.get('pattern_data', {}),
+            data.get('pipeline'),
+            data.get('use_cache', True)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400 if "API key" not in str(e) else 401
+    return _sse_response(events)
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    백그라운드 작업 등록 - job_id를 즉시 반환 (202)
+    body: {kind: 'evaluate'|'improve', text 또는 texts: [...], mode, pipeline, pattern_data, use_cache, concurrency}
+    """
+    data = request.json or {}
+    texts = data.get('texts')
+    if texts is None and data.get('text'):
+        texts = [data.get('text')]
+    options = {
+        key: data[key]
+        for key in ('mode', 'pipeline', 'pattern_data', 'use_cache', 'concurrency')
+        if data.get(key) is not None
+    }
+    try:
+        job_id = job_service.submit(data.get('kind', 'evaluate'), texts, options)
+        return jsonify(job_service.status(job_id)), 202
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """최근 작업 목록 (query: status, limit)"""
+    try:
+        return jsonify(job_service.list_jobs(request.args.get('status'), request.args.get('limit', 50, type=int)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """작업 상태 및 진행률 (total, completed, failed, progress)"""
+    job = job_service.status(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """작업 항목별 결과 (완료된 항목만, 실행 중에도 부분 조회 가능) - query: offset, limit"""
+    job = job_service.results(
+        job_id,
+        offset=request.args.get('offset', 0, type=int),
+        limit=request.args.get('limit', 100, type=int)
+    )
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    job = job_service.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/llm/status', methods=['GET'])
+def llm_status():
+    """Provider별 서킷 브레이커 상태, 속도 제한 대기열/대기 시간, 토큰 사용량/프롬프트 캐시 적중"""
+    return jsonify({
+        'circuits': analysis_service.provider_registry.breaker_states(),
+        'rate_limits': analysis_service.rate_limiters.stats(),
+        'usage': analysis_service.provider_registry.usage_stats()
+    })
+
+def run_server(mode=config.SERVER_MODE, host=config.SERVER_HOST, port=config.SERVER_PORT, threads=config.SERVER_THREADS):
+    """API 서버 실행 (waitress 미설치 시 Flask 개발 서버로 대체)"""
+    waitress = None
+    if mode == 'waitress':
+        try:
+            import waitress
+        except ImportError:  # 선택 의존성 - 없으면 Flask 개발 서버로 실행
+            print("waitress is not installed, falling back to the Flask development server")
+            mode = 'flask'
+    app.config['SERVER_MODE'] = mode
+    print(f"Starting API server ({mode}) on http://{host}:{port}")
+
+    if mode == 'flask':
+        app.run(host=host, port=port, threaded=True)
+        return
+    if mode != 'waitress':
+        raise ValueError(f"Unsupported server mode: {mode}")
+    waitress.serve(
+        app,
+        host=host,
+        port=port,
+        threads=threads,
+        backlog=config.SERVER_BACKLOG,
+        connection_limit=config.SERVER_CONNECTION_LIMIT,
+        channel_timeout=config.SERVER_CHANNEL_TIMEOUT,
+        cleanup_interval=config.SERVER_CLEANUP_INTERVAL,
+        # 스트리밍(SSE/NDJSON) 조각을 모아 보내지 않고 바로 전송
+        send_bytes=1,
+        ident='Codelia'
+    )
+
 if __name__ == '__main__':
-    app.run(port=8000)
+    parser = argparse.ArgumentParser(description="Codelia API server")
+    parser.add_argument('--server', choices=('waitress', 'flask'), default=config.SERVER_MODE)
+    parser.add_argument('--host', default=config.SERVER_HOST)
+    parser.add_argument('--port', type=int, default=config.SERVER_PORT)
+    parser.add_argument('--threads', type=int, default=config.SERVER_THREADS)
+    args = parser.parse_args()
+    install_signal_handlers()
+    run_server(args.server, args.host, args.port, args.threads)
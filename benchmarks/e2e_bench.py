@@ -0,0 +1,435 @@
+"""
+E2E Benchmark - 모의 LLM 서버를 사용한 API 백엔드 처리량/지연 시간 측정
+- 모의 LLM 서버(mock_llm_server)는 같은 프로세스에서, API 서버는 빈 HOME의 별도 프로세스로 실행
+- 시나리오(/api/evaluate, /api/improve, 히스토리/분석 조회)마다 지정한 동시 요청 수별로 측정
+  (워커마다 keep-alive 연결 하나, 워밍업 요청은 통계에서 제외)
+- --history-rows: 합성 history.db(1만~100만 행)를 저장 경로(save_history_batch)로 만든 뒤 서버 시작
+  (--db-cache 지정 시 행 수/시드/스키마 버전별로 만들어 둔 DB 재사용)
+- 모의 서버 부하 설정: --latency, --jitter, --token-rate, --error-rate, --error-status
+- 결과: p50/p95/p99/평균/최대 지연 시간(ms), 초당 요청 수(RPS), 오류 수
+  → JSON 저장(--out, 기본값 benchmarks/results/) 후 --compare로 이전 실행과 비교
+
+사용법:
+    python benchmarks/e2e_bench.py --concurrency 1,8,32 --requests 200
+    python benchmarks/e2e_bench.py --scenarios history-page,history-search,history-item --history-rows 1000000 --db-cache /tmp/codelia-db
+    python benchmarks/e2e_bench.py --latency 0.5 --token-rate 60 --error-rate 0.05 --compare benchmarks/results/before.json
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import mock_llm_server
+from startup_bench import ROOT, isolated_env
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# 합성 요구사항 구성 요소 (검색 시나리오는 SEARCH_TERMS로 조회)
+FAMILIES = ('SYS', 'SW', 'HW', 'IF', 'PERF', 'SAFE', 'SEC', 'OPS')
+CONDITIONS = ('전원이 켜지면', '브레이크 신호가 수신되면', '온도가 임계값을 초과하면', '사용자가 로그인하면', '통신이 끊기면', '')
+SUBJECTS = ('시스템은', '제어기는', '센서 모듈은', '사용자 인터페이스는', '통신 장치는', '데이터 저장소는')
+ACTIONS = ('데이터를 기록해야 한다', '경고를 표시해야 한다', '요청에 응답해야 한다', '상태를 보고해야 한다', '오류를 감지해야 한다')
+SEARCH_TERMS = ('센서', '브레이크', '온도', '통신', '경고', '데이터 기록', 'REQ')
+CATEGORIES = {'Pattern': 28, 'Characteristics': 60, 'Rules': 168}
+
+
+def requirement_text(rng, n):
+    condition = rng.choice(CONDITIONS)
+    text = f"{rng.choice(SUBJECTS)} {rng.randint(1, 50) * 10}ms 이내에 {rng.choice(ACTIONS)}. (#{n})"
+    return f"{condition} {text}" if condition else text
+
+
+# --- 합성 history.db ---
+
+def _full_data_templates(rng, count=32):
+    """카테고리 점수가 있는 full_data 견본 (같은 견본은 blob 하나로 저장됨)"""
+    def scores():
+        categories = {name: {'score': rng.randint(0, maximum), 'max': maximum} for name, maximum in CATEGORIES.items()}
+        total = sum(c['score'] for c in categories.values())
+        return {'total': total, 'percentage': round(total / sum(CATEGORIES.values()) * 100, 1), 'categories': categories}
+
+    templates = []
+    for i in range(count):
+        if i % 2:
+            templates.append({'original_scores': scores(), 'improved_scores': scores(),
+                              'improved_result': {'improved': '**요구사항 1 (Pattern: Ubiquitous)**'}})
+        else:
+            templates.append({'original_scores': scores()})
+    return templates
+
+
+def synthetic_history(rows, seed=0):
+    """history 항목을 하나씩 생성 (req_id 계열/세션/생성 시각이 고르게 분포)"""
+    rng = random.Random(seed)
+    templates = _full_data_templates(rng)
+    started = datetime(2025, 1, 1)
+    session_id, session_left = None, 0
+    for n in range(1, rows + 1):
+        if session_left == 0:
+            session_id, session_left = f"bench-{n:08d}", rng.randint(1, 20)
+        session_left -= 1
+        full_data = rng.choice(templates)
+        improved = 'improved_scores' in full_data
+        yield {
+            'req_id': f"REQ-{rng.choice(FAMILIES)}-{n:07d}",
+            'original': requirement_text(rng, n),
+            'improved': requirement_text(rng, n) if improved else None,
+            'original_score': round(full_data['original_scores']['percentage']),
+            'improved_score': round(full_data['improved_scores']['percentage']) if improved else None,
+            'session_id': session_id,
+            'full_data': full_data,
+            'created_at': (started + timedelta(seconds=rng.randint(0, 365 * 86400))).strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+
+def seed_history(home, rows, seed=0, batch_size=5000, cache_dir=None):
+    """home/.Codelia/history.db에 합성 히스토리 생성 (반환: 걸린 시간(초), 캐시 사용 시 0)"""
+    sys.path.insert(0, str(ROOT))
+    from modules.services.database_service import DatabaseService, SCHEMA_VERSION
+
+    target = Path(home) / '.Codelia' / 'history.db'
+    cached = Path(cache_dir) / f"history-{rows}-s{seed}-v{SCHEMA_VERSION}.db" if cache_dir else None
+    if cached is not None and cached.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, target)
+        return 0.0
+
+    # DatabaseService는 생성 시점의 홈 디렉토리를 사용
+    saved_env = {key: os.environ.get(key) for key in ('HOME', 'USERPROFILE')}
+    os.environ['HOME'] = os.environ['USERPROFILE'] = str(home)
+    try:
+        db = DatabaseService()
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    started = time.perf_counter()
+    items = synthetic_history(rows, seed)
+    try:
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            db.save_history_batch(batch)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(target, cached)
+    return elapsed
+
+
+# --- 시나리오: (rng, 요청 번호, 히스토리 행 수) → (method, path, body) ---
+
+def _query(path, **params):
+    return f"{path}?{urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})}"
+
+
+SCENARIOS = {
+    # use_cache=False: 매 요청이 LLM(모의 서버) 경로를 거침
+    'evaluate': lambda rng, n, rows, mode: (
+        'POST', '/api/evaluate', {'text': requirement_text(rng, n), 'use_cache': False, 'mode': mode}),
+    'evaluate-cached': lambda rng, n, rows, mode: (
+        'POST', '/api/evaluate', {'text': requirement_text(random.Random(n % 20), n % 20), 'mode': mode}),
+    'improve': lambda rng, n, rows, mode: (
+        'POST', '/api/improve', {'text': requirement_text(rng, n), 'use_cache': False}),
+    'history-page': lambda rng, n, rows, mode: (
+        'GET', _query('/api/history/page', limit=50, req_id_prefix=f"REQ-{rng.choice(FAMILIES)}"), None),
+    'history-search': lambda rng, n, rows, mode: (
+        'GET', _query('/api/history/search', q=rng.choice(SEARCH_TERMS), limit=20), None),
+    'history-item': lambda rng, n, rows, mode: (
+        'GET', f"/api/history/{rng.randint(1, max(1, rows))}", None),
+    'analytics': lambda rng, n, rows, mode: (
+        'GET', _query('/api/analytics/family', limit=20), None),
+    # 전체 목록 - 대용량 DB에서는 응답이 매우 큼 (기본 시나리오에서 제외)
+    'history-list': lambda rng, n, rows, mode: ('GET', '/api/history', None),
+}
+DEFAULT_SCENARIOS = ('evaluate', 'improve', 'history-page', 'history-search', 'history-item', 'analytics')
+
+
+def percentile(sorted_values, q):
+    """최근접 순위 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class Client:
+    """워커 스레드 하나가 쓰는 keep-alive HTTP 연결"""
+
+    def __init__(self, host, port, timeout):
+        self.host, self.port, self.timeout = host, port, timeout
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        """(HTTP 상태 코드, 응답 크기) - 연결 오류는 상태 코드 0"""
+        payload = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            if response.getheader('Connection', '').lower() == 'close':
+                self.close()
+            return response.status, len(data)
+        except (OSError, http.client.HTTPException):
+            self.close()
+            return 0, 0
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def run_phase(host, port, build, count, concurrency, seed, timeout):
+    """count개 요청을 concurrency개 워커로 실행 → (지연 시간 목록(초), 상태 코드별 수, 응답 바이트, 걸린 시간)"""
+    counter = itertools.count()
+    latencies, statuses = [], {}
+    received = [0]
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        rng = random.Random(seed * 1000 + worker_id)
+        client = Client(host, port, timeout)
+        try:
+            while True:
+                n = next(counter)
+                if n >= count:
+                    return
+                method, path, body = build(rng, n)
+                started = time.perf_counter()
+                status, size = client.request(method, path, body)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    statuses[status] = statuses.get(status, 0) + 1
+                    received[0] += size
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, statuses, received[0], time.perf_counter() - started
+
+
+def measure(host, port, scenario, concurrency, requests, warmup, rows, mode, seed, timeout):
+    factory = SCENARIOS[scenario]
+
+    def build(rng, n):
+        return factory(rng, n, rows, mode)
+
+    if warmup:
+        run_phase(host, port, build, warmup, concurrency, seed + 1, timeout)
+    latencies, statuses, received, wall = run_phase(host, port, build, requests, concurrency, seed, timeout)
+    latencies.sort()
+    ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': sum(count for status, count in statuses.items() if status != 200),
+        'status_codes': {str(status): count for status, count in sorted(statuses.items())},
+        'p50_ms': ms(percentile(latencies, 50)),
+        'p95_ms': ms(percentile(latencies, 95)),
+        'p99_ms': ms(percentile(latencies, 99)),
+        'mean_ms': ms(sum(latencies) / len(latencies)) if latencies else None,
+        'max_ms': ms(latencies[-1]) if latencies else None,
+        'rps': round(len(latencies) / wall, 1) if wall else None,
+        'bytes': received,
+    }
+
+
+# --- API 서버 ---
+
+def start_api(home, port, server_mode, threads, log_path, timeout=60.0):
+    command = [sys.executable, 'api.py', '--server', server_mode, '--port', str(port)]
+    if threads:
+        command += ['--threads', str(threads)]
+    log = open(log_path, 'wb')
+    process = subprocess.Popen(command, cwd=ROOT, env=isolated_env(home), stdout=log, stderr=subprocess.STDOUT)
+    client = Client('127.0.0.1', port, 2)
+    started = time.perf_counter()
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"API server exited with code {process.returncode} (log: {log_path})")
+            if client.request('GET', '/health')[0] == 200:
+                return process, log
+            time.sleep(0.05)
+    finally:
+        client.close()
+    stop_api(process, log)
+    raise TimeoutError(f"/health did not answer within {timeout}s (log: {log_path})")
+
+
+def stop_api(process, log):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    log.close()
+
+
+def configure_provider(port, provider, mock_url):
+    client = Client('127.0.0.1', port, 10)
+    try:
+        status, _ = client.request('POST', '/api/config', {'provider': provider, provider: {'key': 'bench', 'url': mock_url}})
+    finally:
+        client.close()
+    if status != 200:
+        raise RuntimeError(f"Failed to configure provider (HTTP {status})")
+
+
+# --- 결과 ---
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_results(results):
+    print(f"\n{'scenario':<16}{'conc':>5}{'reqs':>7}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>9}")
+    for r in results:
+        print(f"{r['scenario']:<16}{r['concurrency']:>5}{r['requests']:>7}{r['errors']:>6}"
+              f"{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}{r['rps']:>9}")
+
+
+def print_comparison(results, baseline_path):
+    """이전 실행 결과와 같은 (시나리오, 동시 요청 수) 항목끼리 비교 (변화율 %)"""
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+    previous = {(r['scenario'], r['concurrency']): r for r in baseline.get('results', [])}
+
+    def change(new, old):
+        if new is None or not old:
+            return '-'
+        return f"{(new - old) / old * 100:+.1f}%"
+
+    print(f"\nvs {baseline_path} ({baseline.get('timestamp')}, {baseline.get('git_commit')})")
+    matched = [(r, previous[(r['scenario'], r['concurrency'])]) for r in results
+               if (r['scenario'], r['concurrency']) in previous]
+    if not matched:
+        print("  no matching scenario/concurrency entries")
+        return
+    print(f"{'scenario':<16}{'conc':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>10}")
+    for r, old in matched:
+        print(f"{r['scenario']:<16}{r['concurrency']:>5}"
+              f"{change(r['p50_ms'], old['p50_ms']):>10}{change(r['p95_ms'], old['p95_ms']):>10}"
+              f"{change(r['p99_ms'], old['p99_ms']):>10}{change(r['rps'], old['rps']):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end API benchmark against a local mock LLM server")
+    parser.add_argument('--scenarios', default=','.join(DEFAULT_SCENARIOS),
+                        help=f"Comma-separated: {', '.join(SCENARIOS)}")
+    parser.add_argument('--concurrency', default='1,8,32', help="Comma-separated concurrency levels")
+    parser.add_argument('--requests', type=int, default=200, help="Measured requests per scenario and level")
+    parser.add_argument('--warmup', type=int, default=20, help="Unmeasured requests before each level")
+    parser.add_argument('--history-rows', type=int, default=10000, help="Synthetic history.db rows (0: empty DB)")
+    parser.add_argument('--db-cache', help="Directory to keep and reuse generated history.db files")
+    parser.add_argument('--provider', choices=('openai', 'claude', 'gemini'), default='openai')
+    parser.add_argument('--mode', choices=('full', 'fast', 'sharded'), help="Evaluate mode (default: server config)")
+    parser.add_argument('--server', choices=('waitress', 'flask'), default='waitress')
+    parser.add_argument('--threads', type=int, help="API server threads (default: config.SERVER_THREADS)")
+    parser.add_argument('--port', type=int, default=18770, help="API server port")
+    parser.add_argument('--mock-port', type=int, default=18780)
+    parser.add_argument('--latency', type=float, default=0.0, help="Mock: seconds before the first token")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Mock: extra random latency, 0..jitter seconds")
+    parser.add_argument('--token-rate', type=float, default=0.0, help="Mock: output tokens per second (0: instant)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Mock: fraction of requests answered with an error")
+    parser.add_argument('--error-status', type=int, default=500, help="Mock: HTTP status of injected errors")
+    parser.add_argument('--timeout', type=float, default=120.0, help="Per-request timeout (seconds)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help="Result JSON path (default: benchmarks/results/e2e-<timestamp>.json)")
+    parser.add_argument('--compare', help="Previous result JSON to compare against")
+    parser.add_argument('--keep-home', action='store_true', help="Keep the temporary HOME (DB, server log)")
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+
+    home = tempfile.mkdtemp(prefix='codelia-e2e-')
+    seed_seconds = None
+    if args.history_rows > 0:
+        print(f"Seeding history.db with {args.history_rows} rows...")
+        seed_seconds = seed_history(home, args.history_rows, args.seed, cache_dir=args.db_cache)
+        print(f"  {'reused cached DB' if seed_seconds == 0 else f'{seed_seconds:.1f}s'}")
+
+    mock = mock_llm_server.start(
+        port=args.mock_port, latency=args.latency, jitter=args.jitter, token_rate=args.token_rate,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    )
+    process, log = start_api(home, args.port, args.server, args.threads, Path(home) / 'server.log')
+    results = []
+    try:
+        configure_provider(args.port, args.provider, f"http://127.0.0.1:{args.mock_port}/v1")
+        for scenario in scenarios:
+            for concurrency in levels:
+                result = measure('127.0.0.1', args.port, scenario, concurrency, args.requests, args.warmup,
+                                 args.history_rows, args.mode, args.seed, args.timeout)
+                results.append(result)
+                print(f"  {scenario} x{concurrency}: p50 {result['p50_ms']}ms, p99 {result['p99_ms']}ms, "
+                      f"{result['rps']} req/s, {result['errors']} errors")
+    finally:
+        stop_api(process, log)
+        mock.shutdown()
+        mock.server_close()
+        if args.keep_home:
+            print(f"HOME kept at {home}")
+        else:
+            shutil.rmtree(home, ignore_errors=True)
+
+    print_results(results)
+    mock_stats = mock.state.snapshot()
+    print(f"\nmock LLM: {mock_stats['requests']} requests, {mock_stats['errors']} injected errors")
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {key: value for key, value in vars(args).items() if key not in ('out', 'compare', 'keep_home')},
+        'history_seed_seconds': round(seed_seconds, 1) if seed_seconds else seed_seconds,
+        'mock': mock_stats,
+        'results': results,
+    }
+    out = Path(args.out) if args.out else RESULTS_DIR / f"e2e-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResults written to {out}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""
+Mock LLM Server - 로컬 테스트/벤치마크용 가짜 LLM API 서버
+- OpenAI(/chat/completions), Claude(/messages), Gemini(:generateContent, :streamGenerateContent) 형식 지원
+- 일반 응답과 SSE 스트리밍 응답 모두 지원
+- 평가 요청("Evaluate")에는 요청된 규칙의 점수 JSON, 그 외에는 개선 결과 형식의 텍스트 반환
+- Provider 프롬프트 캐시 동작 모사: 같은 system 프롬프트 재요청 시 usage에 캐시 적중 토큰 보고
+  (Claude: cache_control 지정 시, Gemini: systemInstruction/cachedContents 사용 시, OpenAI: 항상)
+- 부하 모사: 첫 토큰 지연(latency + 0~jitter), 출력 토큰 생성 속도(token_rate), 오류 주입(error_rate, error_status)
+  (스트리밍 응답은 청크마다 토큰 속도만큼 대기)
+- GET /__mock: 현재 설정과 요청/주입 오류 수, POST /__mock: 실행 중 설정 변경
+
+사용법:
+    python benchmarks/mock_llm_server.py --port 18080
+    python benchmarks/mock_llm_server.py --latency 0.3 --jitter 0.2 --token-rate 80 --error-rate 0.02 --error-status 429
+    → 설정의 Base URL을 http://127.0.0.1:18080/v1 로 지정
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ALL_RULES = (
+    [f"P{i}" for i in range(1, 8)] + [f"C{i}" for i in range(1, 16)] + [f"R{i}" for i in range(1, 43)]
+)
+_SCORE_ONLY = re.compile(r"Score ONLY these \d+ rules: ([A-Z0-9, ]+)")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+class MockState:
+    """서버 전체에서 공유되는 캐시/통계/부하 설정 상태"""
+
+    SETTINGS = ('latency', 'jitter', 'token_rate', 'error_rate', 'error_status')
+
+    def __init__(self, latency=0.0, jitter=0.0, token_rate=0.0, error_rate=0.0, error_status=500, seed=None):
+        self.lock = threading.Lock()
+        self.prompt_cache = set()  # 캐시된 system 프롬프트 해시
+        self.cached_contents = {}  # Gemini cachedContent 이름 -> system 프롬프트
+        self.requests = 0
+        self.errors = 0  # 주입한 오류 수
+        self.random = random.Random(seed)
+        self.configure(latency=latency, jitter=jitter, token_rate=token_rate,
+                       error_rate=error_rate, error_status=error_status)
+
+    def configure(self, **settings):
+        unknown = set(settings) - set(self.SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown mock settings: {', '.join(sorted(unknown))}")
+        with self.lock:
+            for name, value in settings.items():
+                value = int(value) if name == 'error_status' else float(value)
+                if value < 0 or (name == 'error_rate' and value > 1):
+                    raise ValueError(f"Invalid mock setting {name}={value}")
+                setattr(self, name, value)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            settings = {name: getattr(self, name) for name in self.SETTINGS}
+            return dict(settings, requests=self.requests, errors=self.errors)
+
+    def injected_error(self):
+        """이번 요청에 주입할 HTTP 상태 코드 (없으면 None)"""
+        with self.lock:
+            self.requests += 1
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.errors += 1
+                return self.error_status
+            return None
+
+    def first_token_delay(self) -> float:
+        with self.lock:
+            return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def generation_delay(self, text: str) -> float:
+        # token_rate: 초당 출력 토큰 수 (0이면 즉시)
+        return estimate_tokens(text) / self.token_rate if self.token_rate else 0.0
+
+    def cache_lookup(self, system_prompt: str):
+        """(cached_tokens, cache_write_tokens) - 처음 본 프롬프트는 캐시에 기록"""
+        key = hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+        tokens = estimate_tokens(system_prompt)
+        with self.lock:
+            if key in self.prompt_cache:
+                return tokens, 0
+            self.prompt_cache.add(key)
+            return 0, tokens
+
+
+def build_response_text(system_prompt: str, user_message: str) -> str:
+    if 'Evaluate' in user_message:
+        match = _SCORE_ONLY.search(system_prompt)
+        rules = [r.strip() for r in match.group(1).split(',')] if match else ALL_RULES
+        return json.dumps({rule: {"score": 4, "reason": "모의 응답"} for rule in rules}, ensure_ascii=False)
+    return "**요구사항 1 (Pattern: Ubiquitous)**\n시스템은 요청을 1초 이내에 처리해야 한다.\n\n### 개선 사항\n- 모의 응답"
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = MockState()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] == '/__mock':
+            return self._send_json(self.state.snapshot())
+        self._send_json({'error': {'message': f'Unknown path: {self.path}'}}, status=404)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        path = self.path.split('?')[0]
+        if path == '/__mock':
+            try:
+                self.state.configure(**body)
+            except (TypeError, ValueError) as e:
+                return self._send_json({'error': {'message': str(e)}}, status=400)
+            return self._send_json(self.state.snapshot())
+
+        status = self.state.injected_error()
+        if status is not None:
+            return self._send_json({'error': {'message': f'Injected error ({status})'}}, status=status)
+        delay = self.state.first_token_delay()
+        if delay:
+            time.sleep(delay)
+
+        if path.endswith('/cachedContents'):
+            return self._gemini_create_cache(body)
+        if ':generateContent' in path or ':streamGenerateContent' in path:
+            return self._gemini(body, stream=':streamGenerateContent' in path)
+        if path.endswith('/messages'):
+            return self._claude(body)
+        if path.endswith('/chat/completions'):
+            return self._openai(body)
+        self._send_json({'error': {'message': f'Unknown path: {path}'}}, status=404)
+
+    # --- 응답 전송 ---
+
+    def _send_json(self, payload: dict, status: int = 200, text: str = ''):
+        # text: 생성된 응답 본문 (토큰 속도만큼 대기 후 전송)
+        delay = self.state.generation_delay(text) if text else 0.0
+        if delay:
+            time.sleep(delay)
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_sse(self, events):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for event in events:
+            delay = self._event_delay(event)
+            if delay:
+                time.sleep(delay)
+            data = event if isinstance(event, bytes) else f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8')
+            self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _event_delay(self, event) -> float:
+        """SSE 이벤트에 포함된 텍스트 조각의 생성 시간"""
+        if not self.state.token_rate or not isinstance(event, dict):
+            return 0.0
+        texts = [event.get('delta', {}).get('text', '')]
+        texts += [c.get('delta', {}).get('content') or '' for c in event.get('choices', [])]
+        texts += [p.get('text', '') for c in event.get('candidates', []) for p in c.get('content', {}).get('parts', [])]
+        text = ''.join(texts)
+        return self.state.generation_delay(text) if text else 0.0
+
+    @staticmethod
+    def _chunks(text: str, size: int = 16):
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    # --- OpenAI ---
+
+    def _openai(self, body: dict):
+        messages = body.get('messages', [])
+        system_prompt = ''.join(m.get('content', '') for m in messages if m.get('role') == 'system')
+        user_message = ''.join(m.get('content', '') for m in messages if m.get('role') == 'user')
+        text = build_response_text(system_prompt, user_message)
+        cached, _ = self.state.cache_lookup(system_prompt)
+        usage = {
+            'prompt_tokens': estimate_tokens(system_prompt) + estimate_tokens(user_message),
+            'completion_tokens': estimate_tokens(text),
+            'prompt_tokens_details': {'cached_tokens': cached}
+        }
+        if not body.get('stream'):
+            return self._send_json({
+                'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                'usage': usage
+            }, text=text)
+        events = [{'choices': [{'index': 0, 'delta': {'content': chunk}}]} for chunk in self._chunks(text)]
+        if (body.get('stream_options') or {}).get('include_usage'):
+            events.append({'choices': [], 'usage': usage})
+        events.append(b"data: [DONE]\n\n")
+        self._send_sse(events)
+
+    # --- Claude ---
+
+    def _claude(self, body: dict):
+        system = body.get('system') or ''
+        if isinstance(system, list):
+            system_prompt = ''.join(block.get('text', '') for block in system)
+            cacheable = any(block.get('cache_control') for block in system)
+        else:
+            system_prompt, cacheable = system, False
+        user_message = ''.join(
+            m['content'] if isinstance(m.get('content'), str) else ''.join(b.get('text', '') for b in m.get('content', []))
+            for m in body.get('messages', [])
+        )
+        text = build_response_text(system_prompt, user_message)
+        cached, written = self.state.cache_lookup(system_prompt) if cacheable else (0, 0)
+        usage = {
+            'input_tokens': estimate_tokens(system_prompt) + estimate_tokens(user_message) - cached - written,
+            'cache_read_input_tokens': cached,
+            'cache_creation_input_tokens': written,
+            'output_tokens': estimate_tokens(text)
+        }
+        if not body.get('stream'):
+            return self._send_json({
+                'id': f"msg_{uuid.uuid4().hex[:12]}",
+                'type': 'message',
+                'content': [{'type': 'text', 'text': text}],
+                'usage': usage
+            }, text=text)
+        start_usage = dict(usage, output_tokens=1)
+        events = [{'type': 'message_start', 'message': {'usage': start_usage}}]
+        events += [
+            {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': chunk}}
+            for chunk in self._chunks(text)
+        ]
+        events.append({'type': 'message_delta', 'usage': {'output_tokens': usage['output_tokens']}})
+        events.append({'type': 'message_stop'})
+        self._send_sse(events)
+
+    # --- Gemini ---
+
+    def _gemini_create_cache(self, body: dict):
+        system_prompt = ''.join(p.get('text', '') for p in (body.get('systemInstruction') or {}).get('parts', []))
+        name = f"cachedContents/{uuid.uuid4().hex[:12]}"
+        with self.state.lock:
+            self.state.cached_contents[name] = system_prompt
+        self._send_json({'name': name, 'model': body.get('model'), 'ttl': body.get('ttl')})
+
+    def _gemini(self, body: dict, stream: bool):
+        cacheable = True
+        if body.get('cachedContent'):
+            with self.state.lock:
+                system_prompt = self.state.cached_contents.get(body['cachedContent'])
+            if system_prompt is None:
+                return self._send_json({'error': {'message': 'CachedContent not found'}}, status=404)
+        elif body.get('systemInstruction'):
+            system_prompt = ''.join(p.get('text', '') for p in body['systemInstruction'].get('parts', []))
+        else:
+            system_prompt, cacheable = '', False
+        user_message = ''.join(
+            p.get('text', '') for c in body.get('contents', []) for p in c.get('parts', [])
+        )
+        text = build_response_text(system_prompt or user_message, user_message)
+        cached, _ = self.state.cache_lookup(system_prompt) if cacheable else (0, 0)
+        usage = {
+            'promptTokenCount': estimate_tokens(system_prompt) + estimate_tokens(user_message),
+            'cachedContentTokenCount': cached,
+            'candidatesTokenCount': estimate_tokens(text)
+        }
+        if not stream:
+            return self._send_json({
+                'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}}],
+                'usageMetadata': usage
+            }, text=text)
+        chunks = self._chunks(text)
+        self._send_sse([
+            {
+                'candidates': [{'content': {'role': 'model', 'parts': [{'text': chunk}]}}],
+                'usageMetadata': usage if i == len(chunks) - 1 else {'promptTokenCount': usage['promptTokenCount']}
+            }
+            for i, chunk in enumerate(chunks)
+        ])
+
+
+def create_server(host: str = '127.0.0.1', port: int = 18080, **settings) -> ThreadingHTTPServer:
+    """서버마다 독립된 상태(MockState)를 가진 서버 생성 - server.state로 실행 중 설정 변경"""
+    state = MockState(**settings)
+    handler = type('MockHandler', (MockHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def start(host: str = '127.0.0.1', port: int = 18080, **settings) -> ThreadingHTTPServer:
+    """
+    백그라운드 스레드에서 서버 시작 (테스트/벤치마크 스크립트용)
+    settings: latency, jitter, token_rate, error_rate, error_status, seed (MockState 참고)
+    """
+    server = create_server(host, port, **settings)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock LLM server (OpenAI / Claude / Gemini wire formats)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=18080)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds before the first token")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random latency, 0..jitter seconds")
+    parser.add_argument('--token-rate', type=float, default=0.0, help="Output tokens per second (0: instant)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument('--error-status', type=int, default=500, help="HTTP status of injected errors (e.g. 429, 503)")
+    parser.add_argument('--seed', type=int, help="Random seed for jitter and error injection")
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, token_rate=args.token_rate,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    )
+    print(f"Mock LLM server listening on http://{args.host}:{args.port}/v1 ({json.dumps(server.state.snapshot())})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
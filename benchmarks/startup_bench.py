@@ -0,0 +1,162 @@
+"""
+Startup Benchmark - API 백엔드 콜드 스타트 측정
+- 프로세스 시작부터 /health 가 200을 반환할 때까지의 시간 (여러 번 실행 후 중앙값/최대값)
+- `python -X importtime` 으로 `import api` 의 모듈별 import 시간 프로파일 (누적 시간 상위 N개)
+- 시작 경로에서 import되면 안 되는 무거운 모듈(requests, openpyxl, Provider 모듈 등) 검사
+- 빈 HOME(임시 디렉토리)에서 실행하여 사용자 설정/히스토리의 영향을 받지 않음
+- --budget 초과 또는 지연 import 위반 시 종료 코드 1 (CI 확인용)
+
+사용법:
+    python benchmarks/startup_bench.py --runs 5
+    python benchmarks/startup_bench.py --exe dist/api/api      # PyInstaller 빌드 측정
+    python benchmarks/startup_bench.py --json startup.json --profile-out importtime.txt
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 첫 사용 시점까지 import를 미뤄야 하는 모듈
+DEFERRED_MODULES = (
+    'requests', 'httpx', 'openpyxl', 'waitress',
+    'modules.llm.openai', 'modules.llm.gemini', 'modules.llm.claude',
+    'pandas', 'numpy', 'plotly', 'streamlit',
+)
+
+
+def isolated_env(home: str) -> dict:
+    env = dict(os.environ)
+    env['HOME'] = home
+    env['USERPROFILE'] = home  # Windows: Path.home()
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    return env
+
+
+def measure_health(command, env, port: int, timeout: float = 30.0, interval: float = 0.01) -> float:
+    """프로세스 시작 → /health 200 까지의 시간(초)"""
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError, OSError):
+                pass
+            time.sleep(interval)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def import_profile(python: str, env: dict):
+    """-X importtime 결과 파싱 → (전체 목록, api 누적 시간(초))"""
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', 'import api'],
+        cwd=ROOT, env=env, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        entries.append({'module': name.strip(), 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)})
+    total = next((e['cumulative_us'] for e in entries if e['module'] == 'api'), 0) / 1e6
+    return result.stderr, entries, total
+
+
+def loaded_deferred_modules(python: str, env: dict):
+    code = (
+        "import sys, json, api; "
+        f"print(json.dumps(sorted(m for m in {list(DEFERRED_MODULES)!r} if m in sys.modules)))"
+    )
+    result = subprocess.run([python, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API backend cold start (time to /health)")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--port', type=int, default=18765)
+    parser.add_argument('--python', default=sys.executable)
+    parser.add_argument('--exe', help="Packaged backend executable (skips import profiling)")
+    parser.add_argument('--server', choices=('waitress', 'flask'), default='waitress')
+    parser.add_argument('--top', type=int, default=15, help="Number of slowest imports to show")
+    parser.add_argument('--budget', type=float, default=1.0, help="Fail if median time to /health exceeds this (seconds)")
+    parser.add_argument('--json', help="Write results to this JSON file")
+    parser.add_argument('--profile-out', help="Write the raw -X importtime output to this file")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix='codelia-startup-')
+    env = isolated_env(home)
+    if args.exe:
+        command = [args.exe, '--server', args.server, '--port', str(args.port)]
+    else:
+        command = [args.python, 'api.py', '--server', args.server, '--port', str(args.port)]
+
+    # 첫 실행은 DB 생성이 포함되므로 별도로 기록
+    first = measure_health(command, env, args.port)
+    timings = [measure_health(command, env, args.port) for _ in range(max(1, args.runs))]
+    results = {
+        'command': ' '.join(command),
+        'first_run': round(first, 3),
+        'runs': [round(t, 3) for t in timings],
+        'median': round(statistics.median(timings), 3),
+        'max': round(max(timings), 3),
+        'budget': args.budget,
+    }
+    print(f"time to /health: first {results['first_run']}s, median {results['median']}s, max {results['max']}s "
+          f"({len(timings)} runs)")
+
+    failures = []
+    if results['median'] > args.budget:
+        failures.append(f"median {results['median']}s exceeds budget {args.budget}s")
+
+    if not args.exe:
+        raw, entries, total = import_profile(args.python, env)
+        if args.profile_out:
+            Path(args.profile_out).write_text(raw, encoding='utf-8')
+        slowest = sorted(entries, key=lambda e: e['cumulative_us'], reverse=True)[:args.top]
+        results['import_api'] = round(total, 3)
+        results['slowest_imports'] = slowest
+        print(f"\nimport api: {total:.3f}s - slowest imports (cumulative):")
+        for entry in slowest:
+            print(f"  {entry['cumulative_us'] / 1000:8.1f} ms  {entry['module']}")
+
+        loaded = loaded_deferred_modules(args.python, env)
+        results['deferred_loaded'] = loaded
+        if loaded:
+            failures.append(f"imported at startup: {', '.join(loaded)}")
+        print(f"\ndeferred modules loaded at startup: {', '.join(loaded) or 'none'}")
+
+    results['ok'] = not failures
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,9 +10,13 @@ rm -rf build dist
 # --onedir: Create a directory with the executable (faster startup than --onefile)
 # --noconsole: Don't show a terminal window
 # --add-data: Include prompts directory
-pyinstaller --noconfirm --onedir --noconsole --clean \
+# --collect-submodules: modules 패키지는 지연 import되므로 하위 모듈을 명시적으로 포함
+# --noupx: 실행마다 압축 해제하지 않도록 (시작 시간 단축, api.spec과 동일)
+pyinstaller --noconfirm --onedir --noconsole --clean --noupx \
     --name api \
     --add-data "prompts:prompts" \
+    --collect-submodules modules \
+    --exclude-module pandas --exclude-module numpy --exclude-module plotly --exclude-module streamlit \
     api.py
 
 echo "Python build complete. Executable is in dist/api/api"
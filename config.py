@@ -22,6 +22,8 @@ else:
 # 프롬프트 파일 경로
 PROMPT_FILE = BASE_DIR / "prompts" / "Quality.md"
 SCORING_PROMPT_FILE = BASE_DIR / "prompts" / "scoring_criteria.md"
+PROMPT_RELOAD_CHECK_INTERVAL = 2.0  # 프롬프트 파일 변경(mtime) 확인 주기 (초)
+CONFIG_RELOAD_CHECK_INTERVAL = 1.0  # config.json 외부 수정(mtime/크기) 확인 주기 (초)
 
 # AI 모델 설정
 # AI 모델 기본값 
@@ -38,6 +40,70 @@ DEFAULT_CLAUDE_URL = ""
 
 DEFAULT_PROVIDER = "openai" 
 
+# 분석 파이프라인 설정
+# "concurrent": 원본 평가와 개선을 동시에 실행 / "sequential": 기존 순차 실행
+IMPROVE_PIPELINE_MODE = "concurrent"
+ANALYSIS_MAX_WORKERS = 4  # 분석 작업용 스레드 풀 크기 (동시 LLM 호출 상한)
+# 기본 평가 모드 - "full": 전체 루브릭 AI 채점 / "fast": 기계적 판정 규칙은 로컬 채점 후 나머지 규칙만 AI 채점
+#                 / "sharded": 카테고리별로 나누어 동시에 AI 채점
+EVALUATE_DEFAULT_MODE = "full"
+# "sharded" 모드: 카테고리별 동시 채점 스레드 수 / 실패한 카테고리 재시도 횟수
+EVALUATE_SHARD_WORKERS = 8
+EVALUATE_SHARD_RETRIES = 1
+# 평가 응답에서 누락/형식 오류 규칙만 축약 루브릭으로 한 번 재요청
+EVALUATE_RECOVER_MISSING = True
+BATCH_DEFAULT_CONCURRENCY = 4  # 일괄 평가 기본 동시 실행 수
+BATCH_MAX_CONCURRENCY = 16     # 일괄 평가 동시 실행 수 상한
+# 요구사항 문서 가져오기 (xlsx/csv/markdown) - 완료된 결과를 모아 히스토리에 저장하는 단위
+IMPORT_HISTORY_FLUSH_SIZE = 20       # 최대 건수
+IMPORT_HISTORY_FLUSH_SECONDS = 2.0   # 최대 대기 시간 (초)
+# 백그라운드 작업 큐 (/api/jobs)
+JOB_WORKERS = 2              # 동시에 실행하는 작업 수
+JOB_ITEM_CONCURRENCY = 4     # 작업 내 항목 동시 처리 수
+JOB_RESUME_ON_START = True   # 시작 시 완료되지 않은 작업 재개
+
+# API 서버 실행 설정
+# "waitress": 멀티스레드 WSGI 서버 (배포용) / "flask": Flask 개발 서버
+# (실행 시 --server 인자 또는 CODELIA_SERVER 환경 변수가 우선)
+SERVER_MODE = os.environ.get("CODELIA_SERVER", "waitress")
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = int(os.environ.get("CODELIA_PORT", 8000))
+SERVER_THREADS = 16              # 요청 처리 스레드 수 (스트리밍 응답은 완료까지 스레드 1개 점유)
+SERVER_BACKLOG = 1024            # 수락 대기 연결 수 (listen backlog)
+SERVER_CONNECTION_LIMIT = 200    # 동시 연결 상한
+SERVER_CHANNEL_TIMEOUT = 300     # 응답 없는 연결 종료 시간 (초) - 비스트리밍 개선 요청의 LLM 호출 시간보다 길게
+SERVER_CLEANUP_INTERVAL = 30     # 타임아웃 연결 정리 주기 (초)
+
+# HTTP 커넥션 풀 설정
+HTTP_POOL_SIZE = 10          # Provider별 keep-alive 커넥션 풀 크기
+PREWARM_CONNECTIONS = True   # 서버 시작 시 LLM 엔드포인트와 미리 연결
+ASYNC_HTTP_POOL_SIZE = 50    # asyncio 경로 공유 클라이언트의 최대 동시 연결 수
+
+# LLM 호출 재시도/서킷 브레이커 설정
+# (대체 Provider 순서는 config.json의 "fallback_providers": ["claude", "gemini"] 로 지정)
+RETRY_MAX_ATTEMPTS = 3          # Provider당 최대 시도 횟수 (429/5xx/타임아웃)
+RETRY_BASE_DELAY = 1.0          # 지수 백오프 기본 대기 시간 (초)
+RETRY_MAX_DELAY = 30.0          # 최대 대기 시간 (Retry-After 포함)
+CIRCUIT_FAILURE_THRESHOLD = 5   # 연속 실패 시 회로 차단
+CIRCUIT_RECOVERY_SECONDS = 60   # 차단 후 시험 호출까지 대기 시간
+
+# Provider별 호출 속도 제한 기본값 (None: 제한 없음)
+# config.json의 "rate_limits" 항목으로 Provider별 재정의 가능
+DEFAULT_RATE_LIMITS = {
+    "openai": {"rpm": None, "tpm": None},
+    "gemini": {"rpm": None, "tpm": None},
+    "claude": {"rpm": None, "tpm": None},
+}
+
+# LLM 응답 캐시 설정 (메모리 LRU + history.db의 llm_cache 테이블)
+LLM_CACHE_ENABLED = True
+LLM_CACHE_MEMORY_ENTRIES = 256
+LLM_CACHE_MEMORY_BYTES = 16 * 1024 * 1024
+LLM_CACHE_MAX_ENTRIES = 5000          # 디스크 계층 최대 항목 수
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7일
+LLM_CACHE_ACCESS_FLUSH_SIZE = 64      # 디스크 적중 시각(last_access)을 모아서 기록하는 단위
+LLM_CACHE_PURGE_BATCH_SIZE = 1000     # 만료 항목 삭제 시 한 번에 지우는 최대 행 수
+
 
 # 점수 관련 설정
 MAX_SCORE = 320  # 64개 규칙 × 5점
@@ -61,6 +127,20 @@ RULES_COUNT = {
     "R41-R42": 2     # 모듈성
 }
 
+# Provider 프롬프트 캐시용 요청 구성 (Claude cache_control, Gemini systemInstruction, OpenAI 고정 prefix)
+LLM_PROMPT_CACHING = True
+# Gemini 명시적 캐시(cachedContents) 유지 시간(초) - None이면 사용 안 함 (암시적 캐시만)
+GEMINI_CACHED_CONTENT_TTL = None
+
+# 히스토리 full_data 압축 방식 ("zlib" 또는 "zstd" - zstd는 zstandard 패키지 필요)
+HISTORY_BLOB_CODEC = "zlib"
+
+# SQLite 연결 설정 (history.db - WAL 모드, 스레드별 연결 재사용)
+SQLITE_CACHE_SIZE_KB = 16384  # 연결당 페이지 캐시 (KB)
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024  # 메모리 맵 읽기 크기 (bytes, 0이면 사용 안 함)
+SQLITE_BUSY_TIMEOUT_MS = 5000  # 잠금 대기 시간 (ms)
+SQLITE_CHECKPOINT_INTERVAL_SECONDS = 300  # 주기적 WAL checkpoint(PASSIVE) 간격 (초, 0이면 종료 시에만)
+
 # 프록시 필요한 경우 
 USE_PROXY = False
 PROXY_SETTINGS = {
@@ -0,0 +1,26 @@
+/**
+ * Analytics API - 히스토리 점수 통계(증분 집계) 조회 레이어
+ */
+export const analyticsApi = {
+    /**
+     * 전체 평균 점수 및 카테고리별 점수
+     */
+    async getSummary() {
+        const response = await fetch('http://localhost:8000/api/analytics/summary');
+        if (!response.ok) throw new Error('Failed to fetch analytics summary');
+        return await response.json();
+    },
+
+    /**
+     * 차원별 점수 추이
+     * @param {string} dimension - family | session | week | all
+     * @param {Object} options - limit, categories (false면 카테고리 점수 제외)
+     * @returns {Promise<{dimension: string, items: Array}>}
+     */
+    async get(dimension, { limit = 100, categories = true } = {}) {
+        const query = new URLSearchParams({ limit, categories: categories ? '1' : '0' });
+        const response = await fetch(`http://localhost:8000/api/analytics/${encodeURIComponent(dimension)}?${query}`);
+        if (!response.ok) throw new Error('Failed to fetch analytics');
+        return await response.json();
+    }
+};
@@ -3,7 +3,7 @@
  */
 export const historyApi = {
     /**
-     * 전체 히스토리 목록 조회
+     * 전체 히스토리 목록 조회 (이전 버전 호환, full_data 제외 - 화면 목록은 getPage 사용)
      */
     async getAll() {
         try {
@@ -16,6 +16,44 @@ export const historyApi = {
         }
     },
 
+    /**
+     * 히스토리 페이지 조회 (full_data 제외)
+     * @param {Object} params - limit, cursor, session_id, req_id_prefix, date_from, date_to, min_score, max_score
+     * @returns {Promise<{items: Array, next_cursor: string|null}>}
+     */
+    async getPage(params = {}) {
+        const query = new URLSearchParams(
+            Object.entries(params).filter(([, value]) => value !== undefined && value !== null && value !== '')
+        );
+        const response = await fetch(`http://localhost:8000/api/history/page?${query}`);
+        if (!response.ok) throw new Error('Failed to fetch history page');
+        return await response.json();
+    },
+
+    /**
+     * 히스토리 상세 조회 (full_data 포함)
+     */
+    async getItem(id) {
+        const response = await fetch(`http://localhost:8000/api/history/${id}`);
+        if (!response.ok) throw new Error('Failed to fetch history item');
+        return await response.json();
+    },
+
+    /**
+     * 히스토리 전문 검색 (bm25 순위, <mark> 스니펫 포함)
+     * @param {Object} params - limit, offset 및 getPage와 같은 필터 (req_id_prefix, min_score 등)
+     * @returns {Promise<{items: Array, mode: string, has_more: boolean}>}
+     */
+    async search(q, { limit = 20, offset = 0, ...filters } = {}) {
+        const query = new URLSearchParams(
+            Object.entries({ q, limit, offset, ...filters })
+                .filter(([, value]) => value !== undefined && value !== null && value !== '')
+        );
+        const response = await fetch(`http://localhost:8000/api/history/search?${query}`);
+        if (!response.ok) throw new Error('Failed to search history');
+        return await response.json();
+    },
+
     /**
      * 히스토리 저장 
      */
@@ -0,0 +1,56 @@
+/**
+ * Jobs API - 백그라운드 평가/개선 작업 등록 및 진행률 조회 레이어
+ * (렌더러를 새로고침해도 job_id로 이어서 조회 가능)
+ */
+const JOBS_URL = 'http://localhost:8000/api/jobs';
+
+export const jobsApi = {
+    /**
+     * 작업 등록
+     * @param {string} kind - 'evaluate' | 'improve'
+     * @param {string[]} texts - 요구사항 목록
+     * @param {Object} options - mode, pipeline, pattern_data, use_cache, concurrency
+     * @returns {Promise<Object>} - 등록된 작업 상태 (id 포함)
+     */
+    async submit(kind, texts, options = {}) {
+        const response = await fetch(JOBS_URL, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ kind, texts, ...options })
+        });
+        const data = await response.json();
+        if (!response.ok) throw new Error(data.error || 'Failed to submit job');
+        return data;
+    },
+
+    async status(jobId) {
+        const response = await fetch(`${JOBS_URL}/${jobId}`);
+        if (!response.ok) throw new Error('Failed to fetch job status');
+        return await response.json();
+    },
+
+    async result(jobId, { offset = 0, limit = 100 } = {}) {
+        const response = await fetch(`${JOBS_URL}/${jobId}/result?offset=${offset}&limit=${limit}`);
+        if (!response.ok) throw new Error('Failed to fetch job result');
+        return await response.json();
+    },
+
+    async cancel(jobId) {
+        const response = await fetch(`${JOBS_URL}/${jobId}/cancel`, { method: 'POST' });
+        if (!response.ok) throw new Error('Failed to cancel job');
+        return await response.json();
+    },
+
+    /**
+     * 완료될 때까지 상태를 폴링
+     * @param {Function} onProgress - 상태 조회마다 호출
+     */
+    async wait(jobId, onProgress = () => {}, interval = 1000) {
+        while (true) {
+            const job = await this.status(jobId);
+            onProgress(job);
+            if (!['queued', 'running'].includes(job.status)) return job;
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+    }
+};
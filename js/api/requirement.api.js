@@ -29,6 +29,46 @@ export class RequirementApi extends BaseApi {
     async evaluate(text) {
         return this.post('/evaluate', { text });
     }
+
+    /**
+     * Imports a requirement document (xlsx/csv/markdown) and streams per-row results.
+     * @param {File} file - The uploaded document.
+     * @param {Object} options - action, id_column, text_column, sheet, id_prefix, concurrency, mode, pipeline, save.
+     * @param {Function} onItem - Called with each parsed NDJSON line (the last one has done: true).
+     * @returns {Promise<Object>} - The final summary line.
+     */
+    async importDocument(file, options = {}, onItem = () => {}) {
+        const form = new FormData();
+        form.append('file', file);
+        Object.entries(options)
+            .filter(([, value]) => value !== undefined && value !== null && value !== '')
+            .forEach(([key, value]) => form.append(key, typeof value === 'object' ? JSON.stringify(value) : value));
+
+        const response = await fetch(`${this.baseUrl}/requirements/import`, { method: 'POST', body: form });
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({}));
+            throw new Error(errorData.error || `Import failed: ${response.status}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let summary = null;
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            for (const line of lines) {
+                if (!line.trim()) continue;
+                const item = JSON.parse(line);
+                if (item.done) summary = item;
+                onItem(item);
+            }
+        }
+        return summary;
+    }
 }
 
 export const requirementApi = new RequirementApi();
@@ -1,16 +1,29 @@
 import { historyApi } from '../api/history.api.js';
 
+const PAGE_SIZE = 50;            // 한 번에 불러오는 목록 수
+const SEARCH_DEBOUNCE_MS = 300;  // 입력이 멈춘 뒤 검색 요청
+const SCROLL_THRESHOLD_PX = 120; // 목록 끝에서 이 거리 안으로 들어오면 다음 페이지 요청
+
 /**
  * History Panel Component
  * - SQLite 백엔드 연동
  * - localStorage 데이터 자동 마이그레이션
  * - 개별 요구사항 번호 유지 및 정렬
+ * - 첫 페이지만 불러오고 스크롤 시 next_cursor로 다음 페이지 요청 (전체 목록을 한 번에 받지 않음)
+ * - 검색은 /api/history/search, ID 접두어/점수 필터는 페이지/검색 요청 조건으로 서버에서 처리
  */
 export class HistoryPanel {
     constructor(container) {
         this.container = container;
         this.history = [];
         this.isCollapsed = false;
+        this.query = '';
+        this.filters = { req_id_prefix: '', min_score: '' };
+        this.nextCursor = null;
+        this.hasMore = false;
+        this.isLoading = false;
+        this.loadToken = 0;  // 검색어/필터 변경 시 이전 요청 결과 무시
+        this.searchTimer = null;
         this.init();
     }
 
@@ -34,6 +47,15 @@ export class HistoryPanel {
       </div>
       <div class="history-search">
         <input type="text" placeholder="요구사항 검색..." id="historySearch">
+        <div class="history-filters">
+          <input type="text" placeholder="ID 접두어 (예: REQ)" id="historyIdFilter">
+          <select id="historyScoreFilter" aria-label="최소 개선 점수">
+            <option value="">전체 점수</option>
+            <option value="50">50% 이상</option>
+            <option value="70">70% 이상</option>
+            <option value="90">90% 이상</option>
+          </select>
+        </div>
       </div>
       <div class="history-list" id="historyList">
         <!-- updateList()에 의해 채워짐 -->
@@ -43,18 +65,26 @@ export class HistoryPanel {
 
     renderHistoryList() {
         if (!this.history || this.history.length === 0) {
+            const message = this.isLoading
+                ? '불러오는 중...'
+                : (this.isFiltered() ? '조건에 맞는 요구사항이 없습니다.' : '아직 분석된 요구사항이 없습니다.');
             return `
         <div class="history-empty">
           <div class="history-empty-icon">📝</div>
-          <p>아직 분석된 요구사항이 없습니다.</p>
+          <p>${message}</p>
           <small style="font-size: 10px; color: var(--text-tertiary); display: block; margin-top: 5px;">
-            
+
           </small>
         </div>
       `;
         }
 
-        return this.history.map((item, index) => {
+        return this.renderCards(this.history, 0);
+    }
+
+    renderCards(items, startIndex) {
+        return items.map((item, offset) => {
+            const index = startIndex + offset;
             try {
                 if (!item) return '';
 
@@ -69,7 +99,9 @@ export class HistoryPanel {
                 const scoreDiff = (item.improved_score || 0) - (item.original_score || 0);
                 const scoreDiffText = scoreDiff >= 0 ? `+${scoreDiff}` : scoreDiff;
 
-                const improvedDisplay = (item.improved_text || '').split(/\n###|###/)[0].trim();
+                // 검색 결과는 서버에서 이스케이프 후 <mark>로 표시한 스니펫 사용
+                const improvedDisplay = item.improved_snippet || (item.improved_text || '').split(/\n###|###/)[0].trim();
+                const originalDisplay = item.original_snippet || item.original_text || '';
 
                 return `
           <div class="history-card" data-index="${index}" data-id="${item.id}">
@@ -82,7 +114,7 @@ export class HistoryPanel {
                     <span class="snippet-label">개선:</span> ${improvedDisplay}
                 </div>
                 <div class="history-snippet original" title="클릭하여 전체 보기">
-                    <span class="snippet-label">원본:</span> ${item.original_text || ''}
+                    <span class="snippet-label">원본:</span> ${originalDisplay}
                 </div>
             </div>
             <div class="history-card-score">
@@ -113,30 +145,59 @@ export class HistoryPanel {
         const searchInput = this.container.querySelector('#historySearch');
         if (searchInput) {
             searchInput.addEventListener('input', (e) => {
-                this.filterHistory(e.target.value);
+                this.query = e.target.value.trim();
+                this.scheduleReload();
             });
         }
-        this.attachCardListeners();
-    }
 
-    attachCardListeners() {
-        const listContainer = this.container.querySelector('#historyList');
-        if (!listContainer) return;
+        const idFilter = this.container.querySelector('#historyIdFilter');
+        if (idFilter) {
+            idFilter.addEventListener('input', (e) => {
+                this.filters.req_id_prefix = e.target.value.trim();
+                this.scheduleReload();
+            });
+        }
 
-        listContainer.querySelectorAll('.history-card').forEach(card => {
-            card.addEventListener('click', (e) => {
-                if (e.target.closest('.original')) return;
-                const index = parseInt(card.getAttribute('data-index'));
-                this.loadHistoryItem(index);
+        const scoreFilter = this.container.querySelector('#historyScoreFilter');
+        if (scoreFilter) {
+            scoreFilter.addEventListener('change', (e) => {
+                this.filters.min_score = e.target.value;
+                clearTimeout(this.searchTimer);
+                this.loadHistory();
             });
-        });
+        }
 
-        listContainer.querySelectorAll('.history-snippet.original').forEach(snippet => {
-            snippet.addEventListener('click', (e) => {
-                e.stopPropagation();
-                snippet.classList.toggle('expanded');
+        const listContainer = this.container.querySelector('#historyList');
+        if (listContainer) {
+            // 카드가 페이지 단위로 추가되므로 목록 컨테이너에서 한 번만 처리 (이벤트 위임)
+            listContainer.addEventListener('click', (e) => {
+                const snippet = e.target.closest('.history-snippet.original');
+                if (snippet) {
+                    snippet.classList.toggle('expanded');
+                    return;
+                }
+                const card = e.target.closest('.history-card');
+                if (card) {
+                    this.loadHistoryItem(parseInt(card.getAttribute('data-index')));
+                }
+            });
+            listContainer.addEventListener('scroll', () => {
+                if (this.isNearBottom(listContainer)) this.loadMore();
             });
-        });
+        }
+    }
+
+    scheduleReload() {
+        clearTimeout(this.searchTimer);
+        this.searchTimer = setTimeout(() => this.loadHistory(), SEARCH_DEBOUNCE_MS);
+    }
+
+    isFiltered() {
+        return Boolean(this.query || this.filters.req_id_prefix || this.filters.min_score);
+    }
+
+    isNearBottom(listContainer) {
+        return listContainer.scrollTop + listContainer.clientHeight >= listContainer.scrollHeight - SCROLL_THRESHOLD_PX;
     }
 
     async addHistoryItem(original, improved, originalScore, improvedScore, parentId = '', fullData = null) {
@@ -164,16 +225,34 @@ export class HistoryPanel {
             const listContainer = this.container.querySelector('#historyList');
             if (listContainer) {
                 listContainer.innerHTML = this.renderHistoryList();
-                this.attachCardListeners();
             }
         } catch (error) {
             console.error('Error updating history list:', error);
         }
     }
 
-    loadHistoryItem(index) {
+    appendToList(items, startIndex) {
+        const listContainer = this.container.querySelector('#historyList');
+        if (!listContainer || items.length === 0) return;
+        if (startIndex === 0) {
+            this.updateList();
+        } else {
+            listContainer.insertAdjacentHTML('beforeend', this.renderCards(items, startIndex));
+        }
+    }
+
+    async loadHistoryItem(index) {
         const item = this.history[index];
         if (item && window.loadHistoryResult) {
+            // 목록에는 full_data가 없으므로 선택 시 상세 조회
+            if (item.full_data === undefined && item.id !== undefined) {
+                try {
+                    const detail = await historyApi.getItem(item.id);
+                    item.full_data = detail.full_data;
+                } catch (error) {
+                    console.error('Failed to load history detail:', error);
+                }
+            }
             const mappedItem = {
                 original: item.original_text,
                 improved: item.improved_text,
@@ -184,41 +263,90 @@ export class HistoryPanel {
         }
     }
 
-    filterHistory(searchTerm) {
-        const cards = this.container.querySelectorAll('.history-card');
-        const term = searchTerm.toLowerCase();
-        cards.forEach(card => {
-            const text = card.textContent.toLowerCase();
-            card.style.display = text.includes(term) ? 'block' : 'none';
-        });
+    /**
+     * 다음 페이지 요청 (검색어가 있으면 검색 API, 없으면 커서 페이지 API)
+     * @returns {Promise<Array>} - 새로 받은 항목
+     */
+    async fetchNextPage() {
+        if (this.query) {
+            const result = await historyApi.search(this.query, {
+                limit: PAGE_SIZE, offset: this.history.length, ...this.filters
+            });
+            this.hasMore = result.has_more;
+            return result.items;
+        }
+        const page = await historyApi.getPage({ limit: PAGE_SIZE, cursor: this.nextCursor, ...this.filters });
+        this.nextCursor = page.next_cursor;
+        this.hasMore = Boolean(page.next_cursor);
+        return page.items;
     }
 
-    async loadHistory() {
+    async loadMore() {
+        if (this.isLoading || !this.hasMore) return;
+        const token = this.loadToken;
+        this.isLoading = true;
         try {
+            const items = await this.fetchNextPage();
+            if (token !== this.loadToken) return;
+            const startIndex = this.history.length;
+            this.history.push(...items);
+            this.appendToList(items, startIndex);
+        } catch (e) {
+            console.error('Failed to load more history:', e);
+            this.hasMore = false;
+        } finally {
+            if (token === this.loadToken) {
+                this.isLoading = false;
+                this.fillViewport();
+            }
+        }
+    }
 
-            const dbHistory = await historyApi.getAll();
-
-            if (dbHistory && Array.isArray(dbHistory) && dbHistory.length > 0) {
-                this.history = dbHistory;
-            } else {
+    fillViewport() {
+        // 목록이 화면보다 짧으면 스크롤이 생기지 않으므로 바로 다음 페이지 요청
+        const listContainer = this.container.querySelector('#historyList');
+        if (listContainer && this.hasMore && this.isNearBottom(listContainer)) {
+            this.loadMore();
+        }
+    }
 
-                await this.migrateFromLocalStorage();
+    async loadHistory() {
+        // 첫 페이지부터 다시 조회 (진행 중인 이전 조회 결과는 버림)
+        const token = ++this.loadToken;
+        this.history = [];
+        this.nextCursor = null;
+        this.hasMore = true;
+        this.isLoading = true;
+        try {
+            let items = await this.fetchNextPage();
+            if (items.length === 0 && !this.isFiltered() && await this.migrateFromLocalStorage()) {
+                items = await this.fetchNextPage();
             }
+            if (token !== this.loadToken) return;
+            this.history = items;
         } catch (e) {
             console.error('Failed to load history from DB:', e);
-
+            if (token === this.loadToken) this.hasMore = false;
         } finally {
-            this.updateList();
+            if (token === this.loadToken) {
+                this.isLoading = false;
+                this.updateList();
+                this.fillViewport();
+            }
         }
     }
 
+    /**
+     * localStorage의 이전 히스토리를 SQLite로 이동
+     * @returns {Promise<boolean>} - 이동한 항목이 있으면 true
+     */
     async migrateFromLocalStorage() {
         const saved = localStorage.getItem('requirementHistory');
-        if (!saved) return;
+        if (!saved) return false;
 
         try {
             const rawHistory = JSON.parse(saved);
-            if (!Array.isArray(rawHistory) || rawHistory.length === 0) return;
+            if (!Array.isArray(rawHistory) || rawHistory.length === 0) return false;
 
             console.log(`Migrating ${rawHistory.length} legacy items to SQLite...`);
 
@@ -239,12 +367,10 @@ export class HistoryPanel {
             }
 
             localStorage.removeItem('requirementHistory');
-            const dbHistory = await historyApi.getAll();
-            if (dbHistory && Array.isArray(dbHistory)) {
-                this.history = dbHistory;
-            }
+            return true;
         } catch (error) {
             console.error('Migration crashed:', error);
+            return false;
         }
     }
 }
@@ -1,6 +1,7 @@
 const { app, BrowserWindow } = require('electron');
 const path = require('path');
 const { spawn } = require('child_process');
+const http = require('http');
 const waitOn = require('wait-on');
 
 let mainWindow;
@@ -61,31 +62,30 @@ function startPythonServer() {
     });
 }
 
+// 백엔드 준비 상태 확인 주소 (api.py의 /health - 서비스 초기화가 끝나면 200)
+const HEALTH_URL = 'http-get://127.0.0.1:8000/health';
+
 app.on('ready', () => {
     console.log('Electron app ready, starting Python server...');
     startPythonServer();
 
-
-    setTimeout(() => {
-        console.log('Waiting for Flask server at http://localhost:8000/api/config...');
-
-
-        waitOn({
-            resources: ['http://localhost:8000/api/config'],
-            timeout: 5000, // 대기시간
-            interval: 1000, //업데이트 주기 
-            verbose: true
+    console.log('Waiting for Python server at http://127.0.0.1:8000/health...');
+    waitOn({
+        resources: [HEALTH_URL],
+        timeout: 30000, // 최대 대기시간 (PyInstaller 첫 실행 압축 해제 포함)
+        interval: 200,  // 폴링 주기
+        window: 0,
+        verbose: false
+    })
+        .then(() => {
+            console.log('✓ Python server is ready!');
+            createWindow();
         })
-            .then(() => {
-                console.log('✓ Flask server is ready!');
-                createWindow();
-            })
-            .catch((err) => {
-                console.error('✗ Error waiting for Python server:', err.message);
-                console.log('Creating window anyway...');
-                createWindow();
-            });
-    }, 2000);
+        .catch((err) => {
+            console.error('✗ Error waiting for Python server:', err.message);
+            console.log('Creating window anyway...');
+            createWindow();
+        });
 });
 
 app.on('window-all-closed', function () {
@@ -100,8 +100,34 @@ app.on('activate', function () {
     }
 });
 
-app.on('will-quit', () => {
-    if (pythonProcess) {
-        pythonProcess.kill();
+// 종료 전 백엔드 정리 요청 (api.py의 /shutdown - 작업 정리 및 WAL checkpoint)
+// Windows의 kill()은 시그널 없이 즉시 종료되어 백엔드 종료 처리가 실행되지 않음
+const SHUTDOWN_TIMEOUT_MS = 3000;
+let backendStopped = false;
+
+function requestBackendShutdown() {
+    return new Promise((resolve) => {
+        const req = http.request(
+            { host: '127.0.0.1', port: 8000, path: '/shutdown', method: 'POST', timeout: SHUTDOWN_TIMEOUT_MS },
+            (res) => {
+                res.resume();
+                res.on('end', resolve);
+            }
+        );
+        req.on('timeout', () => req.destroy());
+        req.on('error', resolve);
+        req.end();
+    });
+}
+
+app.on('will-quit', (event) => {
+    if (!pythonProcess || backendStopped) {
+        return;
     }
+    event.preventDefault();
+    requestBackendShutdown().then(() => {
+        backendStopped = true;
+        pythonProcess.kill();
+        app.quit();
+    });
 });
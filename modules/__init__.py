@@ -1,3 +1,21 @@
-from .ai_client import AIClient
-from .improver import RequirementImprover
-from .evaluator import RequirementEvaluator
\ No newline at end of file
+"""
+분석 모듈 패키지 - 공개 이름은 처음 접근할 때 해당 모듈을 import (PEP 562)
+"""
+import importlib
+
+_EXPORTS = {
+    'AIClient': '.ai_client',
+    'RequirementImprover': '.improver',
+    'RequirementEvaluator': '.evaluator',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,22 +3,26 @@ AI Client - AI 제공자 통합 인터페이스
 - OpenAI, Gemini, Claude 등 다양한 AI 제공자를 통합 관리
 - LLM Factory 패턴으로 Provider별 구현체 생성
 - 프롬프트 파일 로드 및 AI 호출 추상화
+- 응답 캐시(ResponseCache) 연동 및 요청 단위 캐시 우회 지원
+- 대체 Provider가 응답한 경우 캐시에 저장하지 않음 (캐시 키는 주 Provider 기준)
 """
+import asyncio
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 import json
 from .llm import LLMFactory
 
 class AIClient:
     
-    def __init__(self, provider: str, api_key: str, model_name: str = None, base_url: str = None):
+    def __init__(self, provider: str, api_key: str, model_name: str = None, base_url: str = None, llm=None, cache=None):
         self.provider = provider.lower()
         self.api_key = api_key
         self.base_url = base_url
         self.model_name = model_name
+        self.cache = cache
         
-        # Initialize the specific provider using the factory
-        self.llm = LLMFactory.create_provider(
+        # Initialize the specific provider using the factory (or reuse a registered one)
+        self.llm = llm if llm is not None else LLMFactory.create_provider(
             provider=self.provider,
             api_key=self.api_key,
             base_url=self.base_url,
@@ -35,6 +39,77 @@ class AIClient:
         with open(file_path, 'r', encoding='utf-8') as f:
             return f.read()
     
-    def call_api(self, system_prompt: str, user_message: str) -> str:
-        """통합 API 호출 메서드"""
-        return self.llm.generate(system_prompt, user_message)
\ No newline at end of file
+    def cache_key(self, system_prompt: str, user_message: str) -> str:
+        return self.cache.make_key(
+            self.provider,
+            getattr(self.llm, 'model', self.model_name),
+            getattr(self.llm, 'temperature', None),
+            system_prompt,
+            user_message
+        )
+
+    def _cacheable(self) -> bool:
+        """마지막 호출 응답을 캐시해도 되는지 (주 Provider가 응답한 경우만)"""
+        served_by_fallback = getattr(self.llm, 'served_by_fallback', None)
+        return served_by_fallback is None or not served_by_fallback()
+
+    def call_api(self, system_prompt: str, user_message: str, use_cache: bool = True) -> str:
+        """통합 API 호출 메서드 (캐시 적중 시 LLM 호출 생략)"""
+        if self.cache is None:
+            return self.llm.generate(system_prompt, user_message)
+        if not use_cache:
+            self.cache.record_bypass()
+            return self.llm.generate(system_prompt, user_message)
+
+        key = self.cache_key(system_prompt, user_message)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.llm.generate(system_prompt, user_message)
+        if self._cacheable():
+            self.cache.set(key, response)
+        return response
+
+    async def acall_api(self, system_prompt: str, user_message: str, use_cache: bool = True) -> str:
+        """비동기 API 호출 - 이벤트 루프 스레드를 점유하지 않음 (캐시 조회/저장은 스레드에서 실행)"""
+        if self.cache is None:
+            return await self.llm.agenerate(system_prompt, user_message)
+        if not use_cache:
+            self.cache.record_bypass()
+            return await self.llm.agenerate(system_prompt, user_message)
+
+        key = self.cache_key(system_prompt, user_message)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return cached
+
+        response = await self.llm.agenerate(system_prompt, user_message)
+        if self._cacheable():
+            await asyncio.to_thread(self.cache.set, key, response)
+        return response
+
+    def stream_api(self, system_prompt: str, user_message: str, use_cache: bool = True) -> Iterator[str]:
+        """스트리밍 API 호출 - 텍스트 조각을 생성되는 대로 반환 (완료 후 캐시에 저장)"""
+        key = None
+        if self.cache is not None:
+            if not use_cache:
+                self.cache.record_bypass()
+            else:
+                key = self.cache_key(system_prompt, user_message)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    yield cached
+                    return
+
+        chunks = []
+        for chunk in self.llm.stream(system_prompt, user_message):
+            chunks.append(chunk)
+            yield chunk
+        if key is not None and self._cacheable():
+            self.cache.set(key, ''.join(chunks))
+
+    def discard_cached(self, system_prompt: str, user_message: str):
+        """파싱 불가 등 재사용하면 안 되는 응답을 캐시에서 제거"""
+        if self.cache is not None:
+            self.cache.discard(self.cache_key(system_prompt, user_message))
\ No newline at end of file
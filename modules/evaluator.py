@@ -3,18 +3,145 @@ Requirement Evaluator - 요구사항 품질 평가
 - INCOSE 기준 64개 규칙(P1-P7, C1-C15, R1-R42)으로 요구사항 평가
 - AI에게 scoring_criteria.md 프롬프트를 전달하여 점수 산출
 - 원본과 개선본의 점수 비교 및 분석
+- fast 모드: 기계적 판정 규칙은 LocalRuleEngine으로 즉시 채점하고 나머지 규칙만 축약 루브릭으로 AI 채점
+  (AI 미설정/실패 시 로컬 채점 결과만 반환)
+- sharded 모드: 카테고리별 축약 루브릭으로 나누어 동시에 AI 채점 후 병합 (실패한 카테고리만 재시도)
+- 잘리거나 일부 깨진 JSON 응답에서도 정상 규칙 항목은 복구하고, 누락/형식 오류 규칙만 재요청하여 병합
+  (결과의 completeness: 규칙별 complete / recovered / local / missing)
 """
-from typing import Dict, List
+import asyncio
+import functools
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Iterator, Tuple
 from .ai_client import AIClient
+from .rule_engine import LocalRuleEngine
+
+EVALUATE_MODES = ('full', 'fast', 'sharded')
+
+_RULE_HEADER = re.compile(r"^\*\*([PCR]\d+) - ")
+_RULE_KEY = re.compile(r'"([PCR]\d+)"\s*:\s*')
+_DECODER = json.JSONDecoder()
+
+
+def salvage_rule_entries(response: str) -> Dict:
+    """잘리거나 일부 깨진 JSON 응답에서 완전한 형태의 규칙 항목만 추출"""
+    entries = {}
+    response = response or ''
+    pos = 0
+    while True:
+        match = _RULE_KEY.search(response, pos)
+        if match is None:
+            return entries
+        try:
+            value, pos = _DECODER.raw_decode(response, match.end())
+        except ValueError:
+            pos = match.end()  # 잘린 항목
+            continue
+        entries[match.group(1)] = value
+
+
+def _normalize_entry(value):
+    """규칙 항목을 {'score': 0~5 정수, 'reason', ...} 형태로 정규화 (형식 오류 시 None)"""
+    if isinstance(value, dict):
+        entry = dict(value)
+        score = entry.get('score')
+    else:
+        entry = {'reason': ''}
+        score = value
+    if isinstance(score, bool):
+        return None
+    try:
+        score = int(float(score))
+    except (TypeError, ValueError):
+        return None
+    if not 0 <= score <= 5:
+        return None
+    entry['score'] = score
+    entry.setdefault('reason', '')
+    return entry
+
+
+@functools.lru_cache(maxsize=64)
+def build_rubric_subset(scoring_prompt: str, rules: Tuple[str, ...]) -> str:
+    """
+    scoring_criteria.md에서 지정한 규칙의 채점 기준만 남긴 축약 루브릭 생성
+    (Role/Scoring Scale/Output Format은 유지, 채점 대상 규칙 목록 지시로 교체)
+    """
+    instruction = f"- Score ONLY these {len(rules)} rules: {', '.join(rules)}"
+    start = scoring_prompt.find('## Scoring Criteria by Rule')
+    end = scoring_prompt.find('## Output Format')
+    if start < 0 or end < start:
+        # 형식을 알 수 없는 프롬프트는 지시만 추가
+        return scoring_prompt + "\n\n" + instruction
+
+    wanted = set(rules)
+    body = []
+    section = None  # 아직 출력하지 않은 '### ' 제목
+    keep = False
+    for line in scoring_prompt[start:end].splitlines():
+        header = _RULE_HEADER.match(line)
+        if line.startswith('### '):
+            section, keep = line, False
+        elif header:
+            keep = header.group(1) in wanted
+            if keep and section:
+                body += [section, '']
+                section = None
+            if keep:
+                body.append(line)
+        elif not line.strip():
+            if keep:
+                body.append(line)
+            keep = False
+        elif keep:
+            body.append(line)
+
+    footer = '\n'.join(
+        instruction if 'Score ALL' in line else line
+        for line in scoring_prompt[end:].splitlines()
+    )
+    return scoring_prompt[:start] + '\n'.join(['## Scoring Criteria by Rule', ''] + body) + '\n---\n\n' + footer
 
 
 class RequirementEvaluator:
     
+    # 카테고리 정의 (카테고리 점수 계산 및 sharded 모드의 분할 단위)
+    CATEGORIES = {
+        "패턴 규칙 (P1-P7)": ["P1", "P2", "P3", "P4", "P5", "P6", "P7"],
+        "개별 특성 (C1-C9)": ["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8", "C9"],
+        "집합 특성 (C10-C15)": ["C10", "C11", "C12", "C13", "C14", "C15"],
+        "Accuracy (정확성)": ["R1", "R2", "R3", "R4", "R5", "R6", "R7", "R8", "R9"],
+        "Concision (간결성)": ["R10", "R11"],
+        "Non-Ambiguity (비모호성)": ["R12", "R13", "R14", "R15", "R16", "R17"],
+        "Singularity (단일성)": ["R18", "R19", "R20", "R21", "R22", "R23"],
+        "Completeness (완전성)": ["R24", "R25"],
+        "Realism (현실성)": ["R26"],
+        "Conditions (조건 표현)": ["R27", "R28"],
+        "Uniqueness (고유성)": ["R29", "R30"],
+        "Abstraction (추상화 수준)": ["R31"],
+        "Quantification (정량화 - R32)": ["R32"],
+        "Tolerance (허용오차)": ["R33"],
+        "Quantification (정량화 - R34-35)": ["R34", "R35"],
+        "Uniformity of Language (언어 일관성)": ["R36", "R37", "R38", "R39", "R40"],
+        "Modularity (모듈성)": ["R41", "R42"]
+    }
     
-    def __init__(self, ai_client: AIClient, scoring_prompt: str):
+    def __init__(self, ai_client: AIClient, scoring_prompt: str, rule_engine: LocalRuleEngine = None,
+                 shard_executor: ThreadPoolExecutor = None, shard_retries: int = 1, recover_missing: bool = True):
 
+        # ai_client가 None이면 fast 모드의 로컬 채점만 가능 (오프라인)
         self.ai_client = ai_client
         self.scoring_prompt = scoring_prompt
+        self.rule_engine = rule_engine or LocalRuleEngine()
+        # sharded 모드용 (없으면 호출마다 임시 스레드 풀 사용)
+        self.shard_executor = shard_executor
+        self.shard_retries = shard_retries
+        # 누락/형식 오류 규칙 재요청 여부
+        self.recover_missing = recover_missing
+        # 루브릭의 채점 대상 규칙 전체 (카테고리 순서)
+        self.rubric_rules = [rule for rules in self.CATEGORIES.values() for rule in rules]
         
         # 규칙 목록 
         self.all_rules = [
@@ -41,29 +168,333 @@ class RequirementEvaluator:
             "R41", "R42"
         ]
     
-    def evaluate(self, text: str) -> Dict:
+    def evaluate(self, text: str, use_cache: bool = True, mode: str = 'full') -> Dict:
+        if mode == 'fast':
+            return self._evaluate_fast(text, use_cache)
+        if mode == 'sharded':
+            return self._evaluate_sharded(text, use_cache)
+        try:
+            user_message = self._build_user_message(text)
+            response = self.ai_client.call_api(self.scoring_prompt, user_message, use_cache=use_cache)
+            scores = self._parse_scores(response, self.scoring_prompt, user_message)
+            scores, recovered = self._recover_missing(scores, self.rubric_rules, user_message, use_cache)
+            return self._with_completeness(self._process_scores(scores), recovered)
+        except Exception as e:
+            print(f"Evaluation failed: {e}")
+            return self._get_default_scores(str(e))
+
+    async def aevaluate(self, text: str, use_cache: bool = True, mode: str = 'full') -> Dict:
+        """evaluate의 비동기 버전"""
+        if mode == 'fast':
+            return await self._aevaluate_fast(text, use_cache)
+        if mode == 'sharded':
+            return await self._aevaluate_sharded(text, use_cache)
+        try:
+            user_message = self._build_user_message(text)
+            response = await self.ai_client.acall_api(self.scoring_prompt, user_message, use_cache=use_cache)
+            scores = self._parse_scores(response, self.scoring_prompt, user_message)
+            scores, recovered = await self._arecover_missing(scores, self.rubric_rules, user_message, use_cache)
+            return self._with_completeness(self._process_scores(scores), recovered)
+        except Exception as e:
+            print(f"Evaluation failed: {e}")
+            return self._get_default_scores(str(e))
+
+    def evaluate_stream(self, text: str, use_cache: bool = True, mode: str = 'full') -> Iterator[Tuple[str, object]]:
+        """
+        스트리밍 평가 - ('token', 텍스트 조각)을 생성되는 대로 반환하고
+        마지막에 ('scored', 평가 결과)를 반환
+        (fast 모드는 먼저 ('local', 로컬 채점 결과)를 반환,
+         sharded 모드는 토큰 대신 카테고리 완료 시마다 ('shard', {'category', 'scores' | 'error'})를 반환)
+        """
+        if mode == 'sharded':
+            yield from self._evaluate_sharded_stream(text, use_cache)
+            return
+
+        local = None
+        system_prompt = self.scoring_prompt
+        rules = self.rubric_rules
+        if mode == 'fast':
+            local = self.rule_engine.evaluate(text)
+            yield 'local', self._local_result(local)
+            if self.ai_client is None:
+                yield 'scored', self._local_result(local, "LLM provider not configured")
+                return
+            rules = self._remaining_rules(local)
+            system_prompt = build_rubric_subset(self.scoring_prompt, tuple(rules))
+
+        user_message = self._build_user_message(text)
+        chunks = []
+        try:
+            for chunk in self.ai_client.stream_api(system_prompt, user_message, use_cache=use_cache):
+                chunks.append(chunk)
+                yield 'token', chunk
+            scores = self._parse_scores(''.join(chunks), system_prompt, user_message)
+            scores, recovered = self._recover_missing(scores, rules, user_message, use_cache)
+            if local is None:
+                scores = self._with_completeness(self._process_scores(scores), recovered)
+            else:
+                scores = self._merge_local(local, scores, recovered)
+        except Exception as e:
+            print(f"Evaluation failed: {e}")
+            scores = self._get_default_scores(str(e)) if local is None else self._local_result(local, str(e))
+        yield 'scored', scores
+
+    # --- fast 모드 (로컬 사전 채점 + 나머지 규칙만 AI 채점) ---
+
+    def _remaining_rules(self, local: Dict) -> List[str]:
+        return [rule for rule in self.rubric_rules if rule not in local]
+
+    def _evaluate_fast(self, text: str, use_cache: bool) -> Dict:
+        local = self.rule_engine.evaluate(text)
+        if self.ai_client is None:
+            return self._local_result(local, "LLM provider not configured")
+        try:
+            rules = self._remaining_rules(local)
+            system_prompt = build_rubric_subset(self.scoring_prompt, tuple(rules))
+            user_message = self._build_user_message(text)
+            response = self.ai_client.call_api(system_prompt, user_message, use_cache=use_cache)
+            scores = self._parse_scores(response, system_prompt, user_message)
+            scores, recovered = self._recover_missing(scores, rules, user_message, use_cache)
+            return self._merge_local(local, scores, recovered)
+        except Exception as e:
+            print(f"Evaluation failed, returning local scores: {e}")
+            return self._local_result(local, str(e))
+
+    async def _aevaluate_fast(self, text: str, use_cache: bool) -> Dict:
+        local = self.rule_engine.evaluate(text)
+        if self.ai_client is None:
+            return self._local_result(local, "LLM provider not configured")
+        try:
+            rules = self._remaining_rules(local)
+            system_prompt = build_rubric_subset(self.scoring_prompt, tuple(rules))
+            user_message = self._build_user_message(text)
+            response = await self.ai_client.acall_api(system_prompt, user_message, use_cache=use_cache)
+            scores = self._parse_scores(response, system_prompt, user_message)
+            scores, recovered = await self._arecover_missing(scores, rules, user_message, use_cache)
+            return self._merge_local(local, scores, recovered)
+        except Exception as e:
+            print(f"Evaluation failed, returning local scores: {e}")
+            return self._local_result(local, str(e))
+
+    # --- sharded 모드 (카테고리별 동시 채점) ---
+
+    def _evaluate_shard(self, rules: List[str], user_message: str, use_cache: bool) -> Dict:
+        system_prompt = build_rubric_subset(self.scoring_prompt, tuple(rules))
+        response = self.ai_client.call_api(system_prompt, user_message, use_cache=use_cache)
+        return self._shard_scores(rules, response, system_prompt, user_message)
+
+    async def _aevaluate_shard(self, rules: List[str], user_message: str, use_cache: bool) -> Dict:
+        system_prompt = build_rubric_subset(self.scoring_prompt, tuple(rules))
+        response = await self.ai_client.acall_api(system_prompt, user_message, use_cache=use_cache)
+        return self._shard_scores(rules, response, system_prompt, user_message)
+
+    def _shard_scores(self, rules: List[str], response: str, system_prompt: str, user_message: str) -> Dict:
+        """응답에서 해당 카테고리 규칙 점수만 추출 (하나도 없으면 실패로 처리)"""
+        valid, _ = self._validate_rules(self._parse_scores(response, system_prompt, user_message), rules)
+        shard = {rule: valid[rule] for rule in rules if rule in valid}
+        if not shard:
+            self.ai_client.discard_cached(system_prompt, user_message)
+            raise ValueError(f"No scores for {', '.join(rules)} in response")
+        return shard
+
+    def _iter_shards(self, user_message: str, use_cache: bool) -> Iterator[Tuple[str, Dict, str]]:
+        """완료되는 순서대로 (카테고리, 점수, 오류) 반환 - 실패한 카테고리만 재시도"""
+        executor = self.shard_executor or ThreadPoolExecutor(max_workers=len(self.CATEGORIES))
+        pending = list(self.CATEGORIES.items())
         try:
-            user_message = f"""
+            for attempt in range(self.shard_retries + 1):
+                last_attempt = attempt == self.shard_retries
+                futures = {
+                    executor.submit(self._evaluate_shard, rules, user_message, use_cache): (name, rules)
+                    for name, rules in pending
+                }
+                pending = []
+                for future in as_completed(futures):
+                    name, rules = futures[future]
+                    try:
+                        yield name, future.result(), None
+                    except Exception as e:
+                        if last_attempt:
+                            yield name, None, str(e)
+                        else:
+                            print(f"Shard '{name}' failed, retrying: {e}")
+                            pending.append((name, rules))
+                if not pending:
+                    return
+        finally:
+            if executor is not self.shard_executor:
+                executor.shutdown(wait=False)
+
+    def _evaluate_sharded(self, text: str, use_cache: bool) -> Dict:
+        user_message = self._build_user_message(text)
+        scores = {}
+        failed = {}
+        for name, shard, error in self._iter_shards(user_message, use_cache):
+            if error is None:
+                scores.update(shard)
+            else:
+                failed[name] = error
+        # 재시도 후에도 빠진 규칙(실패한 카테고리 포함)은 한 번에 재요청
+        scores, recovered = self._recover_missing(scores, self.rubric_rules, user_message, use_cache)
+        return self._sharded_result(scores, failed, recovered)
+
+    def _evaluate_sharded_stream(self, text: str, use_cache: bool) -> Iterator[Tuple[str, object]]:
+        user_message = self._build_user_message(text)
+        scores = {}
+        failed = {}
+        for name, shard, error in self._iter_shards(user_message, use_cache):
+            if error is None:
+                scores.update(shard)
+                yield 'shard', {'category': name, 'scores': shard}
+            else:
+                failed[name] = error
+                yield 'shard', {'category': name, 'error': error}
+        scores, recovered = self._recover_missing(scores, self.rubric_rules, user_message, use_cache)
+        yield 'scored', self._sharded_result(scores, failed, recovered)
+
+    async def _aevaluate_sharded(self, text: str, use_cache: bool) -> Dict:
+        user_message = self._build_user_message(text)
+        scores = {}
+        failed = {}
+        pending = list(self.CATEGORIES.items())
+        for attempt in range(self.shard_retries + 1):
+            results = await asyncio.gather(
+                *(self._aevaluate_shard(rules, user_message, use_cache) for _, rules in pending),
+                return_exceptions=True
+            )
+            retry = []
+            for (name, rules), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    failed[name] = str(result)
+                    retry.append((name, rules))
+                else:
+                    failed.pop(name, None)
+                    scores.update(result)
+            pending = retry
+            if not pending:
+                break
+        scores, recovered = await self._arecover_missing(scores, self.rubric_rules, user_message, use_cache)
+        return self._sharded_result(scores, failed, recovered)
+
+    def _sharded_result(self, scores: Dict, failed: Dict, recovered: List[str] = ()) -> Dict:
+        """카테고리 결과 병합 (failed_shards: 재시도 후에도 실패한 카테고리와 오류)"""
+        if not scores:
+            return self._get_default_scores(next(iter(failed.values()), "No shard results"))
+        result = self._with_completeness(self._process_scores(scores), recovered)
+        result['mode'] = 'sharded'
+        if failed:
+            result['failed_shards'] = failed
+        return result
+
+    def _merge_local(self, local: Dict, llm_scores: Dict, recovered: List[str] = ()) -> Dict:
+        """AI 채점 결과에 로컬 채점 결과를 합침 (로컬 판정 규칙은 로컬 점수 우선)"""
+        scores = {rule: value for rule, value in llm_scores.items() if rule not in local}
+        scores.update(local)
+        result = self._with_completeness(self._process_scores(scores), recovered, local)
+        result['mode'] = 'fast'
+        result['local_rules'] = list(local)
+        return result
+
+    def _local_result(self, local: Dict, llm_error: str = None) -> Dict:
+        """로컬 채점 결과만으로 구성한 평가 결과 (pending_rules: AI 채점이 필요한 나머지 규칙)"""
+        result = self._with_completeness(self._process_scores(dict(local)), local=local)
+        result['mode'] = 'fast'
+        result['local_rules'] = list(local)
+        result['pending_rules'] = self._remaining_rules(local)
+        if llm_error:
+            result['llm_error'] = llm_error
+        return result
+
+    def _build_user_message(self, text: str) -> str:
+        user_message = f"""
 Requirement to Evaluate:
 {text}
 
 Please evaluate this requirement and provide the score in JSON format as specified.
 """
-            # Gemini specific instruction
-            if self.ai_client.provider == 'gemini':
-                user_message += "\nIMPORTANT: Output ONLY valid JSON."
+        # Gemini specific instruction
+        if self.ai_client is not None and self.ai_client.provider == 'gemini':
+            user_message += "\nIMPORTANT: Output ONLY valid JSON."
+        return user_message
 
-            response = self.ai_client.call_api(self.scoring_prompt, user_message)
-            
-            # Parse JSON response
-            scores = self._parse_json_response(response)
-            return self._process_scores(scores)
+    def _parse_scores(self, response: str, system_prompt: str, user_message: str) -> Dict:
+        """응답 JSON 파싱 - 실패 시 정상 규칙 항목만 복구 (하나도 없으면 예외)"""
+        try:
+            return self._parse_json_response(response)
+        except Exception:
+            # 파싱 불가 응답은 캐시에 남기지 않음
+            self.ai_client.discard_cached(system_prompt, user_message)
+            salvaged = salvage_rule_entries(response)
+            if not salvaged:
+                raise
+            print(f"Recovered {len(salvaged)} rule entries from malformed response")
+            return salvaged
+
+    @staticmethod
+    def _validate_rules(scores: Dict, rules: List[str]) -> Tuple[Dict, List[str]]:
+        """(형식이 올바른 항목, rules 중 누락/형식 오류 규칙) 반환"""
+        valid = {}
+        for rule, value in (scores if isinstance(scores, dict) else {}).items():
+            entry = _normalize_entry(value)
+            if entry is not None:
+                valid[rule] = entry
+        return valid, [rule for rule in rules if rule not in valid]
+
+    def _recover_missing(self, scores: Dict, rules: List[str], user_message: str, use_cache: bool) -> Tuple[Dict, List[str]]:
+        """누락/형식 오류 규칙만 축약 루브릭으로 재요청하여 병합 - (점수, 재요청으로 채운 규칙) 반환"""
+        valid, missing = self._validate_rules(scores, rules)
+        if not missing or not self.recover_missing or self.ai_client is None:
+            return valid, []
+        system_prompt = build_rubric_subset(self.scoring_prompt, tuple(missing))
+        try:
+            response = self.ai_client.call_api(system_prompt, user_message, use_cache=use_cache)
+            recovered, _ = self._validate_rules(self._parse_scores(response, system_prompt, user_message), missing)
         except Exception as e:
-            print(f"Evaluation failed: {e}")
-            return self._get_default_scores()
+            print(f"Missing rule recovery failed ({', '.join(missing)}): {e}")
+            return valid, []
+        recovered = {rule: entry for rule, entry in recovered.items() if rule in missing}
+        valid.update(recovered)
+        return valid, list(recovered)
+
+    async def _arecover_missing(self, scores: Dict, rules: List[str], user_message: str, use_cache: bool) -> Tuple[Dict, List[str]]:
+        """_recover_missing의 비동기 버전"""
+        valid, missing = self._validate_rules(scores, rules)
+        if not missing or not self.recover_missing or self.ai_client is None:
+            return valid, []
+        system_prompt = build_rubric_subset(self.scoring_prompt, tuple(missing))
+        try:
+            response = await self.ai_client.acall_api(system_prompt, user_message, use_cache=use_cache)
+            recovered, _ = self._validate_rules(self._parse_scores(response, system_prompt, user_message), missing)
+        except Exception as e:
+            print(f"Missing rule recovery failed ({', '.join(missing)}): {e}")
+            return valid, []
+        recovered = {rule: entry for rule, entry in recovered.items() if rule in missing}
+        valid.update(recovered)
+        return valid, list(recovered)
+
+    def _with_completeness(self, result: Dict, recovered: List[str] = (), local: Dict = ()) -> Dict:
+        """
+        규칙별 채점 상태 추가 - complete: 첫 응답, recovered: 재요청으로 채움,
+        local: 로컬 규칙 엔진, missing: 점수 없음 (missing_rules에도 나열)
+        """
+        scores = result.get('scores', {})
+        completeness = {}
+        for rule in self.rubric_rules:
+            if rule in local:
+                completeness[rule] = 'local'
+            elif rule in recovered:
+                completeness[rule] = 'recovered'
+            elif rule in scores:
+                completeness[rule] = 'complete'
+            else:
+                completeness[rule] = 'missing'
+        result['completeness'] = completeness
+        missing = [rule for rule, status in completeness.items() if status == 'missing']
+        if missing:
+            result['missing_rules'] = missing
+        return result
 
     def _parse_json_response(self, response: str) -> Dict:
-        import json
         try:
             clean_response = response.strip()
             if clean_response.startswith('```json'):
@@ -108,31 +539,9 @@ Please evaluate this requirement and provide the score in JSON format as specifi
     def _calculate_category_scores(self, scores: Dict) -> Dict:
         
         
-        # 카테고리 정의 
-        categories = {
-            "패턴 규칙 (P1-P7)": {"rules": ["P1", "P2", "P3", "P4", "P5", "P6", "P7"]},
-            "개별 특성 (C1-C9)": {"rules": ["C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8", "C9"]},
-            "집합 특성 (C10-C15)": {"rules": ["C10", "C11", "C12", "C13", "C14", "C15"]},
-            "Accuracy (정확성)": {"rules": ["R1", "R2", "R3", "R4", "R5", "R6", "R7", "R8", "R9"]},
-            "Concision (간결성)": {"rules": ["R10", "R11"]},
-            "Non-Ambiguity (비모호성)": {"rules": ["R12", "R13", "R14", "R15", "R16", "R17"]},
-            "Singularity (단일성)": {"rules": ["R18", "R19", "R20", "R21", "R22", "R23"]},
-            "Completeness (완전성)": {"rules": ["R24", "R25"]},
-            "Realism (현실성)": {"rules": ["R26"]},
-            "Conditions (조건 표현)": {"rules": ["R27", "R28"]},
-            "Uniqueness (고유성)": {"rules": ["R29", "R30"]},
-            "Abstraction (추상화 수준)": {"rules": ["R31"]},
-            "Quantification (정량화 - R32)": {"rules": ["R32"]},
-            "Tolerance (허용오차)": {"rules": ["R33"]},
-            "Quantification (정량화 - R34-35)": {"rules": ["R34", "R35"]},
-            "Uniformity of Language (언어 일관성)": {"rules": ["R36", "R37", "R38", "R39", "R40"]},
-            "Modularity (모듈성)": {"rules": ["R41", "R42"]}
-        }
-        
         result = {}
         
-        for cat_name, cat_data in categories.items():
-            rules = cat_data["rules"]
+        for cat_name, rules in self.CATEGORIES.items():
             max_score = len(rules) * 5  
             current_score = 0
             
@@ -144,20 +553,24 @@ Please evaluate this requirement and provide the score in JSON format as specifi
             result[cat_name] = {
                 "score": current_score,
                 "max": max_score,
-                "rules": rules
+                "rules": list(rules)
             }
             
         return result
     
-    def _get_default_scores(self) -> Dict:
+    def _get_default_scores(self, error: str = None) -> Dict:
   
-        return {
+        result = {
             "total": 0,
             "max": 320,
             "percentage": 0,
             "scores": {},
             "categories": {}
         }
+        if error:
+            # 평가 실패 사유 (0점이 실제 점수가 아님을 표시)
+            result["error"] = error
+        return result
     
     def compare_scores(self, original_scores: Dict, improved_scores: Dict) -> Dict:
 
@@ -4,7 +4,7 @@ Requirement Improver - 요구사항 개선
 - EARS 패턴(Ubiquitous, Event-Driven 등) 적용
 - Quality.md 프롬프트 기반으로 개선된 요구사항 생성
 """
-from typing import Dict, List
+from typing import Dict, List, Iterator
 from .ai_client import AIClient
 
 
@@ -19,9 +19,34 @@ class RequirementImprover:
     def improve(
         self,
         original_text: str,
-        pattern_data: Dict
+        pattern_data: Dict,
+        use_cache: bool = True
     ) -> Dict:
         
+        user_message = self._build_user_message(original_text, pattern_data)
+        improved_text = self.ai_client.call_api(self.quality_prompt, user_message, use_cache=use_cache)
+        
+        return self.build_result(original_text, improved_text, pattern_data)
+
+    async def aimprove(self, original_text: str, pattern_data: Dict, use_cache: bool = True) -> Dict:
+        """improve의 비동기 버전"""
+        user_message = self._build_user_message(original_text, pattern_data)
+        improved_text = await self.ai_client.acall_api(self.quality_prompt, user_message, use_cache=use_cache)
+        return self.build_result(original_text, improved_text, pattern_data)
+
+    def improve_stream(self, original_text: str, pattern_data: Dict, use_cache: bool = True) -> Iterator[str]:
+        """개선 결과를 텍스트 조각 단위로 반환 (전체 결과는 build_result로 구성)"""
+        user_message = self._build_user_message(original_text, pattern_data)
+        yield from self.ai_client.stream_api(self.quality_prompt, user_message, use_cache=use_cache)
+
+    def build_result(self, original_text: str, improved_text: str, pattern_data: Dict) -> Dict:
+        return {
+            "original": original_text,
+            "improved": improved_text,
+            "pattern_data": pattern_data
+        }
+
+    def _build_user_message(self, original_text: str, pattern_data: Dict) -> str:
         pattern_type = pattern_data.get('pattern', 'ubiquitous')
         pattern_context = f"Pattern Type: {pattern_type}\n\n"
         
@@ -29,7 +54,7 @@ class RequirementImprover:
             if key != 'pattern' and value:
                 pattern_context += f"{key.replace('_', ' ').title()}: {value}\n"
         
-        user_message = f"""
+        return f"""
 Original Requirement: {original_text}
 
 {pattern_context}
@@ -38,11 +63,3 @@ Please improve this requirement based on the INCOSE rules provided in the system
 Use the pattern information above to structure the improved requirement appropriately.
 If any pattern fields are missing, do not include them in the improved requirement.
 """
-        
-        improved_text = self.ai_client.call_api(self.quality_prompt, user_message)
-        
-        return {
-            "original": original_text,
-            "improved": improved_text,
-            "pattern_data": pattern_data
-        }
\ No newline at end of file
@@ -1,5 +1,37 @@
-from .base import LLMProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
-from .claude import ClaudeProvider
-from .factory import LLMFactory
+"""
+LLM Provider 패키지 - 공개 이름은 처음 접근할 때 해당 모듈을 import (PEP 562)
+(서버 시작 시 Provider 모듈과 requests를 불러오지 않음)
+"""
+import importlib
+
+_EXPORTS = {
+    'LLMProvider': '.base',
+    'LLMError': '.base',
+    'UsageStats': '.base',
+    'OpenAIProvider': '.openai',
+    'GeminiProvider': '.gemini',
+    'ClaudeProvider': '.claude',
+    'LLMFactory': '.factory',
+    'ProviderRegistry': '.registry',
+    'RetryPolicy': '.resilience',
+    'CircuitBreaker': '.resilience',
+    'ProviderSlot': '.resilience',
+    'ResilientProvider': '.resilience',
+    'RateLimiter': '.rate_limit',
+    'RateLimiterRegistry': '.rate_limit',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,74 @@
+"""
+Async HTTP - asyncio 기반 Provider 호출용 공유 HTTP 클라이언트
+- 이벤트 루프마다 하나의 httpx.AsyncClient(keep-alive 커넥션 풀)를 공유
+- httpx는 비동기 경로를 사용할 때만 import (동기 경로는 의존하지 않음)
+- 프록시 설정은 동기 경로(requests.Session)와 동일하게 적용 ({'http': url, 'https': url})
+"""
+import asyncio
+import weakref
+from .base import parse_retry_after
+
+DEFAULT_ASYNC_POOL_SIZE = 50
+
+_clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+_pool_size = DEFAULT_ASYNC_POOL_SIZE
+_proxies = {}  # scheme -> 프록시 URL
+
+
+class AsyncRequestError(Exception):
+    """비동기 HTTP 요청 실패 (연결 오류, 타임아웃, 4xx/5xx 응답)"""
+
+    def __init__(self, message: str, status_code: int = None, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def configure(pool_size: int = DEFAULT_ASYNC_POOL_SIZE, proxies: dict = None):
+    """이후 생성되는 클라이언트의 커넥션 풀 크기 및 프록시 설정 (빈 URL은 무시)"""
+    global _pool_size, _proxies
+    _pool_size = pool_size
+    _proxies = {scheme: url for scheme, url in (proxies or {}).items() if url}
+
+
+def get_async_client():
+    """현재 이벤트 루프에 바인딩된 공유 AsyncClient 반환"""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(max_connections=_pool_size, max_keepalive_connections=_pool_size)
+        # 프록시를 거치는 scheme은 전용 transport (풀 크기 동일하게 적용)
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=url, limits=limits)
+            for scheme, url in _proxies.items()
+        }
+        client = httpx.AsyncClient(limits=limits, mounts=mounts or None, timeout=120)
+        _clients[loop] = client
+    return client
+
+
+async def apost_json(url: str, payload: dict, headers: dict, timeout: float = 120) -> dict:
+    """JSON POST 요청 후 응답 JSON 반환"""
+    import httpx
+
+    try:
+        response = await get_async_client().post(url, json=payload, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise AsyncRequestError(
+            str(e),
+            status_code=e.response.status_code,
+            retry_after=parse_retry_after(e.response.headers.get('Retry-After'))
+        ) from e
+    except httpx.HTTPError as e:
+        raise AsyncRequestError(str(e)) from e
+
+
+async def aclose():
+    """현재 이벤트 루프의 공유 클라이언트 종료"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,9 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_POOL_SIZE = 10
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 단위)를 float로 변환 (HTTP-date 형식 등은 무시)"""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMError(Exception):
+    """
+    LLM Provider 호출 실패
+    - status_code: HTTP 상태 코드 (연결 오류/타임아웃은 None)
+    - retry_after: 서버가 지정한 재시도 대기 시간(초)
+    - retryable: 재시도로 회복 가능한 오류 여부 (429/5xx/타임아웃/연결 오류)
+    """
+
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+    @classmethod
+    def from_request_exception(cls, label: str, exc: requests.exceptions.RequestException):
+        response = getattr(exc, 'response', None)
+        if response is not None:
+            return cls(
+                f"{label} API 호출 실패: {str(exc)}",
+                status_code=response.status_code,
+                retry_after=parse_retry_after(response.headers.get('Retry-After')),
+                retryable=response.status_code in RETRYABLE_STATUS_CODES
+            )
+        return cls(f"{label} API 호출 실패: {str(exc)}", retryable=True)
+
+    @classmethod
+    def from_async_error(cls, label: str, exc):
+        status_code = getattr(exc, 'status_code', None)
+        return cls(
+            f"{label} API 호출 실패: {str(exc)}",
+            status_code=status_code,
+            retry_after=getattr(exc, 'retry_after', None),
+            retryable=status_code is None or status_code in RETRYABLE_STATUS_CODES
+        )
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE, proxies: dict = None) -> requests.Session:
+    """Keep-alive 커넥션 풀을 가진 requests.Session 생성"""
+    # requests는 첫 Provider 생성 시 import (서버 시작 시간 단축)
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if proxies:
+        session.proxies.update({k: v for k, v in proxies.items() if v})
+    return session
+
+
+def iter_sse_data(response) -> Iterator[dict]:
+    """Server-Sent Events 응답에서 data 필드(JSON)를 순서대로 반환"""
+    response.encoding = 'utf-8'  # text/event-stream 기본 인코딩(ISO-8859-1) 방지
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith('data:'):
+            continue
+        data = line[5:].strip()
+        if data == '[DONE]':
+            return
+        if data:
+            yield json.loads(data)
+
+
+class UsageStats:
+    """
+    Provider 토큰 사용량 및 프롬프트 캐시 통계 (응답의 usage 필드 누적)
+    - input_tokens: 캐시 적중분을 포함한 전체 입력 토큰
+    - cached_tokens: 프롬프트 캐시에서 읽은 입력 토큰, cache_write_tokens: 캐시에 새로 기록된 입력 토큰
+    """
+
+    FIELDS = ('input_tokens', 'cached_tokens', 'cache_write_tokens', 'output_tokens')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+        self._counts['requests'] = 0
+        self._counts['cache_hits'] = 0
+
+    def record(self, input_tokens: int = 0, cached_tokens: int = 0, cache_write_tokens: int = 0, output_tokens: int = 0):
+        with self._lock:
+            self._counts['requests'] += 1
+            self._counts['input_tokens'] += input_tokens or 0
+            self._counts['cached_tokens'] += cached_tokens or 0
+            self._counts['cache_write_tokens'] += cache_write_tokens or 0
+            self._counts['output_tokens'] += output_tokens or 0
+            if cached_tokens:
+                self._counts['cache_hits'] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stats = dict(self._counts)
+        stats['cached_ratio'] = round(stats['cached_tokens'] / stats['input_tokens'], 3) if stats['input_tokens'] else 0.0
+        return stats
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
-    
+
+    session: requests.Session = None
+    temperature: float = 0.7
+    # 정적 system 프롬프트를 Provider 측 프롬프트 캐시에 맞게 요청 구성
+    prompt_caching: bool = True
+    # 응답 usage 누적 대상 (ProviderRegistry가 지정)
+    usage: UsageStats = None
+
     @abstractmethod
     def generate(self, system_prompt: str, user_message: str) -> str:
         """Generate response from LLM"""
         pass
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        """Generate response asynchronously (기본 구현: 동기 generate를 스레드에서 실행)"""
+        return await asyncio.to_thread(self.generate, system_prompt, user_message)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """Generate response as text chunks (기본 구현: 전체 응답을 한 번에 반환)"""
+        yield self.generate(system_prompt, user_message)
+
+    def _record_usage(self, **counts):
+        if self.usage is not None and counts:
+            self.usage.record(**counts)
+
+    def endpoint_url(self) -> str:
+        """Pre-warm 대상 URL (Provider별로 재정의)"""
+        return getattr(self, 'base_url', '') or ''
+
+    def warmup(self, timeout: float = 5) -> bool:
+        """TCP+TLS 연결을 미리 맺어 커넥션 풀에 보관 (응답 코드는 무시)"""
+        url = self.endpoint_url()
+        if not url or self.session is None:
+            return False
+        import requests
+
+        parts = urlsplit(url)
+        try:
+            self.session.head(f"{parts.scheme}://{parts.netloc}/", timeout=timeout)
+            return True
+        except requests.exceptions.RequestException:
+            return False
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
@@ -1,14 +1,19 @@
 import requests
-from .base import LLMProvider
+from typing import Iterator
+from .base import LLMProvider, LLMError, create_session, iter_sse_data
+from .async_http import apost_json, AsyncRequestError
 
 class ClaudeProvider(LLMProvider):
-    def __init__(self, api_key: str, base_url: str, model: str = "claude-3-sonnet-20240229", max_tokens: int = 8000):
+    def __init__(self, api_key: str, base_url: str, model: str = "claude-3-sonnet-20240229", max_tokens: int = 8000,
+                 session: requests.Session = None, prompt_caching: bool = True):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.max_tokens = max_tokens
+        self.session = session if session is not None else create_session()
+        self.prompt_caching = prompt_caching
 
-    def generate(self, system_prompt: str, user_message: str) -> str:
+    def _build_request(self):
         # Smart URL construction: detect if it's Gateway or standard Anthropic
         base = self.base_url.rstrip('/') if self.base_url else ''
         
@@ -25,21 +30,85 @@ class ClaudeProvider(LLMProvider):
                 'x-api-key': self.api_key,
                 'anthropic-version': '2023-06-01'
             }
-        
-        payload = {
+        return url, headers
+
+    def endpoint_url(self) -> str:
+        return self._build_request()[0]
+
+    def _build_payload(self, system_prompt: str, user_message: str) -> dict:
+        system = system_prompt
+        if self.prompt_caching:
+            # system 블록까지를 캐시 구간으로 지정 (5분 ephemeral 캐시)
+            system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        return {
             "model": self.model,
             "max_tokens": self.max_tokens,
-            "temperature": 0.7,
-            "system": system_prompt,
+            "temperature": self.temperature,
+            "system": system,
             "messages": [
                 {"role": "user", "content": user_message}
             ]
         }
+
+    def _record_response_usage(self, usage: dict):
+        if not usage:
+            return
+        cached = usage.get('cache_read_input_tokens') or 0
+        written = usage.get('cache_creation_input_tokens') or 0
+        self._record_usage(
+            # input_tokens는 캐시 구간 이후의 토큰만 포함
+            input_tokens=(usage.get('input_tokens') or 0) + cached + written,
+            cached_tokens=cached,
+            cache_write_tokens=written,
+            output_tokens=usage.get('output_tokens') or 0
+        )
+
+    def generate(self, system_prompt: str, user_message: str) -> str:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=120)
+            response = self.session.post(url, json=payload, headers=headers, timeout=120)
             response.raise_for_status()
             result = response.json()
+            self._record_response_usage(result.get('usage'))
             return result['content'][0]['text']
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Claude API 호출 실패: {str(e)}")
+            raise LLMError.from_request_exception("Claude", e)
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
+
+        try:
+            result = await apost_json(url, payload, headers, timeout=120)
+            self._record_response_usage(result.get('usage'))
+            return result['content'][0]['text']
+        except AsyncRequestError as e:
+            raise LLMError.from_async_error("Claude", e)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
+        payload["stream"] = True
+
+        usage = {}
+        try:
+            with self.session.post(url, json=payload, headers=headers, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                for event in iter_sse_data(response):
+                    # 입력/캐시 토큰은 message_start, 출력 토큰은 message_delta에 포함
+                    if event.get('type') == 'message_start':
+                        usage.update(event.get('message', {}).get('usage') or {})
+                    elif event.get('type') == 'message_delta':
+                        usage.update(event.get('usage') or {})
+                    elif event.get('type') == 'content_block_delta':
+                        text = event.get('delta', {}).get('text')
+                        if text:
+                            yield text
+                    elif event.get('type') == 'error':
+                        # 스트림 도중 전달되는 오류 (예: overloaded_error)
+                        raise LLMError(f"Claude API 호출 실패: {event.get('error')}", retryable=True)
+            self._record_response_usage(usage)
+        except requests.exceptions.RequestException as e:
+            raise LLMError.from_request_exception("Claude", e)
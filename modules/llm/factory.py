@@ -1,10 +1,7 @@
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
-from .claude import ClaudeProvider
-
 class LLMFactory:
     @staticmethod
-    def create_provider(provider: str, api_key: str, base_url: str = None, model_name: str = None):
+    def create_provider(provider: str, api_key: str, base_url: str = None, model_name: str = None, session=None,
+                        prompt_caching: bool = True, gemini_cache_ttl: int = None):
         provider = provider.lower()
         
         default_urls = {
@@ -12,18 +9,25 @@ class LLMFactory:
             'claude': 'https://api.anthropic.com/v1'
         }
         
+        # Provider 모듈(requests 포함)은 실제로 사용할 때 import
         if provider == 'openai':
+            from .openai import OpenAIProvider
             url = base_url if base_url else default_urls['openai']
-            return OpenAIProvider(api_key, url, model=model_name if model_name else "gpt-4o-mini")
+            return OpenAIProvider(api_key, url, model=model_name if model_name else "gpt-4o-mini", session=session,
+                                  prompt_caching=prompt_caching)
             
         elif provider == 'gemini':
+            from .gemini import GeminiProvider
             if not base_url:
                 raise ValueError("Gemini requires a Base URL")
-            return GeminiProvider(api_key, base_url, model=model_name if model_name else "gemini-2.0-flash")
+            return GeminiProvider(api_key, base_url, model=model_name if model_name else "gemini-2.0-flash", session=session,
+                                  prompt_caching=prompt_caching, cache_ttl=gemini_cache_ttl)
             
         elif provider == 'claude':
+            from .claude import ClaudeProvider
             url = base_url if base_url else default_urls['claude']
-            return ClaudeProvider(api_key, url, model=model_name if model_name else "claude-3-sonnet-20240229")
+            return ClaudeProvider(api_key, url, model=model_name if model_name else "claude-3-sonnet-20240229", session=session,
+                                  prompt_caching=prompt_caching)
             
         else:
             raise ValueError(f"Unsupported provider: {provider}")
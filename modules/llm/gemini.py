@@ -1,11 +1,28 @@
+import asyncio
+import hashlib
+import threading
+import time
 import requests
-from .base import LLMProvider
+from typing import Iterator
+from .base import LLMProvider, LLMError, create_session, iter_sse_data
+from .async_http import apost_json, AsyncRequestError
 
 class GeminiProvider(LLMProvider):
-    def __init__(self, api_key: str, base_url: str, model: str = "gemini-2.0-flash"):
+    # 명시적 캐시 생성 실패 후 재시도하지 않는 시간(초)
+    CACHE_RETRY_INTERVAL = 300
+
+    def __init__(self, api_key: str, base_url: str, model: str = "gemini-2.0-flash",
+                 session: requests.Session = None, prompt_caching: bool = True, cache_ttl: int = None):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')  
         self.model = model
+        self.session = session if session is not None else create_session()
+        self.prompt_caching = prompt_caching
+        # cache_ttl(초) 지정 시 system 프롬프트를 cachedContents로 등록해 재사용 (미지정 시 암시적 캐시만)
+        self.cache_ttl = cache_ttl
+        self._cached_contents = {}  # system 프롬프트 해시 -> (cachedContent 이름, 만료 시각)
+        self._cache_disabled_until = 0.0
+        self._cache_lock = threading.Lock()
 
     def _build_endpoint(self) -> str:
        
@@ -22,9 +39,88 @@ class GeminiProvider(LLMProvider):
         # 3. Base URL만 제공된 경우
         return f"{base}/models/{self.model}:generateContent"
 
+    def endpoint_url(self) -> str:
+        return self._build_endpoint() if self.base_url else ''
+
+    def _build_stream_endpoint(self) -> str:
+        return self._build_endpoint().replace(':generateContent', ':streamGenerateContent')
+
+    def _build_cache_endpoint(self) -> str:
+        base = self.base_url.split(':generateContent')[0]
+        if '/models' in base:
+            base = base[:base.rfind('/models')]
+        return f"{base}/cachedContents"
+
+    def _get_cached_content(self, system_prompt: str):
+        """system 프롬프트의 cachedContent 이름 반환 (없으면 생성, 사용 불가 시 None)"""
+        if not (self.prompt_caching and self.cache_ttl):
+            return None
+        key = hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+        now = time.time()
+        with self._cache_lock:
+            entry = self._cached_contents.get(key)
+            # 만료 직전 캐시는 요청 처리 중 사라질 수 있으므로 새로 생성
+            if entry is not None and entry[1] - now > 60:
+                return entry[0]
+            if now < self._cache_disabled_until:
+                return None
+
+        payload = {
+            "model": f"models/{self.model}",
+            "systemInstruction": {"parts": [{"text": system_prompt}]},
+            "ttl": f"{int(self.cache_ttl)}s"
+        }
+        try:
+            response = self.session.post(
+                f"{self._build_cache_endpoint()}?key={self.api_key}",
+                json=payload, headers={'Content-Type': 'application/json'}, timeout=30
+            )
+            response.raise_for_status()
+            name = response.json()['name']
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            # 최소 토큰 수 미달, 게이트웨이 미지원 등 - systemInstruction으로 대체
+            print(f"Gemini cachedContents unavailable, using systemInstruction: {e}")
+            with self._cache_lock:
+                self._cache_disabled_until = now + self.CACHE_RETRY_INTERVAL
+            return None
+
+        with self._cache_lock:
+            self._cached_contents[key] = (name, now + self.cache_ttl)
+        return name
+
+    def _build_payload(self, system_prompt: str, user_message: str, cached_content: str = None) -> dict:
+        if not self.prompt_caching:
+            full_prompt = f"{system_prompt}\n\nUser Request:\n{user_message}"
+            return {
+                "contents": [{
+                    "role": "user",
+                    "parts": [{"text": full_prompt}]
+                }]
+            }
+
+        # system 프롬프트를 별도 필드로 분리해야 요청 간 동일한 prefix가 되어 캐시 적용
+        payload = {
+            "contents": [{
+                "role": "user",
+                "parts": [{"text": user_message}]
+            }]
+        }
+        if cached_content:
+            payload["cachedContent"] = cached_content
+        else:
+            payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
+        return payload
+
+    def _record_response_usage(self, usage: dict):
+        if not usage:
+            return
+        self._record_usage(
+            input_tokens=usage.get('promptTokenCount', 0),
+            cached_tokens=usage.get('cachedContentTokenCount', 0),
+            output_tokens=usage.get('candidatesTokenCount', 0)
+        )
+
     def generate(self, system_prompt: str, user_message: str) -> str:
-        full_prompt = f"{system_prompt}\n\nUser Request:\n{user_message}"
-        
         if not self.base_url:
             raise ValueError("Gemini configuration requires a Base URL")
 
@@ -35,17 +131,52 @@ class GeminiProvider(LLMProvider):
             'Content-Type': 'application/json'
         }
         
-        payload = {
-            "contents": [{
-                "role": "user",
-                "parts": [{"text": full_prompt}]
-            }]
-        }
+        payload = self._build_payload(system_prompt, user_message, self._get_cached_content(system_prompt))
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=120)
+            response = self.session.post(url, json=payload, headers=headers, timeout=120)
             response.raise_for_status()
             result = response.json()
+            self._record_response_usage(result.get('usageMetadata'))
             return result['candidates'][0]['content']['parts'][0]['text']
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Gemini API 호출 실패: {str(e)}")
\ No newline at end of file
+            raise LLMError.from_request_exception("Gemini", e)
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        if not self.base_url:
+            raise ValueError("Gemini configuration requires a Base URL")
+
+        url = f"{self._build_endpoint()}?key={self.api_key}"
+        headers = {'Content-Type': 'application/json'}
+        cached_content = await asyncio.to_thread(self._get_cached_content, system_prompt) if self.cache_ttl else None
+        payload = self._build_payload(system_prompt, user_message, cached_content)
+
+        try:
+            result = await apost_json(url, payload, headers, timeout=120)
+            self._record_response_usage(result.get('usageMetadata'))
+            return result['candidates'][0]['content']['parts'][0]['text']
+        except AsyncRequestError as e:
+            raise LLMError.from_async_error("Gemini", e)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        if not self.base_url:
+            raise ValueError("Gemini configuration requires a Base URL")
+
+        url = f"{self._build_stream_endpoint()}?alt=sse&key={self.api_key}"
+        headers = {'Content-Type': 'application/json'}
+        payload = self._build_payload(system_prompt, user_message, self._get_cached_content(system_prompt))
+
+        usage = None
+        try:
+            with self.session.post(url, json=payload, headers=headers, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                for event in iter_sse_data(response):
+                    # usageMetadata는 청크마다 누적값으로 전달되므로 마지막 값만 기록
+                    usage = event.get('usageMetadata') or usage
+                    for candidate in event.get('candidates') or []:
+                        for part in candidate.get('content', {}).get('parts') or []:
+                            if part.get('text'):
+                                yield part['text']
+            self._record_response_usage(usage)
+        except requests.exceptions.RequestException as e:
+            raise LLMError.from_request_exception("Gemini", e)
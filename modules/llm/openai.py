@@ -1,14 +1,19 @@
 import requests
-from .base import LLMProvider
+from typing import Iterator
+from .base import LLMProvider, LLMError, create_session, iter_sse_data
+from .async_http import apost_json, AsyncRequestError
 
 class OpenAIProvider(LLMProvider):
-    def __init__(self, api_key: str, base_url: str, model: str = "gpt-4o-mini", max_tokens: int = 8000):
+    def __init__(self, api_key: str, base_url: str, model: str = "gpt-4o-mini", max_tokens: int = 8000,
+                 session: requests.Session = None, prompt_caching: bool = True):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.max_tokens = max_tokens
+        self.session = session if session is not None else create_session()
+        self.prompt_caching = prompt_caching
 
-    def generate(self, system_prompt: str, user_message: str) -> str:
+    def _build_request(self):
         # Smart URL construction: detect if it's Gateway or standard OpenAI
         base = self.base_url.rstrip('/') if self.base_url else ''
         
@@ -24,21 +29,74 @@ class OpenAIProvider(LLMProvider):
                 'Content-Type': 'application/json',
                 'Authorization': f'Bearer {self.api_key}'
             }
-        
-        payload = {
+        return url, headers
+
+    def endpoint_url(self) -> str:
+        return self._build_request()[0]
+
+    def _build_payload(self, system_prompt: str, user_message: str) -> dict:
+        # 자동 프롬프트 캐시는 요청 앞부분(prefix) 일치로 적용되므로
+        # 변하지 않는 system 프롬프트를 항상 맨 앞에, 요청별 내용은 마지막 user 메시지에만 둠
+        return {
             "model": self.model,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message}
             ],
             "max_tokens": self.max_tokens,
-            "temperature": 0.7
+            "temperature": self.temperature
         }
+
+    def _record_response_usage(self, usage: dict):
+        if not usage:
+            return
+        details = usage.get('prompt_tokens_details') or {}
+        self._record_usage(
+            input_tokens=usage.get('prompt_tokens', 0),
+            cached_tokens=details.get('cached_tokens', 0),
+            output_tokens=usage.get('completion_tokens', 0)
+        )
+
+    def generate(self, system_prompt: str, user_message: str) -> str:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=120)
+            response = self.session.post(url, json=payload, headers=headers, timeout=120)
             response.raise_for_status()
             result = response.json()
+            self._record_response_usage(result.get('usage'))
             return result['choices'][0]['message']['content']
         except requests.exceptions.RequestException as e:
-            raise Exception(f"OpenAI API 호출 실패: {str(e)}")
+            raise LLMError.from_request_exception("OpenAI", e)
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
+
+        try:
+            result = await apost_json(url, payload, headers, timeout=120)
+            self._record_response_usage(result.get('usage'))
+            return result['choices'][0]['message']['content']
+        except AsyncRequestError as e:
+            raise LLMError.from_async_error("OpenAI", e)
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        url, headers = self._build_request()
+        payload = self._build_payload(system_prompt, user_message)
+        payload["stream"] = True
+        if self.prompt_caching:
+            # 마지막 청크로 usage(캐시 적중 토큰 포함) 수신
+            payload["stream_options"] = {"include_usage": True}
+
+        try:
+            with self.session.post(url, json=payload, headers=headers, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                for event in iter_sse_data(response):
+                    self._record_response_usage(event.get('usage'))
+                    choices = event.get('choices') or []
+                    text = choices[0].get('delta', {}).get('content') if choices else None
+                    if text:
+                        yield text
+        except requests.exceptions.RequestException as e:
+            raise LLMError.from_request_exception("OpenAI", e)
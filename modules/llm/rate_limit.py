@@ -0,0 +1,140 @@
+"""
+Rate Limit - Provider/API 키별 클라이언트 측 호출 속도 제한
+- 분당 요청 수(RPM)와 분당 추정 토큰 수(TPM) 두 개의 토큰 버킷으로 제한
+- 예약 방식(FIFO): 대기 시간을 먼저 계산해 두므로 할당량 한도에서 일정한 속도로 호출
+- 프로세스 내 모든 스레드/이벤트 루프가 같은 limiter를 공유, 대기열 길이와 대기 시간 통계 제공
+"""
+import asyncio
+import threading
+import time
+
+
+def estimate_tokens(system_prompt: str, user_message: str, max_tokens: int = 0) -> int:
+    """
+    요청 토큰 수 추정 - 입력은 문자 3개당 1토큰(한국어 포함 보수적 추정),
+    출력은 Provider들이 한도 계산에 사용하는 max_tokens를 그대로 더함
+    """
+    return (len(system_prompt) + len(user_message)) // 3 + 1 + (max_tokens or 0)
+
+
+class TokenBucket:
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """amount만큼 예약하고 사용 가능해질 때까지의 대기 시간(초) 반환 (잔량은 음수가 될 수 있음)"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+
+    def __init__(self, rpm: int = None, tpm: int = None):
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._stats = {'acquired': 0, 'delayed': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+        self.configure(rpm, tpm)
+
+    def configure(self, rpm: int = None, tpm: int = None):
+        """한도 변경 (None 또는 0은 제한 없음)"""
+        with self._lock:
+            self.rpm = rpm or None
+            self.tpm = tpm or None
+            self._requests = TokenBucket(self.rpm) if self.rpm else None
+            self._tokens = TokenBucket(self.tpm) if self.tpm else None
+
+    def _reserve(self, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+            self._stats['acquired'] += 1
+            if wait > 0:
+                self._stats['delayed'] += 1
+                self._stats['total_wait'] += wait
+                self._stats['max_wait'] = max(self._stats['max_wait'], wait)
+                self._waiting += 1
+            return wait
+
+    def _release_waiter(self):
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self, tokens: int = 0) -> float:
+        """호출 가능 시점까지 대기 (대기한 시간(초) 반환)"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._release_waiter()
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._release_waiter()
+        return wait
+
+    def current_wait(self) -> float:
+        """지금 요청 1건(토큰 0)을 보낸다면 기다려야 할 시간(초) - 예약 없이 계산"""
+        now = time.monotonic()
+        with self._lock:
+            wait = 0.0
+            for bucket in (self._requests, self._tokens):
+                if bucket is None:
+                    continue
+                tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                needed = 1 - tokens if bucket is self._requests else -tokens
+                if needed > 0:
+                    wait = max(wait, needed / bucket.rate)
+            return wait
+
+    def stats(self) -> dict:
+        current_wait = self.current_wait()
+        with self._lock:
+            stats = dict(self._stats)
+            stats['rpm'] = self.rpm
+            stats['tpm'] = self.tpm
+            stats['queue_depth'] = self._waiting
+        stats['current_wait'] = round(current_wait, 3)
+        stats['total_wait'] = round(stats['total_wait'], 3)
+        stats['max_wait'] = round(stats['max_wait'], 3)
+        return stats
+
+
+class RateLimiterRegistry:
+    """(provider, api_key)별 RateLimiter 공유 저장소"""
+
+    def __init__(self):
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, api_key: str, rpm: int = None, tpm: int = None) -> RateLimiter:
+        key = (provider.lower(), api_key)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = RateLimiter(rpm, tpm)
+                self._limiters[key] = limiter
+            elif (limiter.rpm, limiter.tpm) != (rpm or None, tpm or None):
+                limiter.configure(rpm, tpm)
+            return limiter
+
+    def stats(self) -> dict:
+        """Provider별 통계 (API 키는 마지막 4자리만 표시)"""
+        with self._lock:
+            items = list(self._limiters.items())
+        return {f"{provider}:...{api_key[-4:]}": limiter.stats() for (provider, api_key), limiter in items}
@@ -0,0 +1,95 @@
+"""
+Provider Registry - 장기 유지되는 LLM Provider 인스턴스 관리
+- (provider, api_key, base_url, model) 조합별로 Provider를 한 번만 생성하여 재사용
+- Provider마다 전용 keep-alive 커넥션 풀(requests.Session)을 보유
+- 설정 변경 시 무효화(invalidate) 및 시작 시 커넥션 pre-warm 지원
+- Provider별 서킷 브레이커를 요청 간 공유 (무효화 후에도 상태 유지)
+- Provider별 토큰 사용량/프롬프트 캐시 적중 통계 (무효화 후에도 유지)
+"""
+import threading
+from .base import LLMProvider, UsageStats, create_session, DEFAULT_POOL_SIZE
+from .factory import LLMFactory
+from .resilience import CircuitBreaker
+
+
+class ProviderRegistry:
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, proxies: dict = None,
+                 failure_threshold: int = 5, recovery_timeout: float = 60.0,
+                 prompt_caching: bool = True, gemini_cache_ttl: int = None):
+        self.pool_size = pool_size
+        self.proxies = proxies
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.prompt_caching = prompt_caching
+        self.gemini_cache_ttl = gemini_cache_ttl
+        self._providers = {}
+        self._breakers = {}
+        self._usage = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(provider: str, api_key: str, base_url: str = None, model_name: str = None):
+        return (provider.lower(), api_key, base_url or '', model_name or '')
+
+    def get(self, provider: str, api_key: str, base_url: str = None, model_name: str = None) -> LLMProvider:
+        """등록된 Provider 반환 (없으면 생성 후 등록)"""
+        key = self.make_key(provider, api_key, base_url, model_name)
+        with self._lock:
+            llm = self._providers.get(key)
+            if llm is None:
+                llm = LLMFactory.create_provider(
+                    provider=provider,
+                    api_key=api_key,
+                    base_url=base_url,
+                    model_name=model_name,
+                    session=create_session(self.pool_size, self.proxies),
+                    prompt_caching=self.prompt_caching,
+                    gemini_cache_ttl=self.gemini_cache_ttl
+                )
+                llm.usage = self._usage.setdefault(key, UsageStats())
+                self._providers[key] = llm
+            return llm
+
+    def breaker(self, provider: str, api_key: str, base_url: str = None, model_name: str = None) -> CircuitBreaker:
+        key = self.make_key(provider, api_key, base_url, model_name)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+                self._breakers[key] = breaker
+            return breaker
+
+    @staticmethod
+    def _label(key) -> str:
+        # API 키는 노출하지 않음
+        return f"{key[0]}:{key[3] or 'default'}@{key[2] or 'default'}"
+
+    def breaker_states(self) -> dict:
+        """Provider 이름/모델별 서킷 상태"""
+        with self._lock:
+            items = list(self._breakers.items())
+        return {self._label(key): breaker.snapshot() for key, breaker in items}
+
+    def usage_stats(self) -> dict:
+        """Provider 이름/모델별 토큰 사용량 및 프롬프트 캐시 적중 통계"""
+        with self._lock:
+            items = list(self._usage.items())
+        return {self._label(key): usage.snapshot() for key, usage in items}
+
+    def prewarm(self, provider: str, api_key: str, base_url: str = None, model_name: str = None) -> bool:
+        """Provider를 생성하고 엔드포인트와 연결을 미리 맺어 둠"""
+        return self.get(provider, api_key, base_url, model_name).warmup()
+
+    def invalidate(self, provider: str = None):
+        """등록된 Provider 제거 및 세션 종료 (provider 지정 시 해당 Provider만)"""
+        with self._lock:
+            keys = [k for k in self._providers if provider is None or k[0] == provider.lower()]
+            removed = [self._providers.pop(k) for k in keys]
+        for llm in removed:
+            llm.close()
+        return len(removed)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._providers)
@@ -0,0 +1,245 @@
+"""
+Resilience - LLM 호출 안정성 계층
+- RetryPolicy: 429/5xx/타임아웃 시 지터가 적용된 지수 백오프 재시도 (Retry-After 헤더 우선)
+- CircuitBreaker: Provider별 연속 실패 시 일정 시간 호출 차단 (장애 Provider를 빠르게 건너뜀)
+- ResilientProvider: 주 Provider + 설정된 순서의 대체(fallback) Provider 자동 전환
+  (각 시도 전에 Provider별 RateLimiter로 호출 속도 조절)
+- 응답한 Provider를 호출 컨텍스트(스레드/태스크)별로 기록 - 대체 Provider 응답은 주 Provider 키로 캐시하지 않음
+"""
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from typing import Iterator, List, NamedTuple, Optional
+from .base import LLMProvider, LLMError
+from .rate_limit import RateLimiter, estimate_tokens
+
+# 현재 스레드/태스크에서 마지막으로 응답한 Provider 이름 (동시 호출 간 공유되지 않음)
+_answered_by = contextvars.ContextVar('llm_answered_by', default=None)
+
+
+class RetryPolicy:
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        """attempt(0부터)번째 실패 후 대기 시간 - Retry-After가 있으면 우선 적용"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # Full jitter: 0 ~ base * 2^attempt
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """closed → (연속 실패 failure_threshold회) → open → (recovery_timeout 경과) → half_open → 성공 시 closed"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open 상태에서는 시험 호출 1건만 허용)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._half_open_in_flight = False
+            if self._half_open_in_flight:
+                return False
+            self._half_open_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._half_open_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._half_open_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self):
+        """성공/실패로 집계하지 않고 호출 종료 (half_open 시험 호출 자리만 반납)"""
+        with self._lock:
+            self._half_open_in_flight = False
+
+    def snapshot(self) -> dict:
+        state = self.state
+        with self._lock:
+            return {'state': state, 'consecutive_failures': self._failures}
+
+
+class ProviderSlot(NamedTuple):
+    name: str
+    llm: LLMProvider
+    breaker: CircuitBreaker
+    limiter: Optional[RateLimiter] = None
+
+
+class ResilientProvider(LLMProvider):
+    """
+    재시도/서킷 브레이커/대체 Provider 전환을 적용한 Provider 래퍼
+    - providers: ProviderSlot 목록 (우선순위 순서)
+    """
+
+    def __init__(self, providers: List[ProviderSlot], retry_policy: RetryPolicy = None):
+        if not providers:
+            raise ValueError("ResilientProvider requires at least one provider")
+        self.providers = providers
+        self.retry_policy = retry_policy or RetryPolicy()
+        primary = providers[0].llm
+        # 캐시 키 및 pre-warm은 주 Provider 기준 (대체 Provider 응답은 served_by_fallback으로 구분)
+        self.model = getattr(primary, 'model', None)
+        self.temperature = getattr(primary, 'temperature', None)
+        self.session = primary.session
+
+    def served_by_fallback(self) -> bool:
+        """현재 스레드/태스크의 마지막 호출에 대체 Provider가 응답했는지"""
+        name = _answered_by.get()
+        return name is not None and name != self.providers[0].name
+
+    def endpoint_url(self) -> str:
+        return self.providers[0].llm.endpoint_url()
+
+    def warmup(self, timeout: float = 5) -> bool:
+        return self.providers[0].llm.warmup(timeout)
+
+    def close(self):
+        # Provider 세션은 ProviderRegistry가 소유
+        pass
+
+    def _candidates(self):
+        """서킷이 열린 Provider는 건너뜀 (모두 열려 있으면 LLMError)"""
+        skipped = []
+        for slot in self.providers:
+            if slot.breaker.allow():
+                yield slot
+            else:
+                skipped.append(slot.name)
+        if skipped and len(skipped) == len(self.providers):
+            raise LLMError(f"모든 LLM Provider 회로 차단 중: {', '.join(skipped)}", retryable=True)
+
+    def _handle_failure(self, breaker: CircuitBreaker, error: Exception, attempt: int):
+        """실패 기록 후 재시도 대기 시간 반환 (재시도하지 않으면 None)"""
+        retryable = isinstance(error, LLMError) and error.retryable
+        if retryable:
+            breaker.record_failure()
+        else:
+            # 4xx/설정 오류 등 - 재시도로 회복되지 않으며 Provider 가용성과 무관하므로 상태를 바꾸지 않음
+            breaker.release()
+        if not retryable or breaker.state == CircuitBreaker.OPEN or attempt + 1 >= self.retry_policy.max_attempts:
+            return None
+        return self.retry_policy.delay(attempt, getattr(error, 'retry_after', None))
+
+    @staticmethod
+    def _tokens(llm: LLMProvider, system_prompt: str, user_message: str) -> int:
+        return estimate_tokens(system_prompt, user_message, getattr(llm, 'max_tokens', 0))
+
+    def generate(self, system_prompt: str, user_message: str) -> str:
+        _answered_by.set(None)
+        last_error = None
+        for name, llm, breaker, limiter in self._candidates():
+            for attempt in range(self.retry_policy.max_attempts):
+                try:
+                    if limiter is not None:
+                        limiter.acquire(self._tokens(llm, system_prompt, user_message))
+                    result = llm.generate(system_prompt, user_message)
+                    breaker.record_success()
+                    _answered_by.set(name)
+                    return result
+                except Exception as e:
+                    last_error = e
+                    delay = self._handle_failure(breaker, e, attempt)
+                    if delay is None:
+                        break
+                    time.sleep(delay)
+            print(f"LLM provider '{name}' failed: {last_error}")
+        raise last_error
+
+    async def agenerate(self, system_prompt: str, user_message: str) -> str:
+        _answered_by.set(None)
+        last_error = None
+        for name, llm, breaker, limiter in self._candidates():
+            for attempt in range(self.retry_policy.max_attempts):
+                try:
+                    if limiter is not None:
+                        await limiter.aacquire(self._tokens(llm, system_prompt, user_message))
+                    result = await llm.agenerate(system_prompt, user_message)
+                    breaker.record_success()
+                    _answered_by.set(name)
+                    return result
+                except asyncio.CancelledError:
+                    # 호출 측 취소 - 결과 없이 종료되므로 half_open 시험 호출 자리만 반납
+                    breaker.release()
+                    raise
+                except Exception as e:
+                    last_error = e
+                    delay = self._handle_failure(breaker, e, attempt)
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+            print(f"LLM provider '{name}' failed: {last_error}")
+        raise last_error
+
+    def stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """첫 조각을 받기 전까지만 재시도/전환 (이미 전달된 조각은 되돌릴 수 없음)"""
+        _answered_by.set(None)
+        last_error = None
+        for name, llm, breaker, limiter in self._candidates():
+            for attempt in range(self.retry_policy.max_attempts):
+                started = False
+                settled = False  # 성공/실패가 브레이커에 기록되었는지
+                try:
+                    if limiter is not None:
+                        limiter.acquire(self._tokens(llm, system_prompt, user_message))
+                    for chunk in llm.stream(system_prompt, user_message):
+                        started = True
+                        yield chunk
+                    settled = True
+                    breaker.record_success()
+                    _answered_by.set(name)
+                    return
+                except Exception as e:
+                    settled = True
+                    last_error = e
+                    delay = self._handle_failure(breaker, e, attempt)
+                    if started:
+                        raise
+                    if delay is None:
+                        break
+                    time.sleep(delay)
+                finally:
+                    if not settled:
+                        # 소비 측이 스트림을 중단 (클라이언트 연결 종료, close() 등 GeneratorExit)
+                        # - half_open 시험 호출 자리를 반납하여 브레이커가 멈춰 있지 않게 함
+                        breaker.release()
+            print(f"LLM provider '{name}' failed: {last_error}")
+        raise last_error
@@ -0,0 +1,95 @@
+"""
+Prompt Store - 프롬프트 템플릿 캐시
+- 프롬프트 파일(Quality.md, scoring_criteria.md)을 한 번만 읽어 메모리에 보관
+- 파일 mtime/크기 변경 시 자동 재로드 (개발 중 수정 반영, PyInstaller _MEIPASS 경로 동일 적용)
+- 프로젝트 컨텍스트(Developer/System/Client) 조합별 렌더링 결과 메모이제이션
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class PromptStore:
+
+    def __init__(self, check_interval: float = 2.0, max_rendered: int = 32):
+        # check_interval 초 이내의 재요청은 stat 없이 메모리 값을 그대로 사용
+        self.check_interval = check_interval
+        self.max_rendered = max_rendered
+        self._templates = {}  # path -> (signature, text, checked_at)
+        self._rendered = OrderedDict()  # (path, signature, context) -> text
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path: str):
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self, path: str):
+        """(signature, text) 반환 - 변경된 경우에만 파일을 다시 읽음"""
+        path = str(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._templates.get(path)
+            if entry is not None and now - entry[2] < self.check_interval:
+                return entry[0], entry[1]
+
+        signature = self._signature(path)
+        with self._lock:
+            entry = self._templates.get(path)
+            if entry is not None and entry[0] == signature:
+                self._templates[path] = (signature, entry[1], now)
+                return signature, entry[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        with self._lock:
+            self._templates[path] = (signature, text, now)
+            # 이전 버전 템플릿으로 렌더링된 결과 폐기
+            for key in [k for k in self._rendered if k[0] == path and k[1] != signature]:
+                del self._rendered[key]
+        return signature, text
+
+    def get(self, path) -> str:
+        return self._load(path)[1]
+
+    def render_quality_prompt(self, path, project: dict) -> str:
+        """Quality 프롬프트에 프로젝트 컨텍스트를 주입한 결과 반환 (조합별 캐시)"""
+        developer = (project.get('developer') or '').strip()
+        system = (project.get('system') or '').strip()
+        client = (project.get('client') or '').strip()
+
+        signature, template = self._load(path)
+        key = (str(path), signature, (developer, system, client))
+        with self._lock:
+            rendered = self._rendered.get(key)
+            if rendered is not None:
+                self._rendered.move_to_end(key)
+                return rendered
+
+        project_context = f"""
+- **Developer**: {developer}
+- **Target System**: {system}
+- **Client**: {client}
+"""
+        rendered = template.replace('{PROJECT_CONTEXT}', project_context)
+        rendered = rendered.replace('{Developer}', developer if developer else 'Supplier')
+        rendered = rendered.replace('{System}', system if system else 'System')
+        rendered = rendered.replace('{Client}', client if client else 'Client')
+
+        with self._lock:
+            self._rendered[key] = rendered
+            while len(self._rendered) > self.max_rendered:
+                self._rendered.popitem(last=False)
+        return rendered
+
+    def clear_rendered(self):
+        """렌더링 결과만 폐기 (프로젝트 컨텍스트 변경 시 이전 조합 정리)"""
+        with self._lock:
+            self._rendered.clear()
+
+    def invalidate(self):
+        """캐시 전체 폐기 (다음 요청 시 파일 재로드)"""
+        with self._lock:
+            self._templates.clear()
+            self._rendered.clear()
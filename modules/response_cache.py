@@ -0,0 +1,221 @@
+"""
+Response Cache - LLM 응답 캐시 (content-addressed)
+- provider/model/temperature/system prompt/user message 해시를 키로 사용
+- 메모리 LRU 계층 + ~/.Codelia SQLite 영구 계층 (history.db의 llm_cache 테이블)
+- 영구 계층은 DatabaseService의 스레드별 연결(WAL)을 함께 사용
+- 디스크 적중은 읽기만 수행 (last_access는 모아서 일괄 기록), 항목 수는 메모리에서 추적
+- TTL 및 항목 수/크기 기반 제거, 적중/실패 통계 제공
+- 만료 항목은 시작 시 및 저장 시 purge_interval마다 삭제 (한 번에 purge_batch_size개씩, 조회 경로는 읽기만 수행)
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+
+    def __init__(self, db_service, max_memory_entries: int = 256, max_memory_bytes: int = 16 * 1024 * 1024,
+                 max_disk_entries: int = 5000, ttl_seconds: int = 7 * 24 * 3600,
+                 access_flush_size: int = 64, purge_interval: float = 60.0, purge_batch_size: int = 1000):
+        self.db_service = db_service
+        self.max_memory_entries = max_memory_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.access_flush_size = max(1, access_flush_size)
+        self.purge_interval = purge_interval
+        self.purge_batch_size = max(1, purge_batch_size)
+
+        self._memory = OrderedDict()  # key -> (response, created_at, size)
+        self._memory_bytes = 0
+        self._pending_access = {}  # key -> 마지막 디스크 적중 시각 (기록 대기)
+        self._disk_entries = 0
+        self._last_purge = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'bypassed': 0, 'evictions': 0}
+        self._init_db()
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature, system_prompt: str, user_message: str) -> str:
+        payload = json.dumps([provider, model, temperature, system_prompt, user_message], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _init_db(self):
+        with self.db_service.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache(created_at)")
+            # 시작 시 한 번만 세고 이후에는 삽입/삭제 시 증감
+            self._disk_entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        # 이전 실행에서 남은 만료 항목 정리 (저장이 없던 실행 동안 쌓인 행 포함)
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """만료된 디스크 항목을 purge_batch_size개씩 모두 삭제 (반환: 삭제한 행 수)"""
+        total = 0
+        while True:
+            with self.db_service.connection() as conn:
+                removed = self._purge_expired(conn, time.time())
+            total += removed
+            if removed < self.purge_batch_size:
+                return total
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str):
+        """캐시된 응답 반환 (없거나 만료된 경우 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    return entry[0]
+                self._remove_memory(key)
+
+        conn = self.db_service.connection()
+        row = conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        # 만료된 행은 적중으로 보지 않고, 다음 정리(_purge_expired)에서 삭제
+        if row is not None and self._expired(row[1], now):
+            row = None
+
+        with self._lock:
+            if row is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._put_memory(key, row[0], row[1])
+            self._pending_access[key] = now
+            flush = len(self._pending_access) >= self.access_flush_size
+        if flush:
+            with conn:
+                self._flush_access(conn)
+        return row[0]
+
+    def set(self, key: str, response: str):
+        now = time.time()
+        with self._lock:
+            self._put_memory(key, response, now)
+            self._stats['stores'] += 1
+
+        size = len(response.encode('utf-8'))
+        with self.db_service.connection() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO llm_cache (key, response, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now)
+            ).rowcount
+            if not inserted:
+                conn.execute(
+                    "UPDATE llm_cache SET response = ?, size = ?, created_at = ?, last_access = ? WHERE key = ?",
+                    (response, size, now, now, key)
+                )
+            with self._lock:
+                self._disk_entries += inserted
+            self._flush_access(conn)
+            self._evict_disk(conn, now)
+
+    def discard(self, key: str):
+        """잘못된 응답 등 특정 항목 제거"""
+        with self._lock:
+            self._remove_memory(key)
+            self._pending_access.pop(key, None)
+        with self.db_service.connection() as conn:
+            removed = conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,)).rowcount
+        with self._lock:
+            self._disk_entries -= removed
+
+    def record_bypass(self):
+        with self._lock:
+            self._stats['bypassed'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._pending_access.clear()
+        with self.db_service.connection() as conn:
+            conn.execute("DELETE FROM llm_cache")
+        with self._lock:
+            self._disk_entries = 0
+
+    def stats(self) -> dict:
+        disk_bytes = self.db_service.connection().execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+            stats['memory_bytes'] = self._memory_bytes
+            stats['disk_entries'] = self._disk_entries
+        hits = stats['memory_hits'] + stats['disk_hits']
+        lookups = hits + stats['misses']
+        stats['hits'] = hits
+        stats['hit_rate'] = round(hits / lookups, 3) if lookups else 0.0
+        stats['upstream_calls_saved'] = hits
+        stats['disk_bytes'] = disk_bytes
+        return stats
+
+    # --- internal (호출 측에서 self._lock 보유) ---
+
+    def _put_memory(self, key, response, created_at):
+        self._remove_memory(key)
+        size = len(response.encode('utf-8'))
+        if size > self.max_memory_bytes:
+            return
+        self._memory[key] = (response, created_at, size)
+        self._memory_bytes += size
+        while len(self._memory) > self.max_memory_entries or self._memory_bytes > self.max_memory_bytes:
+            old_key = next(iter(self._memory))
+            self._remove_memory(old_key)
+            self._stats['evictions'] += 1
+
+    def _remove_memory(self, key):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[2]
+
+    # --- internal (호출 측의 쓰기 트랜잭션 안에서 실행) ---
+
+    def _flush_access(self, conn):
+        """모아 둔 디스크 적중 시각을 한 번에 기록 (LRU 제거 순서에 반영)"""
+        with self._lock:
+            pending, self._pending_access = self._pending_access, {}
+        if pending:
+            conn.executemany("UPDATE llm_cache SET last_access = ? WHERE key = ?",
+                             [(accessed, key) for key, accessed in pending.items()])
+
+    def _purge_expired(self, conn, now):
+        """만료 항목을 최대 purge_batch_size개 삭제 (created_at 인덱스 사용, 쓰기 트랜잭션을 짧게 유지)"""
+        if self.ttl_seconds is None:
+            return 0
+        self._last_purge = now
+        removed = conn.execute(
+            "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache WHERE created_at < ? LIMIT ?)",
+            (now - self.ttl_seconds, self.purge_batch_size)
+        ).rowcount
+        with self._lock:
+            self._disk_entries -= removed
+        return removed
+
+    def _evict_disk(self, conn, now):
+        if now - self._last_purge >= self.purge_interval:
+            self._purge_expired(conn, now)
+        with self._lock:
+            overflow = self._disk_entries - self.max_disk_entries
+        if overflow > 0:
+            removed = conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            ).rowcount
+            with self._lock:
+                self._disk_entries -= removed
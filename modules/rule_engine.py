@@ -0,0 +1,211 @@
+"""
+Local Rule Engine - 기계적으로 판정 가능한 INCOSE 규칙의 로컬 사전 채점
+- 어휘/기호 패턴으로 판정되는 규칙만 담당 (P2, R7-R10, R16, R17, R19-R21, R32, R33)
+- 미리 컴파일된 정규식만 사용하므로 LLM/네트워크 없이 즉시 계산 (오프라인 동작)
+- 결과 형식은 LLM 채점 결과와 동일: {rule: {'score', 'reason', 'source': 'local'}}
+- 문법/의미 판단이 필요한 규칙(R12-R15, R18, R22, R23 등)은 LLM 채점에 남김
+"""
+import re
+from typing import Dict, List, Tuple
+
+_I = re.IGNORECASE
+
+# P2 - 조동사
+_MANDATORY_MODAL = re.compile(r"\b(shall|must)\b|\S*[어아여해돼]야\s*(한다|함|합니다|된다)", _I)
+_WEAK_MODAL = re.compile(r"\b(should|may|might|could)\b|것이\s*(좋다|바람직)|권장", _I)
+_DESCRIPTIVE = re.compile(r"\bwill\b|(한다|된다|합니다|됩니다|함|됨)\s*[.。]?\s*$", _I)
+
+# R7 - 모호한 용어
+_VAGUE_TERMS = re.compile(
+    r"\b(quickly|fast|rapid(ly)?|adequate(ly)?|appropriate(ly)?|user[- ]friendly|easy|easily|efficient(ly)?|"
+    r"flexible|robust|sufficient(ly)?|reasonabl[ey]|approximately|several|many|few|minimal|"
+    r"maximi[sz]e|minimi[sz]e|optimal(ly)?|seamless(ly)?|significant(ly)?|normally|typically)\b|"
+    r"빠르게|신속|적절|충분|효율적|용이|쉽게|최소화|최대화|최적|즉시|대략|일부|여러|다양한|원활|안정적|편리|사용자\s*친화|보장",
+    _I
+)
+# R8 - 회피 표현
+_ESCAPE_CLAUSES = re.compile(
+    r"\b(if possible|as far as possible|where possible|where applicable|if necessary|if needed|"
+    r"as appropriate|to the extent)\b|가능하면|가능한\s*(경우|한)|필요\s*시|필요한\s*경우|가급적|적용\s*가능한\s*경우",
+    _I
+)
+# R9 - 열린 표현
+_OPEN_ENDED = re.compile(
+    r"\betc\b\.?|\band so on\b|\bincluding but not limited to\b|\bsuch as\b|"
+    r"(?:^|[\s,])등(?=$|[\s.,을를이가의과와에])|등등|기타|포함하되",
+    _I
+)
+# R10 - 불필요한 부정사
+_SUPERFLUOUS_INFINITIVES = re.compile(r"\bbe (able|capable) (to|of)\b|수\s*있어야", _I)
+
+# R16 - 부정 표현 (Unwanted Behavior 패턴의 "하지 않아야 한다"/"shall not"은 허용)
+_DOUBLE_NEGATIVE = re.compile(
+    r"\bnot\s+(un|in|im|non)\w+|\bnot\s+\w+\s+no\b|(않|없|아니)지\s*(않|못)|않을\s*수\s*없|없지\s*않", _I
+)
+_ALLOWED_NEGATIVE = re.compile(r"\b(shall|must) not\b|않아야\s*(한다|함|합니다)", _I)
+_PROHIBITIVE = re.compile(r"(해|하여|되어)서?는\s*안\s*(된다|됨|됩니다)|해선\s*안", _I)
+# 부정 구문 단위로만 판정 ('오류 없이', '없는 경우' 같은 부사/관형 표현과 '안전' 등은 제외)
+_NEGATIVE = re.compile(
+    r"\b(not|no|never|cannot)\b|지\s*(않|못)|수\s*없|없(다|음|어야|습니다|으며|고)|못\s*(하|한|함|할)|"
+    r"아니(다|며|고|어야)|아님|아닌|(?:^|\s)안\s+(하|한|함|할|되|된|됨|될)",
+    _I
+)
+
+# R17 - 사선 기호 (URL, 단위(km/h, m/s 등) 제외)
+_URL = re.compile(r"https?://\S+", _I)
+_UNIT_SLASH = re.compile(r"\d\s*[a-zμ°%]+/[a-z]+", _I)
+_SLASH = re.compile(r"/")
+
+# R19 - 결합어
+_COMBINATORS = re.compile(
+    r"\b(and/or|and|or|then|unless|but|as well as)\b|및|그리고|또는|혹은|이거나|거나|그\s*후|그\s*다음|동시에",
+    _I
+)
+# R20 - 목적 구문
+_PURPOSE_PHRASES = re.compile(
+    r"\b(in order to|so that|so as to|for the purpose of)\b|(하기|되기)\s*위(해|하여)|위해서|목적으로", _I
+)
+# R21 - 괄호
+_PARENTHESES = re.compile(r"[(（]")
+
+# R32 - 보편 한정어
+_EACH = re.compile(r"\beach\b|각각|각\s|개별", _I)
+_UNIVERSAL = re.compile(r"\b(all|every|any|both)\b|모든|전체|전부|어떤|임의의", _I)
+
+# R33 - 값의 범위 (요구사항 ID와 날짜의 숫자/하이픈은 제외)
+# (뒤에 조사가 붙어도 제외되도록 끝은 \b 대신 숫자가 아닌 위치로 판정)
+_REQ_ID = re.compile(r"\b[A-Z]+(-[A-Z]+)*-\d+(-\d+)*(?!\d)")
+_DATE = re.compile(r"(?<!\d)\d{4}[-./]\d{1,2}[-./]\d{1,2}(?!\d)")
+_VALUE = r"\d+(?:[.,]\d+)?"
+_NUMBER = re.compile(_VALUE)
+_UNIT = r"(?:%|°[CF]?|[a-zμ]{1,4}\b|초|분|시간|일|개|건|명|회|바이트|원)"
+# '-'/'to' 범위는 단위나 공백이 함께 있을 때만 인정 (ID/코드/날짜의 'N-N' 오탐 방지)
+_TOLERANCE = re.compile(
+    r"±|\+/-|\bplus or minus\b|\bwithin\b|\bat (least|most)\b|\bno (more|less) than\b|\bbetween\b|"
+    r"\bup to\b|\bminimum\b|\bmaximum\b|"
+    + _VALUE + r"\s*[~～–]\s*" + _VALUE + "|"
+    + _VALUE + r"\s+(-|to)\s+" + _VALUE + "|"
+    + _VALUE + r"\s*" + _UNIT + r"\s*(-|to)\s*" + _VALUE + "|"
+    + _VALUE + r"\s*(-|to)\s*" + _VALUE + r"\s*" + _UNIT + "|"
+    r"이내|이하|이상|미만|초과|최소|최대|사이|범위",
+    _I
+)
+
+
+def _matches(pattern, text: str) -> List[str]:
+    return [m.group(0).strip() for m in pattern.finditer(text)]
+
+
+def _quote(terms: List[str]) -> str:
+    # 중복 제거 후 최대 5개만 표시
+    return ', '.join(f"'{t}'" for t in list(dict.fromkeys(terms))[:5])
+
+
+class LocalRuleEngine:
+
+    RULES = ('P2', 'R7', 'R8', 'R9', 'R10', 'R16', 'R17', 'R19', 'R20', 'R21', 'R32', 'R33')
+
+    def __init__(self):
+        self._checks = {
+            'P2': self._check_modal,
+            'R7': self._check_vague_terms,
+            'R8': self._check_escape_clauses,
+            'R9': self._check_open_ended,
+            'R10': self._check_superfluous_infinitives,
+            'R16': self._check_negation,
+            'R17': self._check_oblique,
+            'R19': self._check_combinators,
+            'R20': self._check_purpose_phrases,
+            'R21': self._check_parentheses,
+            'R32': self._check_universal_qualification,
+            'R33': self._check_range_of_values,
+        }
+
+    def evaluate(self, text: str) -> Dict[str, Dict]:
+        """로컬 판정 규칙 전체 채점"""
+        text = (text or '').strip()
+        scores = {}
+        for rule, check in self._checks.items():
+            score, reason = check(text)
+            scores[rule] = {'score': score, 'reason': reason, 'source': 'local'}
+        return scores
+
+    # --- 규칙별 판정 (score, reason) ---
+
+    def _check_modal(self, text: str) -> Tuple[int, str]:
+        found = _matches(_MANDATORY_MODAL, text)
+        if found:
+            return 5, f"의무 조동사 사용: {_quote(found)}"
+        found = _matches(_WEAK_MODAL, text)
+        if found:
+            return 3, f"약한 조동사 사용: {_quote(found)}"
+        if _DESCRIPTIVE.search(text):
+            return 2, "의무 표현('해야 한다') 대신 서술형 사용"
+        return 1, "조동사가 없거나 모호함"
+
+    @staticmethod
+    def _count_score(found: List[str], label: str, thresholds: Tuple[int, ...]) -> Tuple[int, str]:
+        """발견 개수에 따른 점수 - thresholds[i]개 이하이면 (5, 4, 3, 2) 중 i번째 점수, 초과 시 1점"""
+        if not found:
+            return 5, f"{label} 없음"
+        for score, limit in zip((5, 4, 3, 2), thresholds):
+            if len(found) <= limit:
+                return score, f"{label} {len(found)}회 사용: {_quote(found)}"
+        return 1, f"{label} 과다 사용({len(found)}회): {_quote(found)}"
+
+    def _check_vague_terms(self, text):
+        return self._count_score(_matches(_VAGUE_TERMS, text), "모호한 용어", (0, 0, 2))
+
+    def _check_escape_clauses(self, text):
+        return self._count_score(_matches(_ESCAPE_CLAUSES, text), "회피 표현", (0, 0, 1))
+
+    def _check_open_ended(self, text):
+        return self._count_score(_matches(_OPEN_ENDED, text), "열린 표현", (0, 0, 1))
+
+    def _check_superfluous_infinitives(self, text):
+        return self._count_score(_matches(_SUPERFLUOUS_INFINITIVES, text), "불필요한 부정사 표현", (0, 1, 2))
+
+    def _check_negation(self, text):
+        found = _matches(_DOUBLE_NEGATIVE, text)
+        if found:
+            return 1, f"이중 부정 사용: {_quote(found)}"
+        found = _matches(_PROHIBITIVE, text)
+        if found:
+            return 3, f"금지 표현 사용: {_quote(found)}"
+        remaining = _ALLOWED_NEGATIVE.sub(' ', text)
+        found = _matches(_NEGATIVE, remaining)
+        if found:
+            return 3, f"불필요한 부정 표현: {_quote(found)}"
+        return 5, "긍정 표현만 사용 (Unwanted Behavior 부정 허용)"
+
+    def _check_oblique(self, text):
+        stripped = _UNIT_SLASH.sub(' ', _URL.sub(' ', text))
+        return self._count_score(_matches(_SLASH, stripped), "'/' 기호", (0, 1, 3))
+
+    def _check_combinators(self, text):
+        return self._count_score(_matches(_COMBINATORS, text), "결합어", (0, 0, 1, 2))
+
+    def _check_purpose_phrases(self, text):
+        return self._count_score(_matches(_PURPOSE_PHRASES, text), "목적 구문", (0, 0, 1, 2))
+
+    def _check_parentheses(self, text):
+        return self._count_score(_matches(_PARENTHESES, text), "괄호", (0, 1, 3))
+
+    def _check_universal_qualification(self, text):
+        found = _matches(_EACH, text)
+        if found:
+            return 5, f"개별 한정어 사용: {_quote(found)}"
+        found = _matches(_UNIVERSAL, text)
+        if found:
+            return 3, f"모호한 보편 한정어 사용('each/각' 권장): {_quote(found)}"
+        return 0, "한정어 불필요 (N/A)"
+
+    def _check_range_of_values(self, text):
+        stripped = _DATE.sub(' ', _REQ_ID.sub(' ', text))
+        numbers = _matches(_NUMBER, stripped)
+        if not numbers:
+            return 0, "정량 값 없음 (N/A)"
+        found = _matches(_TOLERANCE, stripped)
+        if found:
+            return 5, f"값의 범위/허용오차 정의: {_quote(found)}"
+        return 3, f"범위 없이 단일 값만 사용: {_quote(numbers)}"
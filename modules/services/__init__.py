@@ -1,3 +1,5 @@
 from .config_service import ConfigService
 from .analysis_service import AnalysisService
 from .database_service import DatabaseService
+from .import_service import ImportService, RequirementReader
+from .job_service import JobService
@@ -3,75 +3,422 @@ Analysis Service - 비즈니스 로직 계층
 - 요구사항 평가 및 개선의 핵심 로직 담당
 - AI Client, Evaluator, Improver를 조합하여 전체 워크플로우 관리
 - 프로젝트 컨텍스트 주입 및 점수 비교 처리
+- 원본 평가(스레드 풀)와 개선 호출(요청 스레드)을 동시 실행 (concurrent 파이프라인)
+- AI Client/Provider 인스턴스를 요청 간 재사용 (keep-alive 커넥션 풀, 설정 변경 구독 시 폐기)
+- LLM 호출 재시도/서킷 브레이커/대체 Provider 전환 (ResilientProvider)
+- Provider/API 키별 RPM/TPM 속도 제한 (프로세스 전체 공유)
+- 프롬프트는 PromptStore에서 캐시된 템플릿/렌더링 결과를 사용
+- 다수 요구사항 일괄 평가/개선 (동시 실행 수 제한, 입력 순서/완료 순서 스트리밍)
+- 평가/개선 단계별 이벤트 스트리밍 (SSE 응답용)
+- asyncio 경로 (aevaluate/aimprove/aevaluate_batch): 하나의 이벤트 루프에서 다수 평가 동시 처리
+- 평가 모드: full(전체 루브릭 AI 채점) / fast(로컬 규칙 엔진 + 나머지 규칙만 AI 채점, API 키 없이도 동작)
+  / sharded(카테고리별 동시 AI 채점, 전용 스레드 풀 사용)
 """
+import asyncio
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from modules import AIClient, RequirementImprover, RequirementEvaluator
+from modules.evaluator import EVALUATE_MODES
+from modules.rule_engine import LocalRuleEngine
+from modules.llm import ProviderRegistry, ProviderSlot, ResilientProvider, RetryPolicy, RateLimiterRegistry, async_http
+from modules.prompt_store import PromptStore
 import config
 
+PIPELINE_MODES = ('concurrent', 'sequential')
+BATCH_ORDERS = ('input', 'completion')
+
 class AnalysisService:
-    def __init__(self, config_service):
+    def __init__(self, config_service, max_workers: int = config.ANALYSIS_MAX_WORKERS, response_cache=None):
         self.config_service = config_service
+        self.response_cache = response_cache
+        self.prompt_store = PromptStore(check_interval=config.PROMPT_RELOAD_CHECK_INTERVAL)
+        # 요청 간 공유되는 bounded executor (동시 LLM 호출 수 제한)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis')
+        # sharded 평가의 카테고리 호출용 (analysis 풀 작업 안에서 제출되므로 별도 풀 - 교착 방지)
+        self.shard_executor = ThreadPoolExecutor(max_workers=config.EVALUATE_SHARD_WORKERS, thread_name_prefix='shard')
+        self.provider_registry = ProviderRegistry(
+            pool_size=config.HTTP_POOL_SIZE,
+            proxies=config.PROXY_SETTINGS if config.USE_PROXY else None,
+            failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=config.CIRCUIT_RECOVERY_SECONDS,
+            prompt_caching=config.LLM_PROMPT_CACHING,
+            gemini_cache_ttl=config.GEMINI_CACHED_CONTENT_TTL
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=config.RETRY_MAX_ATTEMPTS,
+            base_delay=config.RETRY_BASE_DELAY,
+            max_delay=config.RETRY_MAX_DELAY
+        )
+        self.rate_limiters = RateLimiterRegistry()
+        self.rule_engine = LocalRuleEngine()
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        async_http.configure(config.ASYNC_HTTP_POOL_SIZE, proxies=config.PROXY_SETTINGS if config.USE_PROXY else None)
+        # 설정 저장/외부 수정 시 Client/Provider 및 렌더링된 프롬프트 갱신
+        config_service.subscribe(self._on_config_change)
         
     def _create_ai_client(self):
         settings = self.config_service.get_provider_settings()
         if not settings['api_key']:
             raise ValueError(f"API key for {settings['provider']} not found")
-            
-        return AIClient(
-            provider=settings['provider'],
-            api_key=settings['api_key'],
-            model_name=None,
-            base_url=settings['base_url'] if settings['base_url'] else None
+
+        # 주 Provider + 대체 Provider (우선순위 순서)
+        chain = [settings] + self.config_service.get_fallback_settings()
+        keys = tuple(
+            ProviderRegistry.make_key(s['provider'], s['api_key'], s['base_url'] or None, s['model_name'])
+            for s in chain
+        )
+        # 설정은 잠금 밖에서 읽음 (설정 변경 알림 → invalidate_clients와 잠금 순서가 엇갈리지 않도록)
+        rate_limits = [self.config_service.get_rate_limits(s['provider']) for s in chain]
+        with self._clients_lock:
+            client = self._clients.get(keys)
+            if client is None:
+                providers = []
+                for s, limits in zip(chain, rate_limits):
+                    base_url = s['base_url'] if s['base_url'] else None
+                    providers.append(ProviderSlot(
+                        s['provider'],
+                        self.provider_registry.get(s['provider'], s['api_key'], base_url, s['model_name']),
+                        self.provider_registry.breaker(s['provider'], s['api_key'], base_url, s['model_name']),
+                        self.rate_limiters.get(s['provider'], s['api_key'], limits['rpm'], limits['tpm'])
+                    ))
+                client = AIClient(
+                    provider=settings['provider'],
+                    api_key=settings['api_key'],
+                    model_name=settings['model_name'],
+                    base_url=settings['base_url'] if settings['base_url'] else None,
+                    llm=ResilientProvider(providers, self.retry_policy),
+                    cache=self.response_cache
+                )
+                self._clients[keys] = client
+            return client
+
+    def invalidate_clients(self):
+        """설정(자격 증명) 변경 시 캐시된 Client/Provider 폐기"""
+        with self._clients_lock:
+            self._clients.clear()
+        self.provider_registry.invalidate()
+
+    def _on_config_change(self, previous, current):
+        """프로젝트 컨텍스트만 바뀐 경우 Provider 연결은 유지"""
+        if previous.get('project') != current.get('project'):
+            self.prompt_store.clear_rendered()
+        provider_keys = (set(previous) | set(current)) - {'project'}
+        if any(previous.get(key) != current.get(key) for key in provider_keys):
+            self.invalidate_clients()
+
+    def prewarm(self):
+        """현재 설정의 Provider 연결을 백그라운드에서 미리 맺음 (Provider 모듈 import도 시작 경로에서 제외)"""
+        return self.executor.submit(self._prewarm)
+
+    def _prewarm(self):
+        try:
+            client = self._create_ai_client()
+        except ValueError:
+            return False  # API 키 미설정 시 건너뜀
+        return client.llm.warmup()
+
+    def _create_evaluator(self, mode):
+        """평가 모드 검증 후 Evaluator 생성 (fast 모드는 API 키가 없으면 로컬 채점만 수행)"""
+        mode = mode or config.EVALUATE_DEFAULT_MODE
+        if mode not in EVALUATE_MODES:
+            raise ValueError(f"Unsupported evaluate mode: {mode}")
+        try:
+            ai_client = self._create_ai_client()
+        except ValueError:
+            if mode != 'fast':
+                raise
+            ai_client = None
+        scoring_prompt = self.prompt_store.get(config.SCORING_PROMPT_FILE)
+        return mode, RequirementEvaluator(
+            ai_client, scoring_prompt, self.rule_engine,
+            shard_executor=self.shard_executor,
+            shard_retries=config.EVALUATE_SHARD_RETRIES,
+            recover_missing=config.EVALUATE_RECOVER_MISSING
         )
 
-    def evaluate(self, text):
+    def evaluate(self, text, use_cache=True, mode=None):
         if not text:
             raise ValueError("No text provided")
             
-        ai_client = self._create_ai_client()
-        scoring_prompt = ai_client.load_prompt(config.SCORING_PROMPT_FILE)
-        evaluator = RequirementEvaluator(ai_client, scoring_prompt)
-        
-        return evaluator.evaluate(text)
+        mode, evaluator = self._create_evaluator(mode)
+        return evaluator.evaluate(text, use_cache, mode)
+
+    def evaluate_batch(self, texts, concurrency=None, order='input', use_cache=True, mode=None):
+        """
+        여러 요구사항을 동시에 평가하여 결과를 하나씩 yield
+        - texts: 요구사항 문자열 iterable (지연 소비, 동시 실행 중인 항목만 메모리에 유지)
+        - order: 'input' = 입력 순서대로, 'completion' = 완료되는 대로
+        - 각 결과: {'index', 'result'} 또는 {'index', 'error'} (개별 실패가 전체를 중단하지 않음)
+        """
+        if order not in BATCH_ORDERS:
+            raise ValueError(f"Unsupported batch order: {order}")
+        concurrency = max(1, min(int(concurrency or config.BATCH_DEFAULT_CONCURRENCY), config.BATCH_MAX_CONCURRENCY))
+
+        # 배치 전체에서 Client/프롬프트/Evaluator 한 번만 생성
+        mode, evaluator = self._create_evaluator(mode)
+
+        def run(index, text):
+            if not text or not str(text).strip():
+                return {'index': index, 'error': 'No text provided'}
+            try:
+                return self._batch_item(index, evaluator.evaluate(text, use_cache, mode))
+            except Exception as e:
+                return {'index': index, 'error': str(e)}
+
+        return self._run_bounded(run, texts, concurrency, order)
 
-    def improve(self, text, pattern_data):
+    def improve_batch(self, texts, pattern_data=None, concurrency=None, order='input', pipeline=None, use_cache=True):
+        """
+        여러 요구사항을 동시에 개선(원본 평가 + 개선 + 개선본 평가)하여 결과를 하나씩 yield
+        - 결과 형식/순서 옵션은 evaluate_batch와 동일 (result는 /api/improve 응답 형식)
+        - 각 항목의 원본 평가는 배치 전용 풀(concurrency 크기)에서 실행, 개선/개선본 평가는 항목 스레드에서 실행
+        """
+        if order not in BATCH_ORDERS:
+            raise ValueError(f"Unsupported batch order: {order}")
+        concurrency = max(1, min(int(concurrency or config.BATCH_DEFAULT_CONCURRENCY), config.BATCH_MAX_CONCURRENCY))
+        pattern_data = pattern_data or {}
+        # 설정/API 키 오류는 배치 시작 전에 확인
+        self._create_ai_client()
+        # 항목별 원본 평가용 배치 전용 풀 (공유 analysis 풀에서 다른 요청과 경쟁하지 않음)
+        original_executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch-original')
+
+        def run(index, text):
+            if not text or not str(text).strip():
+                return {'index': index, 'error': 'No text provided'}
+            try:
+                return {'index': index, 'result': self.improve(text, pattern_data, pipeline, use_cache, original_executor)}
+            except Exception as e:
+                return {'index': index, 'error': str(e)}
+
+        def items():
+            try:
+                yield from self._run_bounded(run, texts, concurrency, order)
+            finally:
+                original_executor.shutdown(wait=False, cancel_futures=True)
+
+        return items()
+
+    def _run_bounded(self, run, texts, concurrency, order):
+        """run(index, text)을 최대 concurrency개씩 실행 (입력은 필요한 만큼만 소비, 미출력 결과는 concurrency * 2개까지만 보관)"""
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch')
+        pending = {}   # future -> index
+        finished = {}  # index -> item (input 순서 출력 대기)
+        next_index = 0
+        items = enumerate(texts)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) + len(finished) < concurrency * 2 and len(pending) < concurrency:
+                    try:
+                        index, text = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(run, index, text)] = index
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    item = future.result()
+                    if order == 'completion':
+                        yield item
+                    else:
+                        finished[index] = item
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _batch_item(index, result):
+        if result.get('error'):
+            return {'index': index, 'error': result['error'], 'result': result}
+        return {'index': index, 'result': result}
+
+    # --- asyncio 경로 ---
+
+    async def aevaluate(self, text, use_cache=True, mode=None):
         if not text:
             raise ValueError("No text provided")
+
+        mode, evaluator = self._create_evaluator(mode)
+        return await evaluator.aevaluate(text, use_cache, mode)
+
+    async def aevaluate_batch(self, texts, concurrency=None, use_cache=True, mode=None):
+        """
+        evaluate_batch의 비동기 버전 - 입력 순서대로 결과 목록 반환
+        스레드 대신 코루틴으로 동시 실행하므로 concurrency 상한은 BATCH_MAX_CONCURRENCY를 따르지 않음
+        """
+        semaphore = asyncio.Semaphore(max(1, int(concurrency or config.BATCH_DEFAULT_CONCURRENCY)))
+        mode, evaluator = self._create_evaluator(mode)
+
+        async def run(index, text):
+            if not text or not str(text).strip():
+                return {'index': index, 'error': 'No text provided'}
+            async with semaphore:
+                try:
+                    return self._batch_item(index, await evaluator.aevaluate(text, use_cache, mode))
+                except Exception as e:
+                    return {'index': index, 'error': str(e)}
+
+        return await asyncio.gather(*(run(i, t) for i, t in enumerate(texts)))
+
+    async def aimprove(self, text, pattern_data, pipeline=None, use_cache=True):
+        """improve의 비동기 버전 (concurrent 파이프라인은 asyncio.gather로 실행)"""
+        pipeline, improver, evaluator = self._prepare_improve(text, pipeline)
+
+        timings = {}
+        started = time.perf_counter()
+
+        if pipeline == 'concurrent':
+            async def improve_then_score():
+                improved_result = await self._atimed(timings, 'improvement', improver.aimprove(text, pattern_data, use_cache))
+                improved_scores = await self._atimed(timings, 'improved_evaluation', evaluator.aevaluate(improved_result['improved'], use_cache))
+                return improved_result, improved_scores
+
+            original_scores, (improved_result, improved_scores) = await asyncio.gather(
+                self._atimed(timings, 'original_evaluation', evaluator.aevaluate(text, use_cache)),
+                improve_then_score()
+            )
+        else:
+            original_scores = await self._atimed(timings, 'original_evaluation', evaluator.aevaluate(text, use_cache))
+            improved_result = await self._atimed(timings, 'improvement', improver.aimprove(text, pattern_data, use_cache))
+            improved_scores = await self._atimed(timings, 'improved_evaluation', evaluator.aevaluate(improved_result['improved'], use_cache))
+
+        return self._build_improve_response(
+            evaluator, pipeline, original_scores, improved_result, improved_scores, timings, started
+        )
+
+    def evaluate_stream(self, text, use_cache=True, mode=None):
+        """스트리밍 평가 - (fast: ('local', 로컬 결과)) ('token', 조각) ... ('scored', 결과) 이벤트 반환"""
+        if not text:
+            raise ValueError("No text provided")
+
+        mode, evaluator = self._create_evaluator(mode)
+        return evaluator.evaluate_stream(text, use_cache, mode)
+
+    def _prepare_improve(self, text, pipeline):
+        if not text:
+            raise ValueError("No text provided")
+
+        pipeline = pipeline or config.IMPROVE_PIPELINE_MODE
+        if pipeline not in PIPELINE_MODES:
+            raise ValueError(f"Unsupported pipeline mode: {pipeline}")
             
         ai_client = self._create_ai_client()
         
-        # Load prompts
-        quality_prompt = ai_client.load_prompt(config.PROMPT_FILE)
-        scoring_prompt = ai_client.load_prompt(config.SCORING_PROMPT_FILE)
-        
-        # Inject project context
-        project = self.config_service.get_project_context()
-        developer = project.get('developer', '').strip()
-        system = project.get('system', '').strip()
-        client = project.get('client', '').strip()
-        
-        project_context = f"""
-- **Developer**: {developer}
-- **Target System**: {system}
-- **Client**: {client}
-"""
-        quality_prompt = quality_prompt.replace('{PROJECT_CONTEXT}', project_context)
-        quality_prompt = quality_prompt.replace('{Developer}', developer if developer else 'Supplier')
-        quality_prompt = quality_prompt.replace('{System}', system if system else 'System')
-        quality_prompt = quality_prompt.replace('{Client}', client if client else 'Client')
+        # Load prompts (메모리 캐시, 프로젝트 컨텍스트 렌더링 결과 재사용)
+        quality_prompt = self.prompt_store.render_quality_prompt(config.PROMPT_FILE, self.config_service.get_project_context())
+        scoring_prompt = self.prompt_store.get(config.SCORING_PROMPT_FILE)
         
         # Create components
         improver = RequirementImprover(ai_client, quality_prompt)
         evaluator = RequirementEvaluator(ai_client, scoring_prompt)
+        return pipeline, improver, evaluator
+
+    def improve(self, text, pattern_data, pipeline=None, use_cache=True, executor=None):
+        """
+        원본 평가 + 개선 + 개선본 평가
+        - executor: concurrent 파이프라인의 원본 평가를 실행할 풀 (기본: 공유 analysis 풀, 일괄 처리는 배치 전용 풀)
+        """
+        pipeline, improver, evaluator = self._prepare_improve(text, pipeline)
         
-        # 1. Evaluate Original
-        original_scores = evaluator.evaluate(text)
-        
-        # 2. Improve
-        improved_result = improver.improve(text, pattern_data)
-        
-        # 3. Evaluate Improved
-        improved_scores = evaluator.evaluate(improved_result['improved'])
-        
+        timings = {}
+        started = time.perf_counter()
+
+        if pipeline == 'concurrent':
+            # 1+2. 원본 평가와 개선은 서로 독립적이므로 동시에 시작 (개선은 호출 스레드에서 직접 실행)
+            original_future = (executor or self.executor).submit(
+                self._timed, timings, 'original_evaluation', evaluator.evaluate, text, use_cache
+            )
+            improved_result = self._timed(timings, 'improvement', improver.improve, text, pattern_data, use_cache)
+
+            # 3. 개선 결과가 도착하는 즉시 개선본 평가 시작 (원본 평가 완료를 기다리지 않음)
+            improved_scores = self._timed(timings, 'improved_evaluation', evaluator.evaluate, improved_result['improved'], use_cache)
+            original_scores = original_future.result()
+        else:
+            # 1. Evaluate Original
+            original_scores = self._timed(timings, 'original_evaluation', evaluator.evaluate, text, use_cache)
+
+            # 2. Improve
+            improved_result = self._timed(timings, 'improvement', improver.improve, text, pattern_data, use_cache)
+
+            # 3. Evaluate Improved
+            improved_scores = self._timed(timings, 'improved_evaluation', evaluator.evaluate, improved_result['improved'], use_cache)
+
+        return self._build_improve_response(
+            evaluator, pipeline, original_scores, improved_result, improved_scores, timings, started
+        )
+
+    def improve_stream(self, text, pattern_data, pipeline=None, use_cache=True):
+        """
+        스트리밍 개선 - 단계별 이벤트 (event, data)를 발생 즉시 반환
+        - original_scored: 원본 평가 완료
+        - improvement_token: 개선 결과 텍스트 조각
+        - improved: 개선 완료 / improved_scored: 개선본 평가 완료
+        - result: /api/improve와 동일한 최종 응답
+        """
+        pipeline, improver, evaluator = self._prepare_improve(text, pipeline)
+
+        def events():
+            timings = {}
+            started = time.perf_counter()
+            original_scores = None
+            yield 'start', {'pipeline': pipeline}
+
+            if pipeline == 'concurrent':
+                original_future = self.executor.submit(self._timed, timings, 'original_evaluation', evaluator.evaluate, text, use_cache)
+            else:
+                original_scores = self._timed(timings, 'original_evaluation', evaluator.evaluate, text, use_cache)
+                yield 'original_scored', original_scores
+
+            chunks = []
+            stage_start = time.perf_counter()
+            first_token = None
+            for chunk in improver.improve_stream(text, pattern_data, use_cache):
+                if first_token is None:
+                    first_token = round(time.perf_counter() - started, 3)
+                chunks.append(chunk)
+                yield 'improvement_token', {'text': chunk}
+                if original_scores is None and original_future.done():
+                    original_scores = original_future.result()
+                    yield 'original_scored', original_scores
+            timings['improvement'] = round(time.perf_counter() - stage_start, 3)
+            timings['first_token'] = first_token
+
+            improved_result = improver.build_result(text, ''.join(chunks), pattern_data)
+            yield 'improved', improved_result
+
+            if pipeline == 'concurrent':
+                # 원본 평가와 개선본 평가 중 먼저 끝나는 쪽부터 즉시 전달
+                improved_future = self.executor.submit(
+                    self._timed, timings, 'improved_evaluation', evaluator.evaluate, improved_result['improved'], use_cache
+                )
+                pending = {improved_future} if original_scores is not None else {original_future, improved_future}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    if original_future in done:
+                        original_scores = original_future.result()
+                        yield 'original_scored', original_scores
+                    if improved_future in done:
+                        improved_scores = improved_future.result()
+                        yield 'improved_scored', improved_scores
+            else:
+                improved_scores = self._timed(timings, 'improved_evaluation', evaluator.evaluate, improved_result['improved'], use_cache)
+                yield 'improved_scored', improved_scores
+
+            yield 'result', self._build_improve_response(
+                evaluator, pipeline, original_scores, improved_result, improved_scores, timings, started
+            )
+
+        return events()
+
+    def _build_improve_response(self, evaluator, pipeline, original_scores, improved_result, improved_scores, timings, started):
         # 4. Calculate top score changes
         explanations = self._calculate_top_changes(original_scores, improved_scores)
         
@@ -83,8 +430,30 @@ class AnalysisService:
             'improved_result': improved_result,
             'improved_scores': improved_scores,
             'comparison': comparison,
-            'explanations': explanations
+            'explanations': explanations,
+            'pipeline': pipeline,
+            'timings': self._finish_timings(timings, started)
         }
+
+    def _timed(self, timings, stage, func, *args):
+        """단계별 실행 시간(초)을 timings에 기록하며 func 실행"""
+        stage_start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[stage] = round(time.perf_counter() - stage_start, 3)
+
+    async def _atimed(self, timings, stage, awaitable):
+        stage_start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[stage] = round(time.perf_counter() - stage_start, 3)
+
+    def _finish_timings(self, timings, started):
+        result = dict(timings)
+        result['total'] = round(time.perf_counter() - started, 3)
+        return result
         
     def _calculate_top_changes(self, original_scores, improved_scores):
         explanations = []
@@ -3,37 +3,157 @@ Config Service - 설정 관리 서비스
 - API 키 및 프로젝트 설정을 파일(config.json)에 저장/로드
 - AI Provider 설정 관리 (OpenAI, Gemini, Claude)
 - 프로젝트 컨텍스트 정보 관리 (Developer, System, Client)
+- 장애 시 전환할 대체 Provider 목록 관리 (fallback_providers)
+- Provider별 호출 속도 제한 관리 (rate_limits: RPM/TPM)
+- 설정을 메모리에 캐시하고 파일 mtime/크기가 바뀐 경우에만 다시 읽음 (스레드 안전)
+- 저장은 임시 파일에 쓴 뒤 교체(os.replace)하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않음
+- 설정 변경 시 구독자(subscribe)에게 (이전 설정, 새 설정) 전달
 """
+import copy
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 import config
 
 class ConfigService:
-    def __init__(self):
+    def __init__(self, check_interval: float = config.CONFIG_RELOAD_CHECK_INTERVAL):
         self.config_dir = Path.home() / ".Codelia"
         self.config_file = self.config_dir / "config.json"
-        
-    def load_config(self):
-        if self.config_file.exists():
+        # check_interval 초 이내의 재요청은 stat 없이 메모리 값을 그대로 사용
+        self.check_interval = check_interval
+        self._config = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._subscribers = []
+        self._lock = threading.RLock()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _current(self):
+        """캐시된 설정 (내부 읽기 전용 - 호출 측에서 수정하지 않음)"""
+        with self._lock:
+            loaded, changed = self._load_locked()
+        # 구독자 알림은 잠금을 놓은 뒤 (구독자가 다른 잠금을 잡아도 순서가 엇갈리지 않음)
+        if changed:
+            self._notify(*changed)
+        return loaded
+
+    def _load_locked(self):
+        """
+        캐시 확인 및 필요 시 파일 다시 읽기 (self._lock을 잡은 상태에서 호출)
+        - 반환: (설정, 외부 수정으로 바뀐 경우 (이전 설정, 새 설정) 아니면 None)
+        """
+        now = time.monotonic()
+        if self._config is not None and now - self._checked_at < self.check_interval:
+            return self._config, None
+        self._checked_at = now
+        signature = self._file_signature()
+        if self._config is not None and signature == self._signature:
+            return self._config, None
+
+        previous = self._config
+        if signature is None:
+            loaded = {}
+        else:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+                    loaded = json.load(f)
+            except (OSError, ValueError) as e:
+                # 외부 편집 중인 파일 등 - 마지막으로 읽은 설정 유지 (빈 설정으로 API 키를 잃지 않음)
+                print(f"Failed to read config, keeping previous settings: {e}")
+                if self._config is not None:
+                    # 같은 파일을 매번 다시 읽지 않도록 시그니처만 기록 (파일이 다시 바뀌면 재시도)
+                    self._signature = signature
+                return (self._config if self._config is not None else {}), None
+        self._config = loaded
+        self._signature = signature
+        if previous is not None and previous != loaded:
+            return loaded, (previous, loaded)
+        return loaded, None
+
+    def load_config(self):
+        """설정 사본 반환 (수정해도 캐시에 영향 없음)"""
+        return copy.deepcopy(self._current())
         
     def save_config(self, new_config):
-        self.config_dir.mkdir(exist_ok=True)
+        with self._lock:
+            saved, changes = self._save_locked(new_config)
+        for change in changes:
+            self._notify(*change)
+        return saved
+
+    def update_config(self, updates):
+        """현재 설정에 최상위 키 단위로 병합 후 저장 (읽기-수정-쓰기를 잠금 안에서 수행)"""
+        with self._lock:
+            merged = copy.deepcopy(self._load_locked()[0])
+            merged.update(updates)
+            saved, changes = self._save_locked(merged)
+        for change in changes:
+            self._notify(*change)
+        return saved
+
+    def _save_locked(self, new_config):
+        """
+        파일 저장 및 캐시 갱신 (self._lock을 잡은 상태에서 호출)
+        - 반환: (저장 여부, 잠금 해제 후 알릴 (이전 설정, 새 설정) 목록)
+        """
+        changes = []
+        previous, changed = self._load_locked()
+        if changed:
+            changes.append(changed)
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(new_config, f, indent=2, ensure_ascii=False)
-            return True
+            self.config_dir.mkdir(exist_ok=True)
+            self._write_atomic(new_config)
         except Exception as e:
             print(f"Failed to save config: {e}")
-            return False
+            return False, changes
+        self._config = copy.deepcopy(new_config)
+        self._signature = self._file_signature()
+        self._checked_at = time.monotonic()
+        if previous != self._config:
+            changes.append((previous, self._config))
+        return True, changes
+
+    def _write_atomic(self, new_config):
+        fd, temp_path = tempfile.mkstemp(dir=self.config_dir, prefix='.config-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(new_config, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def subscribe(self, callback):
+        """설정 변경 알림 등록 - callback(previous, current) (저장 및 외부 파일 수정 감지 시 호출)"""
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def _notify(self, previous, current):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(previous, current)
+            except Exception as e:
+                print(f"Config subscriber failed: {e}")
             
     def get_provider_settings(self):
-        cfg = self.load_config()
+        cfg = self._current()
         provider = cfg.get('provider', config.DEFAULT_PROVIDER)
         provider_settings = cfg.get(provider, {})
         
@@ -44,6 +164,34 @@ class ConfigService:
             'model_name': None # Default handled by factory
         }
         
+    def get_fallback_settings(self):
+        """
+        대체 Provider 설정 목록 (config.json의 fallback_providers 순서)
+        - 주 Provider 및 API 키가 없는 Provider는 제외
+        """
+        cfg = self._current()
+        primary = cfg.get('provider', config.DEFAULT_PROVIDER)
+        fallbacks = []
+        for provider in cfg.get('fallback_providers', []):
+            provider_settings = cfg.get(provider, {})
+            if provider == primary or not provider_settings.get('key'):
+                continue
+            fallbacks.append({
+                'provider': provider,
+                'api_key': provider_settings.get('key', ''),
+                'base_url': provider_settings.get('url', ''),
+                'model_name': None
+            })
+        return fallbacks
+        
+    def get_rate_limits(self, provider):
+        """
+        Provider의 분당 요청/토큰 한도 {'rpm', 'tpm'}
+        config.json의 "rate_limits": {"openai": {"rpm": 500, "tpm": 200000}} 가 기본값보다 우선
+        """
+        limits = dict(config.DEFAULT_RATE_LIMITS.get(provider, {}))
+        limits.update(self._current().get('rate_limits', {}).get(provider, {}))
+        return {'rpm': limits.get('rpm'), 'tpm': limits.get('tpm')}
+        
     def get_project_context(self):
-        cfg = self.load_config()
-        return cfg.get('project', {})
+        return dict(self._current().get('project', {}))
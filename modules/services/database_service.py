@@ -2,24 +2,252 @@
 Database Service - SQLite 기반 히스토리 관리 서비스
 - 사용자 홈 디렉토리(~/.Codelia)에 history.db 생성 및 관리
 - 히스토리 단일/일괄 저장, 조회, 삭제 기능 제공
+- 목록은 (req_id, created_at, id) keyset 커서 기반 페이지 조회 (full_data 제외, 상세 조회 시 로드)
+- full_data는 해시 기반 blob 테이블(history_blobs)에 압축하여 한 번만 저장 (세션 내 중복 제거)
+- FTS5(trigram) 전문 검색 인덱스(history_fts)를 트리거로 동기화 (미지원 환경은 LIKE 검색으로 대체)
+- 스레드별 연결 재사용 + WAL 저널 모드 (읽기/쓰기 동시 진행), 종료 시 checkpoint/optimize
+  (강제 종료에 대비해 checkpoint_interval 주기로 PASSIVE checkpoint)
+- 점수 집계 테이블(history_stats, history_category_stats)을 저장/삭제 시 증분 갱신
+  (전체/요구사항 계열/세션/주 단위 평균 점수와 카테고리별 점수를 전체 행 조회 없이 제공)
+- 백그라운드 작업 큐 저장소(jobs, job_items) - 항목별 결과를 완료 즉시 저장하여 재시작 후 이어서 처리
 - Windows EXE 배포 환경을 고려한 절대 경로 처리
 """
 import sqlite3
 import json
 import os
+import base64
+import html
+import hashlib
+import math
+import re
+import threading
+import zlib
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
-class DatabaseService:
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib만 사용
+    zstandard = None
+
+# PRAGMA user_version으로 관리하는 스키마 버전
+# 2: full_data → history_blobs 분리
+# 3: 점수 집계 테이블 추가 (기존 행으로 1회 재계산)
+SCHEMA_VERSION = 3
+
+# 점수 집계 차원 - all: 전체, family: 요구사항 ID 계열(REQ-001 → REQ), session: 세션, week: ISO 주
+ANALYTICS_DIMENSIONS = ('all', 'family', 'session', 'week')
+# 카테고리 점수를 읽는 full_data 키 (개선 응답의 원본/개선 평가 결과)
+_SCORE_SIDES = (('original', 'original_scores'), ('improved', 'improved_scores'))
+_REQ_ID_NUMBER = re.compile(r"[-_.]?\d+(?:[-_.]\d+)*$")
+# FTS5 snippet()의 일치 구간 표시 문자 (이스케이프 후 <mark> 태그로 변환)
+_MARK_OPEN, _MARK_CLOSE = '\x02', '\x03'
+
+
+def _compress(text, codec):
+    raw = text.encode('utf-8')
+    if codec == 'zstd' and zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=10).compress(raw)
+    return 'zlib', zlib.compress(raw, 6)
+
+
+def _decompress(codec, data):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstandard package is required to read this history entry")
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    return zlib.decompress(data).decode('utf-8')
+
+
+def _req_family(req_id):
+    family = _REQ_ID_NUMBER.sub('', req_id or '')
+    return family or (req_id or '')
+
+
+def _score_value(value, field):
+    """점수 값 정규화 - None/빈 문자열은 None, 숫자 문자열은 숫자로 변환 (그 외는 ValueError)"""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = int(text)
+        except ValueError:
+            try:
+                value = float(text)
+            except ValueError:
+                raise ValueError(f"{field} must be a number, got {text!r}") from None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or \
+            (isinstance(value, float) and not math.isfinite(value)):
+        raise ValueError(f"{field} must be a number, got {value!r}")
+    return value
+
+
+def _item_scores(item_data, prefix=''):
+    """저장할 항목의 (original_score, improved_score) - 집계 합산 전에 검증"""
+    return (_score_value(item_data.get('original_score'), f"{prefix}original_score"),
+            _score_value(item_data.get('improved_score'), f"{prefix}improved_score"))
+
+
+def _week_bucket(created_at):
+    try:
+        year, week, _ = datetime.fromisoformat(str(created_at)).isocalendar()
+    except (TypeError, ValueError):
+        return 'unknown'
+    return f"{year}-W{week:02d}"
+
+
+def _extract_categories(full_data_json):
+    """full_data에서 원본/개선 평가의 카테고리 점수 추출: {side: {category: (score, max)}}"""
+    if not full_data_json:
+        return {}
+    try:
+        full_data = json.loads(full_data_json)
+    except (TypeError, ValueError):
+        return {}
+    if not isinstance(full_data, dict):
+        return {}
+    result = {}
+    for side, key in _SCORE_SIDES:
+        categories = (full_data.get(key) or {}).get('categories') if isinstance(full_data.get(key), dict) else None
+        if not isinstance(categories, dict):
+            continue
+        side_scores = {}
+        for name, value in categories.items():
+            if isinstance(value, dict) and isinstance(value.get('score'), (int, float)):
+                side_scores[name] = (value['score'], value.get('max') or 0)
+        if side_scores:
+            result[side] = side_scores
+    return result
+
+
+class _StatsDelta:
+    """행 추가/삭제에 따른 집계 증감분 - 버킷별로 합산한 뒤 한 번에 반영"""
+
     def __init__(self):
+        # (dimension, bucket) → [row_count, original_sum, original_n, improved_sum, improved_n]
+        self.rows = defaultdict(lambda: [0, 0, 0, 0, 0])
+        # (dimension, bucket, side, category) → [row_count, score_sum, max_sum]
+        self.categories = defaultdict(lambda: [0, 0, 0])
+        self.removed = False
+
+    def add(self, req_id, session_id, created_at, original_score, improved_score, categories, sign=1):
+        if sign < 0:
+            self.removed = True
+        buckets = (
+            ('all', ''),
+            ('family', _req_family(req_id)),
+            ('session', session_id or ''),
+            ('week', _week_bucket(created_at)),
+        )
+        for key in buckets:
+            stats = self.rows[key]
+            stats[0] += sign
+            if original_score is not None:
+                stats[1] += sign * original_score
+                stats[2] += sign
+            if improved_score is not None:
+                stats[3] += sign * improved_score
+                stats[4] += sign
+            for side, side_scores in categories.items():
+                for name, (score, max_score) in side_scores.items():
+                    cat_stats = self.categories[key + (side, name)]
+                    cat_stats[0] += sign
+                    cat_stats[1] += sign * score
+                    cat_stats[2] += sign * max_score
+
+
+class DatabaseService:
+    def __init__(self, blob_codec='zlib', cache_size_kb=16384, mmap_size=64 * 1024 * 1024, busy_timeout_ms=5000,
+                 checkpoint_interval=0):
         # 사용자 홈 디렉토리에 데이터 저장 
         self.db_dir = Path.home() / ".Codelia"
         self.db_path = self.db_dir / "history.db"
+        self.blob_codec = blob_codec
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self._connections = {}  # thread -> sqlite3.Connection
+        self._connections_lock = threading.Lock()
+        self.fts_enabled = False
+        self.checkpoint_interval = checkpoint_interval
+        self._closed = threading.Event()
+        self._checkpoint_thread = None
         self._init_db()
+        if checkpoint_interval > 0:
+            self._checkpoint_thread = threading.Thread(target=self._checkpoint_loop, name='history-db-checkpoint', daemon=True)
+            self._checkpoint_thread.start()
+
+    def _open_connection(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        # WAL: 읽기와 쓰기가 서로를 막지 않음 (NORMAL은 WAL에서 안전하며 commit마다 fsync하지 않음)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
 
     def _get_connection(self):
-        """데이터베이스 연결 생성"""
-        return sqlite3.connect(self.db_path)
+        """현재 스레드 전용 연결 반환 (없으면 생성, 종료된 스레드의 연결은 정리)"""
+        thread = threading.current_thread()
+        with self._connections_lock:
+            conn = self._connections.get(thread)
+            if conn is not None:
+                return conn
+            for dead in [t for t in self._connections if not t.is_alive()]:
+                self._connections.pop(dead).close()
+            conn = self._open_connection()
+            self._connections[thread] = conn
+            return conn
+
+    def connection(self):
+        """현재 스레드 전용 history.db 연결 (같은 DB를 쓰는 다른 저장소와 공유, 예: LLM 응답 캐시)"""
+        return self._get_connection()
+
+    def ping(self):
+        """DB 연결 확인 (준비 상태 점검용, 실패 시 sqlite3.Error)"""
+        self._get_connection().execute("SELECT 1").fetchone()
+
+    def checkpoint(self, mode='PASSIVE'):
+        """
+        WAL 내용을 DB 파일에 반영
+        - PASSIVE: 진행 중인 읽기/쓰기를 기다리지 않고 가능한 만큼만 반영
+        - 반환: {'busy': 0/1, 'log': WAL 프레임 수, 'checkpointed': 반영된 프레임 수}
+        """
+        mode = str(mode).upper()
+        if mode not in ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'):
+            raise ValueError(f"Unsupported checkpoint mode: {mode}")
+        busy, log, checkpointed = self._get_connection().execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return {'busy': busy, 'log': log, 'checkpointed': checkpointed}
+
+    def _checkpoint_loop(self):
+        # 종료 처리 없이 프로세스가 끝나도 WAL에 남는 내용이 주기 사이의 변경분뿐이도록 유지
+        while not self._closed.wait(self.checkpoint_interval):
+            try:
+                self.checkpoint('PASSIVE')
+            except sqlite3.Error as e:
+                print(f"History DB periodic checkpoint failed: {e}")
+
+    def close(self):
+        """WAL checkpoint 및 통계 최적화 후 모든 연결 종료 (앱 종료 시 호출)"""
+        self._closed.set()
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        if not connections:
+            connections = [self._open_connection()]
+        try:
+            connections[0].execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            connections[0].execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"History DB checkpoint failed: {e}")
+        finally:
+            for conn in connections:
+                conn.close()
 
     def _init_db(self):
         """데이터베이스 및 테이블 초기화"""
@@ -42,57 +270,741 @@ class DatabaseService:
             # 인덱스 생성 (조회 성능 및 정렬 목적)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_req_id ON history(req_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_session_id ON history(session_id)")
+            # keyset 페이지 조회용 (정렬 순서와 동일한 복합 인덱스)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_keyset ON history(req_id ASC, created_at DESC, id DESC)")
+
+            # full_data 저장소 (내용 해시 → 압축 데이터)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS history_blobs (
+                    hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    raw_size INTEGER NOT NULL
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(history)")}
+            if 'full_data_hash' not in columns:
+                conn.execute("ALTER TABLE history ADD COLUMN full_data_hash TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_full_data_hash ON history(full_data_hash)")
+
+            self.fts_enabled = self._init_fts(conn)
+            self._init_stats(conn)
+            self._init_jobs(conn)
+
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            migrated = 0
+            if version < 2:
+                migrated = self._migrate_full_data_to_blobs(conn)
+            if version < 3:
+                self._rebuild_stats(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        if migrated:
+            # 인라인 full_data가 차지하던 공간 회수 (1회성)
+            self._get_connection().execute("VACUUM")
+
+    def _init_stats(self, conn):
+        """점수 집계 테이블 생성 (history 저장/삭제 시 함께 갱신)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS history_stats (
+                dimension TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                original_sum INTEGER NOT NULL DEFAULT 0,
+                original_n INTEGER NOT NULL DEFAULT 0,
+                improved_sum INTEGER NOT NULL DEFAULT 0,
+                improved_n INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, bucket)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS history_category_stats (
+                dimension TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                side TEXT NOT NULL,
+                category TEXT NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                score_sum INTEGER NOT NULL DEFAULT 0,
+                max_sum INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, bucket, side, category)
+            )
+        """)
+        # 차원별 건수 순 조회용
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_history_stats_count ON history_stats(dimension, row_count DESC)")
+
+    def _init_jobs(self, conn):
+        """작업 큐 테이블 생성 (params: 입력/옵션 JSON, job_items: 항목별 결과)"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                params TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                completed INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_items (
+                job_id TEXT NOT NULL,
+                item_index INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                codec TEXT,
+                result BLOB,
+                error TEXT,
+                PRIMARY KEY (job_id, item_index)
+            )
+        """)
+
+    def _init_fts(self, conn):
+        """전문 검색 테이블/동기화 트리거 생성 (반환: FTS5 trigram 사용 가능 여부)"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history_fts'"
+        ).fetchone()
+        if not exists:
+            try:
+                # trigram: 공백 단위 분리가 맞지 않는 한국어도 부분 문자열(3자 이상)로 검색
+                conn.execute("""
+                    CREATE VIRTUAL TABLE history_fts USING fts5(
+                        original_text, improved_text,
+                        content='history', content_rowid='id', tokenize='trigram'
+                    )
+                """)
+            except sqlite3.OperationalError as e:
+                print(f"FTS5 trigram unavailable, history search falls back to LIKE: {e}")
+                return False
+
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS history_fts_ai AFTER INSERT ON history BEGIN
+                INSERT INTO history_fts(rowid, original_text, improved_text)
+                VALUES (new.id, new.original_text, new.improved_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS history_fts_ad AFTER DELETE ON history BEGIN
+                INSERT INTO history_fts(history_fts, rowid, original_text, improved_text)
+                VALUES ('delete', old.id, old.original_text, old.improved_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS history_fts_au AFTER UPDATE OF original_text, improved_text ON history BEGIN
+                INSERT INTO history_fts(history_fts, rowid, original_text, improved_text)
+                VALUES ('delete', old.id, old.original_text, old.improved_text);
+                INSERT INTO history_fts(rowid, original_text, improved_text)
+                VALUES (new.id, new.original_text, new.improved_text);
+            END;
+        """)
+        if not exists:
+            # 기존 행 색인 (1회성)
+            conn.execute("INSERT INTO history_fts(history_fts) VALUES ('rebuild')")
+        return True
+
+    def _migrate_full_data_to_blobs(self, conn, batch_size=500):
+        """기존 행의 인라인 full_data를 history_blobs로 이동 (반환: 이동한 행 수)"""
+        migrated = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, full_data FROM history WHERE id > ? AND full_data IS NOT NULL ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return migrated
+            for row_id, full_data in rows:
+                blob_hash = self._store_blob(conn, full_data)
+                conn.execute("UPDATE history SET full_data = NULL, full_data_hash = ? WHERE id = ?", (blob_hash, row_id))
+            last_id = rows[-1][0]
+            migrated += len(rows)
+
+    @staticmethod
+    def _serialize_full_data(full_data):
+        # full_data가 객체인 경우 JSON 문자열로 변환
+        return json.dumps(full_data) if isinstance(full_data, (dict, list)) else full_data
+
+    def _store_blob(self, conn, full_data_json):
+        """full_data를 압축 저장하고 해시 반환 (동일 내용은 한 번만 저장)"""
+        if full_data_json is None:
+            return None
+        blob_hash = hashlib.sha256(full_data_json.encode('utf-8')).hexdigest()
+        exists = conn.execute("SELECT 1 FROM history_blobs WHERE hash = ?", (blob_hash,)).fetchone()
+        if not exists:
+            codec, data = _compress(full_data_json, self.blob_codec)
+            conn.execute(
+                "INSERT OR IGNORE INTO history_blobs (hash, codec, data, raw_size) VALUES (?, ?, ?, ?)",
+                (blob_hash, codec, data, len(full_data_json))
+            )
+        return blob_hash
+
+    @staticmethod
+    def _row_to_item(row):
+        """조회 행을 dict로 변환 (blob은 압축 해제하여 full_data 문자열로 복원)"""
+        item = dict(row)
+        codec = item.pop('blob_codec', None)
+        data = item.pop('blob_data', None)
+        if data is not None:
+            item['full_data'] = _decompress(codec, data)
+        return item
+
+    def _delete_orphan_blobs(self, conn, hashes):
+        for blob_hash in {h for h in hashes if h}:
+            conn.execute(
+                "DELETE FROM history_blobs WHERE hash = ? AND NOT EXISTS (SELECT 1 FROM history WHERE full_data_hash = ?)",
+                (blob_hash, blob_hash)
+            )
+
+    def _apply_stats(self, conn, delta):
+        """집계 증감분 반영 (UPSERT), 삭제로 비게 된 버킷은 제거"""
+        if delta.rows:
+            conn.executemany("""
+                INSERT INTO history_stats (dimension, bucket, row_count, original_sum, original_n, improved_sum, improved_n)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(dimension, bucket) DO UPDATE SET
+                    row_count = row_count + excluded.row_count,
+                    original_sum = original_sum + excluded.original_sum,
+                    original_n = original_n + excluded.original_n,
+                    improved_sum = improved_sum + excluded.improved_sum,
+                    improved_n = improved_n + excluded.improved_n
+            """, [key + tuple(values) for key, values in delta.rows.items()])
+        if delta.categories:
+            conn.executemany("""
+                INSERT INTO history_category_stats (dimension, bucket, side, category, row_count, score_sum, max_sum)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(dimension, bucket, side, category) DO UPDATE SET
+                    row_count = row_count + excluded.row_count,
+                    score_sum = score_sum + excluded.score_sum,
+                    max_sum = max_sum + excluded.max_sum
+            """, [key + tuple(values) for key, values in delta.categories.items()])
+        if delta.removed:
+            conn.executemany(
+                "DELETE FROM history_stats WHERE dimension = ? AND bucket = ? AND row_count <= 0",
+                list(delta.rows)
+            )
+            conn.executemany(
+                "DELETE FROM history_category_stats WHERE dimension = ? AND bucket = ? AND side = ? AND category = ? AND row_count <= 0",
+                list(delta.categories)
+            )
+
+    def _rebuild_stats(self, conn, chunk_size=500):
+        """기존 history 전체로 집계 테이블 재계산 (스키마 업그레이드/복구용)"""
+        conn.execute("DELETE FROM history_stats")
+        conn.execute("DELETE FROM history_category_stats")
+        delta = _StatsDelta()
+        last_id = 0
+        while True:
+            rows = conn.execute("""
+                SELECT h.id, h.req_id, h.session_id, h.created_at, h.original_score, h.improved_score,
+                       h.full_data_hash, b.codec AS blob_codec, b.data AS blob_data
+                FROM history h
+                LEFT JOIN history_blobs b ON b.hash = h.full_data_hash
+                WHERE h.id > ?
+                ORDER BY h.id
+                LIMIT ?
+            """, (last_id, chunk_size)).fetchall()
+            if not rows:
+                break
+            # 같은 세션의 행은 blob을 공유하므로 청크 내에서 한 번만 해제/파싱
+            parsed = {}
+            for row in rows:
+                blob_hash = row['full_data_hash']
+                if blob_hash not in parsed:
+                    data = row['blob_data']
+                    parsed[blob_hash] = _extract_categories(_decompress(row['blob_codec'], data)) if data is not None else {}
+                delta.add(row['req_id'], row['session_id'], row['created_at'],
+                          row['original_score'], row['improved_score'], parsed[blob_hash])
+            last_id = rows[-1]['id']
+        self._apply_stats(conn, delta)
+        return delta.rows.get(('all', ''), [0])[0]
+
+    def rebuild_analytics(self):
+        """점수 집계 전체 재계산 (반환: 집계된 행 수)"""
+        with self._get_connection() as conn:
+            return self._rebuild_stats(conn)
 
     def save_history_item(self, item_data):
         """
         개별 히스토리 항목 저장
         item_data: {req_id, original, improved, original_score, improved_score, session_id, full_data}
+        점수는 숫자(또는 숫자 문자열)만 허용 - 그 외는 ValueError
         """
+        original_score, improved_score = _item_scores(item_data)
         query = """
             INSERT INTO history (
                 req_id, original_text, improved_text, 
-                original_score, improved_score, session_id, full_data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                original_score, improved_score, session_id, full_data_hash, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
         
-        # full_data가 객체인 경우 JSON 문자열로 변환
-        full_data_json = json.dumps(item_data.get('full_data')) if isinstance(item_data.get('full_data'), (dict, list)) else item_data.get('full_data')
+        full_data_json = self._serialize_full_data(item_data.get('full_data'))
         
         with self._get_connection() as conn:
+            # 주 단위 집계를 위해 저장 시각을 먼저 결정
+            created_at = conn.execute("SELECT CURRENT_TIMESTAMP").fetchone()[0]
             cursor = conn.execute(query, (
                 item_data.get('req_id'),
                 item_data.get('original'),
                 item_data.get('improved'),
-                item_data.get('original_score'),
-                item_data.get('improved_score'),
+                original_score,
+                improved_score,
                 item_data.get('session_id'),
-                full_data_json
+                self._store_blob(conn, full_data_json),
+                created_at
             ))
+            delta = _StatsDelta()
+            delta.add(item_data.get('req_id'), item_data.get('session_id'), created_at,
+                      original_score, improved_score, _extract_categories(full_data_json))
+            self._apply_stats(conn, delta)
             return cursor.lastrowid
 
-    def get_history_list(self):
-        """전체 히스토리 목록 조회 (req_id 기준 오름차순)"""
+    def save_history_batch(self, items):
+        """
+        여러 히스토리 항목을 하나의 트랜잭션으로 저장 (전부 저장되거나 전부 롤백)
+        items: save_history_item과 동일한 dict 목록 (created_at 지정 시 그대로 보존 - 가져오기/복원용)
+        반환: 저장된 행 수 (점수가 숫자가 아닌 항목이 있으면 아무것도 쓰지 않고 ValueError)
+        """
         query = """
-            SELECT id, req_id, original_text, improved_text, 
-                   original_score, improved_score, session_id, full_data, created_at
-            FROM history
-            ORDER BY req_id ASC, created_at DESC
+            INSERT INTO history (
+                req_id, original_text, improved_text,
+                original_score, improved_score, session_id, full_data_hash, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
-        
+        if not items:
+            return 0
+        scores = [_item_scores(item_data, f"items[{index}].") for index, item_data in enumerate(items)]
+
+        with self._get_connection() as conn:
+            now = conn.execute("SELECT CURRENT_TIMESTAMP").fetchone()[0]
+            # 동일 full_data는 직렬화/해시/압축/카테고리 추출을 한 번만 수행
+            blob_hashes = {}
+            blob_categories = {}
+            delta = _StatsDelta()
+            rows = []
+            for item_data, (original_score, improved_score) in zip(items, scores):
+                full_data_json = self._serialize_full_data(item_data.get('full_data'))
+                if full_data_json is not None and full_data_json not in blob_hashes:
+                    blob_hashes[full_data_json] = self._store_blob(conn, full_data_json)
+                    blob_categories[full_data_json] = _extract_categories(full_data_json)
+                created_at = item_data.get('created_at') or now
+                rows.append((
+                    item_data.get('req_id'),
+                    item_data.get('original'),
+                    item_data.get('improved'),
+                    original_score,
+                    improved_score,
+                    item_data.get('session_id'),
+                    blob_hashes.get(full_data_json),
+                    created_at
+                ))
+                delta.add(item_data.get('req_id'), item_data.get('session_id'), created_at,
+                          original_score, improved_score, blob_categories.get(full_data_json, {}))
+            conn.executemany(query, rows)
+            self._apply_stats(conn, delta)
+            return len(rows)
+
+    def get_history_list(self, include_full_data=False):
+        """
+        전체 히스토리 목록 조회 (req_id 기준 오름차순)
+        - 기본은 목록 필드만 (full_data는 get_history_item으로 단건 조회, 화면 목록은 get_history_page 사용)
+        """
+        if include_full_data:
+            query = """
+                SELECT h.id, h.req_id, h.original_text, h.improved_text,
+                       h.original_score, h.improved_score, h.session_id, h.full_data, h.created_at,
+                       b.codec AS blob_codec, b.data AS blob_data
+                FROM history h
+                LEFT JOIN history_blobs b ON b.hash = h.full_data_hash
+                ORDER BY h.req_id ASC, h.created_at DESC
+            """
+        else:
+            query = """
+                SELECT id, req_id, original_text, improved_text,
+                       original_score, improved_score, session_id, created_at
+                FROM history
+                ORDER BY req_id ASC, created_at DESC
+            """
+
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             rows = conn.execute(query).fetchall()
             
-            return [dict(row) for row in rows]
+            return [self._row_to_item(row) for row in rows]
+
+    @staticmethod
+    def _encode_cursor(row):
+        raw = json.dumps([row['req_id'], row['created_at'], row['id']], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        try:
+            req_id, created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+            return req_id, created_at, int(row_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def _history_filters(table='', session_id=None, req_id_prefix=None, date_from=None, date_to=None,
+                         min_score=None, max_score=None):
+        """페이지/검색 공통 필터 조건 (table: 컬럼 앞에 붙일 별칭, 예: 'h.') - 반환: (조건 목록, 파라미터 목록)"""
+        conditions = []
+        params = []
+        if session_id:
+            conditions.append(f"{table}session_id = ?")
+            params.append(session_id)
+        if req_id_prefix:
+            # LIKE 대신 범위 조건으로 인덱스 사용
+            conditions.append(f"{table}req_id >= ? AND {table}req_id < ?")
+            params += [req_id_prefix, req_id_prefix + '\U0010ffff']
+        if date_from:
+            conditions.append(f"{table}created_at >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append(f"{table}created_at < date(?, '+1 day')")
+            params.append(date_to)
+        if min_score is not None:
+            conditions.append(f"{table}improved_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            conditions.append(f"{table}improved_score <= ?")
+            params.append(max_score)
+        return conditions, params
+
+    def get_history_page(self, limit=50, cursor=None, session_id=None, req_id_prefix=None,
+                         date_from=None, date_to=None, min_score=None, max_score=None):
+        """
+        히스토리 페이지 조회 (req_id 오름차순, 최신순) - full_data 제외
+        - cursor: 이전 페이지의 next_cursor (keyset: req_id, created_at, id)
+        - date_from/date_to: 'YYYY-MM-DD' (양 끝 포함), min_score/max_score: improved_score 범위
+        반환: {'items': [...], 'next_cursor': str | None}
+        """
+        limit = max(1, min(int(limit), 500))
+        conditions, params = self._history_filters(
+            session_id=session_id, req_id_prefix=req_id_prefix, date_from=date_from, date_to=date_to,
+            min_score=min_score, max_score=max_score
+        )
+
+        if cursor:
+            req_id, created_at, row_id = self._decode_cursor(cursor)
+            conditions.insert(0, "(req_id > ? OR (req_id = ? AND (created_at < ? OR (created_at = ? AND id < ?))))")
+            params[:0] = [req_id, req_id, created_at, created_at, row_id]
+
+        query = f"""
+            SELECT id, req_id, original_text, improved_text,
+                   original_score, improved_score, session_id, created_at
+            FROM history
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            ORDER BY req_id ASC, created_at DESC, id DESC
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        with self._get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            'items': [dict(row) for row in rows],
+            'next_cursor': self._encode_cursor(rows[-1]) if has_more else None
+        }
+
+    def get_history_item(self, history_id):
+        """히스토리 단건 조회 (full_data 포함)"""
+        query = """
+            SELECT h.id, h.req_id, h.original_text, h.improved_text,
+                   h.original_score, h.improved_score, h.session_id, h.full_data, h.created_at,
+                   b.codec AS blob_codec, b.data AS blob_data
+            FROM history h
+            LEFT JOIN history_blobs b ON b.hash = h.full_data_hash
+            WHERE h.id = ?
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(query, (history_id,)).fetchone()
+            return self._row_to_item(row) if row else None
+
+    @staticmethod
+    def _make_snippet(text, terms, width=32):
+        """LIKE 검색 결과용 스니펫 - 첫 일치 위치 주변만 잘라 HTML 이스케이프 후 검색어를 <mark>로 감쌈"""
+        if not text:
+            return ''
+        pattern = re.compile('|'.join(re.escape(t) for t in terms), re.IGNORECASE)
+        match = pattern.search(text)
+        if match is None:
+            return ''
+        start = max(0, match.start() - width)
+        end = min(len(text), match.end() + width)
+        parts = []
+        last = start
+        for m in pattern.finditer(text, start, end):
+            parts.append(html.escape(text[last:m.start()]))
+            parts.append(f"<mark>{html.escape(m.group(0))}</mark>")
+            last = m.end()
+        parts.append(html.escape(text[last:end]))
+        return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(text) else '')
+
+    @staticmethod
+    def _render_fts_snippet(snippet):
+        """FTS5 snippet() 결과를 HTML 이스케이프한 뒤 구분 문자를 <mark> 태그로 변환"""
+        if not snippet:
+            return snippet
+        return html.escape(snippet).replace(_MARK_OPEN, '<mark>').replace(_MARK_CLOSE, '</mark>')
+
+    def search_history(self, query, limit=20, offset=0, **filters):
+        """
+        원본/개선 요구사항 전문 검색 (full_data 제외)
+        - 공백으로 구분된 검색어는 모두 포함(AND), FTS5는 bm25 순위, LIKE 대체 시 최신순
+        - 3자 미만 검색어가 있으면 trigram 색인을 쓸 수 없으므로 LIKE 검색
+        - filters: get_history_page와 같은 필터 (session_id, req_id_prefix, date_from, date_to, min_score, max_score)
+        - 스니펫은 HTML 이스케이프한 원문에 일치 부분만 <mark>...</mark>로 표시 (innerHTML로 바로 표시 가능)
+        반환: {'items': [...], 'mode': 'fts' | 'like', 'has_more': bool}
+        """
+        terms = (query or '').split()
+        if not terms:
+            raise ValueError("Search query is required")
+        limit = max(1, min(int(limit), 100))
+        offset = max(0, int(offset))
+
+        conditions, params = self._history_filters('h.', **filters)
+        conn = self._get_connection()
+        if self.fts_enabled and all(len(term) >= 3 for term in terms):
+            # 검색어를 구문(phrase)으로 감싸 FTS5 연산자 문자를 그대로 검색
+            match = ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+            rows = conn.execute(f"""
+                SELECT h.id, h.req_id, h.original_text, h.improved_text,
+                       h.original_score, h.improved_score, h.session_id, h.created_at,
+                       snippet(history_fts, 0, ?, ?, '…', 16) AS original_snippet,
+                       snippet(history_fts, 1, ?, ?, '…', 16) AS improved_snippet,
+                       bm25(history_fts) AS rank
+                FROM history_fts
+                JOIN history h ON h.id = history_fts.rowid
+                WHERE history_fts MATCH ?{"".join(" AND " + condition for condition in conditions)}
+                ORDER BY rank
+                LIMIT ? OFFSET ?
+            """, [_MARK_OPEN, _MARK_CLOSE, _MARK_OPEN, _MARK_CLOSE, match] + params + [limit + 1, offset]).fetchall()
+            items = []
+            for row in rows:
+                item = dict(row)
+                item['original_snippet'] = self._render_fts_snippet(item['original_snippet'])
+                item['improved_snippet'] = self._render_fts_snippet(item['improved_snippet'])
+                items.append(item)
+            mode = 'fts'
+        else:
+            for term in terms:
+                like = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                conditions.append("(h.original_text LIKE ? ESCAPE '\\' OR h.improved_text LIKE ? ESCAPE '\\')")
+                params += [like, like]
+            rows = conn.execute(f"""
+                SELECT h.id, h.req_id, h.original_text, h.improved_text,
+                       h.original_score, h.improved_score, h.session_id, h.created_at
+                FROM history h
+                WHERE {" AND ".join(conditions)}
+                ORDER BY h.created_at DESC, h.id DESC
+                LIMIT ? OFFSET ?
+            """, params + [limit + 1, offset]).fetchall()
+            items = []
+            for row in rows:
+                item = dict(row)
+                item['original_snippet'] = self._make_snippet(item['original_text'], terms)
+                item['improved_snippet'] = self._make_snippet(item['improved_text'], terms)
+                items.append(item)
+            mode = 'like'
+
+        return {'items': items[:limit], 'mode': mode, 'has_more': len(items) > limit}
 
     def delete_history_item(self, history_id):
         """특정 히스토리 삭제"""
         with self._get_connection() as conn:
+            row = conn.execute("""
+                SELECT h.req_id, h.session_id, h.created_at, h.original_score, h.improved_score,
+                       h.full_data_hash, b.codec AS blob_codec, b.data AS blob_data
+                FROM history h
+                LEFT JOIN history_blobs b ON b.hash = h.full_data_hash
+                WHERE h.id = ?
+            """, (history_id,)).fetchone()
             conn.execute("DELETE FROM history WHERE id = ?", (history_id,))
+            if row:
+                # 집계에서 해당 행의 기여분 차감
+                categories = _extract_categories(_decompress(row['blob_codec'], row['blob_data'])) if row['blob_data'] is not None else {}
+                delta = _StatsDelta()
+                delta.add(row['req_id'], row['session_id'], row['created_at'],
+                          row['original_score'], row['improved_score'], categories, sign=-1)
+                self._apply_stats(conn, delta)
+                self._delete_orphan_blobs(conn, [row['full_data_hash']])
             return True
 
     def clear_all_history(self):
         """전체 히스토리 삭제"""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM history")
+            conn.execute("DELETE FROM history_blobs")
+            conn.execute("DELETE FROM history_stats")
+            conn.execute("DELETE FROM history_category_stats")
             return True
+
+    @staticmethod
+    def _average(total, count):
+        return round(total / count, 1) if count else None
+
+    def _stats_item(self, row, category_rows):
+        original_avg = self._average(row['original_sum'], row['original_n'])
+        improved_avg = self._average(row['improved_sum'], row['improved_n'])
+        item = {
+            'bucket': row['bucket'],
+            'count': row['row_count'],
+            'original_avg': original_avg,
+            'improved_avg': improved_avg,
+            'gain_avg': round(improved_avg - original_avg, 1) if original_avg is not None and improved_avg is not None else None
+        }
+        if category_rows is not None:
+            categories = {}
+            for cat in category_rows:
+                categories.setdefault(cat['category'], {})[cat['side']] = {
+                    'count': cat['row_count'],
+                    'avg_score': self._average(cat['score_sum'], cat['row_count']),
+                    'avg_max': self._average(cat['max_sum'], cat['row_count']),
+                    'percentage': round(cat['score_sum'] / cat['max_sum'] * 100, 1) if cat['max_sum'] else 0
+                }
+            item['categories'] = categories
+        return item
+
+    def get_analytics(self, dimension='all', limit=100, include_categories=True):
+        """
+        집계 테이블 기반 점수 통계 조회 (history 행 수와 무관하게 버킷 수만큼만 읽음)
+        dimension: all | family | session | week (week는 최근 주부터, 나머지는 건수 많은 순)
+        반환: {'dimension', 'items': [{bucket, count, original_avg, improved_avg, gain_avg, categories}]}
+        """
+        if dimension not in ANALYTICS_DIMENSIONS:
+            raise ValueError(f"Unknown analytics dimension: {dimension} (expected one of {', '.join(ANALYTICS_DIMENSIONS)})")
+        limit = max(1, min(int(limit), 1000))
+        order = "bucket DESC" if dimension == 'week' else "row_count DESC, bucket ASC"
+
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM history_stats WHERE dimension = ? ORDER BY {order} LIMIT ?",
+                (dimension, limit)
+            ).fetchall()
+            by_bucket = None
+            if include_categories and rows:
+                by_bucket = {row['bucket']: [] for row in rows}
+                placeholders = ','.join('?' * len(rows))
+                for cat in conn.execute(f"""
+                    SELECT * FROM history_category_stats
+                    WHERE dimension = ? AND bucket IN ({placeholders})
+                    ORDER BY category, side
+                """, [dimension] + list(by_bucket)):
+                    by_bucket[cat['bucket']].append(cat)
+
+        items = [self._stats_item(row, by_bucket[row['bucket']] if by_bucket is not None else None) for row in rows]
+        return {'dimension': dimension, 'items': items}
+
+    def get_analytics_summary(self):
+        """전체 히스토리 점수 요약 (카테고리 포함)"""
+        items = self.get_analytics('all')['items']
+        if items:
+            return items[0]
+        return {'bucket': '', 'count': 0, 'original_avg': None, 'improved_avg': None, 'gain_avg': None, 'categories': {}}
+
+    # --- 작업 큐 ---
+
+    _JOB_COLUMNS = "id, kind, status, total, completed, failed, error, created_at, started_at, finished_at, updated_at"
+
+    def create_job(self, job_id, kind, params, total):
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, total) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(params, ensure_ascii=False), total)
+            )
+        return job_id
+
+    def get_job(self, job_id, include_params=False):
+        columns = self._JOB_COLUMNS + (", params" if include_params else "")
+        with self._get_connection() as conn:
+            row = conn.execute(f"SELECT {columns} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        if include_params:
+            job['params'] = json.loads(job['params'])
+        return job
+
+    def list_jobs(self, status=None, limit=50):
+        """최근 작업 목록 (입력 데이터 제외)"""
+        query = f"SELECT {self._JOB_COLUMNS} FROM jobs"
+        params = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC, rowid DESC LIMIT ?"
+        params.append(max(1, min(int(limit), 500)))
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def get_unfinished_job_ids(self):
+        """대기/실행 중 상태로 남아 있는 작업 (재시작 시 재개 대상, 생성 순)"""
+        with self._get_connection() as conn:
+            return [row[0] for row in conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at, rowid"
+            )]
+
+    def update_job_status(self, job_id, status, error=None, expected_status=None):
+        """
+        상태 변경 (running: 시작 시각, completed/failed/cancelled: 종료 시각 기록)
+        - expected_status: 현재 상태가 이 값일 때만 변경 (그 사이 취소된 작업을 덮어쓰지 않음)
+        - 반환: 변경 여부
+        """
+        timestamps = ""
+        if status == 'running':
+            timestamps = ", started_at = COALESCE(started_at, CURRENT_TIMESTAMP), finished_at = NULL"
+        elif status in ('completed', 'failed', 'cancelled'):
+            timestamps = ", finished_at = CURRENT_TIMESTAMP"
+        query = f"UPDATE jobs SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP{timestamps} WHERE id = ?"
+        params = [status, error, job_id]
+        if expected_status:
+            query += " AND status = ?"
+            params.append(expected_status)
+        with self._get_connection() as conn:
+            return conn.execute(query, params).rowcount > 0
+
+    def save_job_item(self, job_id, item_index, result=None, error=None):
+        """항목 결과 저장 및 진행 카운터 갱신 (한 트랜잭션)"""
+        codec, data = (None, None)
+        if result is not None:
+            codec, data = _compress(json.dumps(result, ensure_ascii=False), self.blob_codec)
+        status = 'failed' if error else 'completed'
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_items (job_id, item_index, status, codec, result, error) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, item_index, status, codec, data, error)
+            )
+            conn.execute(
+                "UPDATE jobs SET completed = completed + ?, failed = failed + ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (0 if error else 1, 1 if error else 0, job_id)
+            )
+
+    def get_job_item_indexes(self, job_id):
+        """이미 결과가 저장된 항목 번호 (재개 시 건너뜀)"""
+        with self._get_connection() as conn:
+            return {row[0] for row in conn.execute("SELECT item_index FROM job_items WHERE job_id = ?", (job_id,))}
+
+    def get_job_items(self, job_id, offset=0, limit=100):
+        """항목별 결과 (항목 번호 순) - [{'index', 'status', 'result' | 'error'}]"""
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT item_index, status, codec, result, error FROM job_items
+                WHERE job_id = ? ORDER BY item_index LIMIT ? OFFSET ?
+            """, (job_id, limit, offset)).fetchall()
+        items = []
+        for row in rows:
+            item = {'index': row['item_index'], 'status': row['status']}
+            if row['result'] is not None:
+                item['result'] = json.loads(_decompress(row['codec'], row['result']))
+            if row['error']:
+                item['error'] = row['error']
+            items.append(item)
+        return items
+
+    def delete_job(self, job_id):
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM job_items WHERE job_id = ?", (job_id,))
+            return conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,)).rowcount > 0
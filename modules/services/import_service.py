@@ -0,0 +1,304 @@
+"""
+Import Service - 요구사항 문서(xlsx/csv/markdown) 일괄 가져오기
+- RequirementReader: 업로드 파일을 한 행씩 읽어 {row, req_id, text} 생성 (문서 전체를 메모리에 올리지 않음)
+  (xlsx는 openpyxl read-only 모드, csv는 스트림 그대로, markdown은 표 또는 목록 항목)
+- ID/본문 열은 헤더 이름, 열 문자(A, B...), 1부터 시작하는 번호로 지정 (미지정 시 헤더로 자동 선택)
+- ImportService: 읽은 요구사항을 일괄 평가/개선(동시 실행 수 제한)에 넘기고 완료되는 대로 히스토리에 저장
+  (처리 중인 항목과 저장 대기 버퍼만 메모리에 유지)
+"""
+import csv
+import io
+import re
+import time
+import uuid
+import config
+
+IMPORT_FORMATS = {
+    '.xlsx': 'xlsx', '.xlsm': 'xlsx',
+    '.csv': 'csv', '.tsv': 'csv',
+    '.md': 'markdown', '.markdown': 'markdown', '.txt': 'markdown'
+}
+IMPORT_ACTIONS = ('evaluate', 'improve')
+
+# 열 자동 선택용 헤더 이름 (소문자, 공백/밑줄 제거 후 비교)
+_ID_HEADERS = ('id', 'reqid', 'requirementid', '요구사항id', '요구사항번호', '번호', 'no')
+_TEXT_HEADERS = ('requirement', 'requirements', 'text', 'description', 'statement', '요구사항', '요구사항내용', '내용', '설명')
+
+_MD_TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?$")
+_MD_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.+)$")
+# 목록 항목 앞의 요구사항 ID: "REQ-001: ...", "**REQ-001** ...", "[REQ-001] ..."
+_MD_ITEM_ID = re.compile(r"^(?:\*\*|\[)?([A-Za-z][\w]*(?:-[\w]+)*-\d+)(?:\*\*|\])?\s*[:：\-–]?\s*(.+)$")
+
+
+def _normalize_header(value):
+    return re.sub(r"[\s_]+", '', str(value or '')).lower()
+
+
+def _cell_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        # 엑셀 숫자 ID (1.0 → "1")
+        return str(int(value))
+    return str(value).strip()
+
+
+class RequirementReader:
+    """
+    요구사항 문서 행 단위 reader - 생성 시 헤더를 읽어 열을 확정하고(잘못된 지정은 ValueError),
+    반복 시 {'row': 원본 행 번호, 'req_id', 'text'}를 하나씩 반환
+    """
+
+    def __init__(self, stream, filename, id_column=None, text_column=None, sheet=None,
+                 id_prefix='REQ', encoding='utf-8-sig'):
+        extension = '.' + filename.rsplit('.', 1)[-1].lower() if '.' in (filename or '') else ''
+        self.format = IMPORT_FORMATS.get(extension)
+        if self.format is None:
+            raise ValueError(f"Unsupported import file type: {filename} (expected {', '.join(IMPORT_FORMATS)})")
+        self.id_prefix = id_prefix or 'REQ'
+
+        if self.format == 'xlsx':
+            self._rows = self._xlsx_rows(stream, sheet)
+        elif self.format == 'csv':
+            self._rows = self._csv_rows(stream, encoding, '\t' if extension == '.tsv' else ',')
+        else:
+            self._rows = self._markdown_rows(stream, encoding)
+
+        header_row, header = next(self._rows, (0, None))
+        if header is None:
+            raise ValueError("Import file has no header row")
+        self.header = [_cell_text(cell) for cell in header]
+        self.id_index = self._resolve_column(id_column, _ID_HEADERS, 'ID')
+        self.text_index = self._resolve_column(text_column, _TEXT_HEADERS, 'text')
+        if self.text_index is None:
+            # 본문 열을 찾지 못하면 ID 열이 아닌 첫 번째 열
+            self.text_index = next((i for i in range(len(self.header)) if i != self.id_index), None)
+            if self.text_index is None:
+                raise ValueError("Import file has no requirement text column")
+
+    def _resolve_column(self, spec, candidates, label):
+        """열 지정(헤더 이름 / 열 문자 / 1부터 시작하는 번호) → 0부터 시작하는 인덱스"""
+        normalized = [_normalize_header(h) for h in self.header]
+        if spec is None or str(spec).strip() == '':
+            for candidate in candidates:
+                if candidate in normalized:
+                    return normalized.index(candidate)
+            return None
+
+        spec = str(spec).strip()
+        if _normalize_header(spec) in normalized:
+            return normalized.index(_normalize_header(spec))
+        if spec.isdigit() and 1 <= int(spec) <= len(self.header):
+            return int(spec) - 1
+        if re.fullmatch(r"[A-Za-z]{1,3}", spec):
+            index = self._column_letter_index(spec)
+            if index < len(self.header):
+                return index
+        raise ValueError(f"{label} column not found: {spec} (columns: {', '.join(self.header)})")
+
+    @staticmethod
+    def _column_letter_index(letters):
+        # 엑셀 열 문자 → 0부터 시작하는 인덱스 (A → 0, AA → 26)
+        index = 0
+        for letter in letters.upper():
+            index = index * 26 + ord(letter) - ord('A') + 1
+        return index - 1
+
+    def __iter__(self):
+        count = 0
+        for row_number, cells in self._rows:
+            text = _cell_text(cells[self.text_index]) if self.text_index < len(cells) else ''
+            if not text:
+                continue
+            count += 1
+            req_id = ''
+            if self.id_index is not None and self.id_index < len(cells):
+                req_id = _cell_text(cells[self.id_index])
+            yield {
+                'row': row_number,
+                'req_id': req_id or f"{self.id_prefix}-{count:03d}",
+                'text': text
+            }
+
+    # --- 형식별 행 읽기: (행 번호, 셀 목록) - 첫 번째는 헤더 ---
+
+    @staticmethod
+    def _xlsx_rows(stream, sheet):
+        # openpyxl은 xlsx 가져오기에서만 사용 (서버 시작 시 import하지 않음)
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            if sheet is None or str(sheet).strip() == '':
+                worksheet = workbook.worksheets[0]
+            elif str(sheet) in workbook.sheetnames:
+                worksheet = workbook[str(sheet)]
+            elif str(sheet).isdigit() and 1 <= int(sheet) <= len(workbook.worksheets):
+                worksheet = workbook.worksheets[int(sheet) - 1]
+            else:
+                raise ValueError(f"Sheet not found: {sheet} (sheets: {', '.join(workbook.sheetnames)})")
+
+            header_seen = False
+            for row_number, cells in enumerate(worksheet.iter_rows(values_only=True), start=1):
+                # 헤더 앞의 빈 행은 건너뜀
+                if not header_seen and not any(_cell_text(c) for c in cells):
+                    continue
+                header_seen = True
+                yield row_number, cells
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _csv_rows(stream, encoding, delimiter):
+        text_stream = io.TextIOWrapper(stream, encoding=encoding, newline='')
+        try:
+            header_seen = False
+            for row_number, cells in enumerate(csv.reader(text_stream, delimiter=delimiter), start=1):
+                if not header_seen and not any(c.strip() for c in cells):
+                    continue
+                header_seen = True
+                yield row_number, cells
+        finally:
+            # 업로드 스트림은 호출 측이 소유
+            text_stream.detach()
+
+    @staticmethod
+    def _markdown_rows(stream, encoding):
+        """첫 번째 표가 있으면 표 행, 없으면 목록 항목을 (ID, 본문) 행으로 변환"""
+        text_stream = io.TextIOWrapper(stream, encoding=encoding)
+        try:
+            layout = None  # 'table' | 'list'
+            for row_number, line in enumerate(text_stream, start=1):
+                line = line.strip()
+                if layout != 'list' and line.startswith('|'):
+                    if _MD_TABLE_SEPARATOR.match(line):
+                        continue
+                    layout = 'table'
+                    yield row_number, [cell.strip() for cell in line.strip('|').split('|')]
+                    continue
+                if layout == 'table':
+                    # 첫 번째 표가 끝나면 종료
+                    if not line:
+                        continue
+                    return
+                match = _MD_LIST_ITEM.match(line)
+                if not match:
+                    continue
+                if layout is None:
+                    layout = 'list'
+                    yield 0, ['id', 'requirement']
+                item = match.group(1).strip()
+                id_match = _MD_ITEM_ID.match(item)
+                yield row_number, [id_match.group(1), id_match.group(2)] if id_match else ['', item]
+        finally:
+            text_stream.detach()
+
+
+class ImportService:
+
+    def __init__(self, analysis_service, db_service,
+                 flush_size=config.IMPORT_HISTORY_FLUSH_SIZE, flush_seconds=config.IMPORT_HISTORY_FLUSH_SECONDS):
+        self.analysis_service = analysis_service
+        self.db_service = db_service
+        self.flush_size = max(1, flush_size)
+        self.flush_seconds = flush_seconds
+
+    def run(self, reader, action='evaluate', concurrency=None, mode=None, pipeline=None,
+            pattern_data=None, use_cache=True, save=True):
+        """
+        reader의 요구사항을 평가/개선하여 완료 순서대로 yield
+        - 각 결과: {'index', 'row', 'req_id', 'result'} 또는 {..., 'error'}
+        - 마지막: {'done', 'count', 'errors', 'saved', 'session_id', 'elapsed'}
+        """
+        if action not in IMPORT_ACTIONS:
+            raise ValueError(f"Unsupported import action: {action}")
+
+        in_flight = {}  # index -> record (결과가 나올 때까지만 보관)
+
+        def texts():
+            for index, record in enumerate(reader):
+                in_flight[index] = record
+                yield record['text']
+
+        if action == 'evaluate':
+            results = self.analysis_service.evaluate_batch(
+                texts(), concurrency=concurrency, order='completion', use_cache=use_cache, mode=mode
+            )
+        else:
+            results = self.analysis_service.improve_batch(
+                texts(), pattern_data, concurrency=concurrency, order='completion', pipeline=pipeline, use_cache=use_cache
+            )
+        return self._collect(results, in_flight, action, save)
+
+    def _collect(self, results, in_flight, action, save):
+        started = time.perf_counter()
+        session_id = str(uuid.uuid4())
+        count = errors = saved = 0
+        save_error = None
+        buffer = []
+        buffered_at = None
+
+        def flush():
+            nonlocal saved, save_error, buffer
+            if not buffer:
+                return
+            try:
+                saved += self.db_service.save_history_batch(buffer)
+            except Exception as e:
+                print(f"Error saving imported history: {e}")
+                save_error = str(e)
+            buffer = []
+
+        for item in results:
+            record = in_flight.pop(item['index'])
+            count += 1
+            item['row'] = record['row']
+            item['req_id'] = record['req_id']
+            if 'error' in item:
+                errors += 1
+            elif save:
+                buffer.append(self._history_item(action, record, item['result'], session_id))
+                if buffered_at is None:
+                    buffered_at = time.monotonic()
+                if len(buffer) >= self.flush_size or time.monotonic() - buffered_at >= self.flush_seconds:
+                    flush()
+                    buffered_at = None
+            yield item
+        flush()
+
+        summary = {
+            'done': True,
+            'count': count,
+            'errors': errors,
+            'saved': saved,
+            'session_id': session_id if saved else None,
+            'elapsed': round(time.perf_counter() - started, 3)
+        }
+        if save_error:
+            summary['save_error'] = save_error
+        yield summary
+
+    @staticmethod
+    def _history_item(action, record, result, session_id):
+        """평가/개선 결과 → 히스토리 항목 (점수는 프론트엔드 저장과 동일한 백분율)"""
+        if action == 'evaluate':
+            return {
+                'req_id': record['req_id'],
+                'original': record['text'],
+                'improved': None,
+                'original_score': round(result.get('percentage', 0)),
+                'improved_score': None,
+                'session_id': session_id,
+                'full_data': {'original_scores': result}
+            }
+        improved = (result.get('improved_result') or {}).get('improved') or ''
+        return {
+            'req_id': record['req_id'],
+            'original': record['text'],
+            # 평가 섹션(###) 이전까지만 카드에 표시
+            'improved': re.split(r'\n###', improved)[0].strip(),
+            'original_score': round(result['original_scores'].get('percentage', 0)),
+            'improved_score': round(result['improved_scores'].get('percentage', 0)),
+            'session_id': session_id,
+            'full_data': result
+        }
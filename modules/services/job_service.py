@@ -0,0 +1,152 @@
+"""
+Job Service - history.db 기반 백그라운드 작업 큐
+- 평가/개선 요청을 작업으로 등록하고 즉시 반환 (요청 스레드가 LLM 호출을 기다리지 않음)
+- 작업 워커 풀(JOB_WORKERS)에서 실행, 작업 내 항목은 AnalysisService 일괄 처리로 동시 실행
+- 항목 결과는 완료 즉시 job_items에 저장 → 진행률 조회 및 부분 결과 조회 가능
+- 프로세스 재시작 시 대기/실행 중이던 작업을 저장되지 않은 항목부터 재개
+"""
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from modules.evaluator import EVALUATE_MODES
+import config
+
+JOB_KINDS = ('evaluate', 'improve')
+JOB_STATUSES = ('queued', 'running', 'completed', 'failed', 'cancelled')
+
+
+class JobService:
+
+    def __init__(self, analysis_service, db_service, workers=config.JOB_WORKERS,
+                 item_concurrency=config.JOB_ITEM_CONCURRENCY):
+        self.analysis_service = analysis_service
+        self.db_service = db_service
+        self.item_concurrency = item_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='job')
+        self._cancelled = set()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, texts, options=None):
+        """
+        작업 등록 후 job_id 반환
+        - texts: 요구사항 문자열 목록 (단건 요청은 1개짜리 목록)
+        - options: mode, use_cache, concurrency (evaluate) / pipeline, pattern_data, use_cache, concurrency (improve)
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unsupported job kind: {kind}")
+        if not isinstance(texts, list) or not texts:
+            raise ValueError("texts must be a non-empty list")
+        options = dict(options or {})
+        if kind == 'evaluate' and options.get('mode') and options['mode'] not in EVALUATE_MODES:
+            raise ValueError(f"Unsupported evaluate mode: {options['mode']}")
+
+        job_id = uuid.uuid4().hex
+        self.db_service.create_job(job_id, kind, {'texts': texts, 'options': options}, len(texts))
+        self.executor.submit(self._run, job_id)
+        return job_id
+
+    def resume(self):
+        """재시작 전 완료되지 않은 작업 다시 실행 (반환: 재개한 작업 수)"""
+        job_ids = self.db_service.get_unfinished_job_ids()
+        for job_id in job_ids:
+            self.db_service.update_job_status(job_id, 'queued')
+            self.executor.submit(self._run, job_id)
+        if job_ids:
+            print(f"Resuming {len(job_ids)} unfinished job(s)")
+        return len(job_ids)
+
+    def cancel(self, job_id):
+        """대기/실행 중인 작업 취소 (실행 중인 항목은 끝까지 진행되지만 결과는 저장하지 않음)"""
+        job = self.db_service.get_job(job_id)
+        if job is None:
+            return None
+        if job['status'] in ('queued', 'running'):
+            with self._lock:
+                self._cancelled.add(job_id)
+            self.db_service.update_job_status(job_id, 'cancelled')
+        return self.status(job_id)
+
+    @staticmethod
+    def _with_progress(job):
+        done = job['completed'] + job['failed']
+        job['progress'] = round(done / job['total'] * 100, 1) if job['total'] else 100.0
+        return job
+
+    def status(self, job_id):
+        """작업 상태 및 진행률(%)"""
+        job = self.db_service.get_job(job_id)
+        return self._with_progress(job) if job is not None else None
+
+    def list_jobs(self, status=None, limit=50):
+        if status and status not in JOB_STATUSES:
+            raise ValueError(f"Unknown job status: {status}")
+        return [self._with_progress(job) for job in self.db_service.list_jobs(status, limit)]
+
+    def results(self, job_id, offset=0, limit=100):
+        job = self.status(job_id)
+        if job is None:
+            return None
+        limit = max(1, min(int(limit), 1000))
+        items = self.db_service.get_job_items(job_id, max(0, int(offset)), limit + 1)
+        job['items'] = items[:limit]
+        job['has_more'] = len(items) > limit
+        return job
+
+    def shutdown(self):
+        # 실행 중인 작업은 DB에 running으로 남아 다음 시작 시 재개
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _is_cancelled(self, job_id):
+        with self._lock:
+            return job_id in self._cancelled
+
+    def _run(self, job_id):
+        job = self.db_service.get_job(job_id, include_params=True)
+        if job is None or job['status'] not in ('queued', 'running') or self._is_cancelled(job_id):
+            with self._lock:
+                self._cancelled.discard(job_id)
+            return
+
+        texts = job['params']['texts']
+        options = job['params'].get('options', {})
+        done = self.db_service.get_job_item_indexes(job_id)
+        pending = [index for index in range(len(texts)) if index not in done]
+        self.db_service.update_job_status(job_id, 'running')
+
+        try:
+            results = self._start_batch(job['kind'], [texts[index] for index in pending], options)
+            try:
+                for item in results:
+                    if self._is_cancelled(job_id):
+                        # 시작 직후 취소된 경우 running 기록을 덮어씀
+                        self.db_service.update_job_status(job_id, 'cancelled')
+                        return
+                    # 일괄 처리 번호 → 작업 내 원래 항목 번호
+                    self.db_service.save_job_item(
+                        job_id, pending[item['index']], item.get('result'), item.get('error')
+                    )
+            finally:
+                results.close()
+        except Exception as e:
+            print(f"Job {job_id} failed: {e}")
+            self.db_service.update_job_status(job_id, 'failed', str(e), expected_status='running')
+            return
+        finally:
+            with self._lock:
+                self._cancelled.discard(job_id)
+
+        # 마지막 항목 저장 후 취소된 경우 cancelled 상태 유지
+        if not self.db_service.update_job_status(job_id, 'completed', expected_status='running'):
+            print(f"Job {job_id} was cancelled before completion")
+
+    def _start_batch(self, kind, texts, options):
+        concurrency = options.get('concurrency') or self.item_concurrency
+        use_cache = options.get('use_cache', True)
+        if kind == 'evaluate':
+            return self.analysis_service.evaluate_batch(
+                texts, concurrency=concurrency, order='completion', use_cache=use_cache, mode=options.get('mode')
+            )
+        return self.analysis_service.improve_batch(
+            texts, options.get('pattern_data'), concurrency=concurrency, order='completion',
+            pipeline=options.get('pipeline'), use_cache=use_cache
+        )
@@ -0,0 +1,91 @@
+"""
+테스트 공통 설정
+- 저장소 루트를 import 경로에 추가
+- HOME을 임시 디렉토리로 지정하여 실제 사용자 데이터(~/.Codelia)와 분리
+- home / db_service / config_service fixture: 테스트마다 새 홈 디렉토리 사용
+- fake_client / analysis_service fixture: LLM 호출 대신 FakeAIClient 사용
+- api_client fixture: api.py Flask 테스트 클라이언트 (모듈 전역 서비스는 세션 공용 임시 HOME 사용)
+- llm_server fixture: benchmarks/mock_llm_server를 임의 포트로 실행 (맺은 TCP 연결 수 기록)
+"""
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+# 테스트 중 import되는 모듈이 실제 홈 디렉토리를 쓰지 않도록 수집 전에 지정
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='codelia-test-')
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('USERPROFILE', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def db_service(home):
+    from modules.services.database_service import DatabaseService
+
+    db = DatabaseService()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def config_service(home):
+    from modules.services.config_service import ConfigService
+
+    return ConfigService()
+
+
+@pytest.fixture
+def fake_client():
+    from fakes import FakeAIClient
+
+    return FakeAIClient()
+
+
+@pytest.fixture
+def analysis_service(config_service, fake_client, monkeypatch):
+    from modules.services.analysis_service import AnalysisService
+
+    service = AnalysisService(config_service)
+    monkeypatch.setattr(service, '_create_ai_client', lambda: fake_client)
+    yield service
+    service.executor.shutdown(wait=False, cancel_futures=True)
+    service.shard_executor.shutdown(wait=False, cancel_futures=True)
+
+
+@pytest.fixture
+def llm_server():
+    import mock_llm_server
+
+    server = mock_llm_server.create_server(port=0)
+    server.connections = []
+    process_request = server.process_request
+
+    def counting(request, client_address):
+        server.connections.append(client_address)
+        return process_request(request, client_address)
+
+    server.process_request = counting
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api_client():
+    import api
+
+    return api.app.test_client()
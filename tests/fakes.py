@@ -0,0 +1,87 @@
+"""
+테스트용 가짜 구성 요소
+- FakeAIClient: AIClient 대체 - 평가 요청에는 채점 JSON, 개선 요청에는 개선 텍스트 반환
+  (요청 종류별 지연, 호출 기록, 응답 함수 교체 지원)
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+
+from modules.evaluator import RequirementEvaluator
+
+ALL_RULES = [rule for rules in RequirementEvaluator.CATEGORIES.values() for rule in rules]
+_SCORE_ONLY = re.compile(r"Score ONLY these \d+ rules: ([A-Z0-9, ]+)")
+IMPROVED_TEXT = "시스템은 요청을 1초 이내에 처리해야 한다."
+
+
+def scores_json(rules, score=4):
+    return json.dumps({rule: {'score': score, 'reason': 'ok'} for rule in rules}, ensure_ascii=False)
+
+
+def requested_rules(system_prompt):
+    match = _SCORE_ONLY.search(system_prompt)
+    return [rule.strip() for rule in match.group(1).split(',')] if match else ALL_RULES
+
+
+class FakeAIClient:
+    provider = 'openai'
+
+    def __init__(self, delays=None, respond=None, chunks=4):
+        self.delays = dict(delays or {})  # 'evaluate' | 'improve' -> 초
+        self.respond = respond            # (system_prompt, user_message) -> 응답 문자열
+        self.chunks = chunks
+        self.calls = []                   # (종류, 시작 시각, 종료 시각)
+        self.discarded = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def kind(user_message):
+        return 'evaluate' if 'Requirement to Evaluate' in user_message else 'improve'
+
+    def response(self, system_prompt, user_message):
+        if self.respond is not None:
+            return self.respond(system_prompt, user_message)
+        if self.kind(user_message) == 'evaluate':
+            return scores_json(requested_rules(system_prompt))
+        return IMPROVED_TEXT
+
+    def _record(self, kind, started):
+        with self._lock:
+            self.calls.append((kind, started, time.perf_counter()))
+
+    def call_api(self, system_prompt, user_message, use_cache=True):
+        kind = self.kind(user_message)
+        started = time.perf_counter()
+        time.sleep(self.delays.get(kind, 0))
+        try:
+            return self.response(system_prompt, user_message)
+        finally:
+            self._record(kind, started)
+
+    async def acall_api(self, system_prompt, user_message, use_cache=True):
+        kind = self.kind(user_message)
+        started = time.perf_counter()
+        await asyncio.sleep(self.delays.get(kind, 0))
+        try:
+            return self.response(system_prompt, user_message)
+        finally:
+            self._record(kind, started)
+
+    def stream_api(self, system_prompt, user_message, use_cache=True):
+        kind = self.kind(user_message)
+        started = time.perf_counter()
+        text = self.response(system_prompt, user_message)
+        size = max(1, len(text) // self.chunks + 1)
+        for i in range(0, len(text), size):
+            time.sleep(self.delays.get(kind, 0) / self.chunks)
+            yield text[i:i + size]
+        self._record(kind, started)
+
+    def discard_cached(self, system_prompt, user_message):
+        self.discarded.append((system_prompt, user_message))
+
+    def spans(self, kind):
+        with self._lock:
+            return [(start, end) for k, start, end in self.calls if k == kind]
@@ -0,0 +1,114 @@
+import sqlite3
+
+import pytest
+
+from modules.services.database_service import DatabaseService, _req_family, _week_bucket
+
+
+def full_data(original, improved):
+    return {
+        'original_scores': {'categories': {'Clarity': {'score': original, 'max': 10}, 'Bad': 'x'}},
+        'improved_scores': {'categories': {'Clarity': {'score': improved, 'max': 10}}},
+    }
+
+
+ITEMS = [
+    {'req_id': 'REQ-001', 'original_score': 100, 'improved_score': 200, 'session_id': 's1',
+     'full_data': full_data(4, 8), 'created_at': '2026-03-02 09:00:00'},
+    {'req_id': 'REQ-002-001', 'original_score': 120, 'improved_score': 180, 'session_id': 's1',
+     'full_data': full_data(6, 9), 'created_at': '2026-03-03 09:00:00'},
+    {'req_id': 'SYS_7', 'original_score': None, 'improved_score': 150, 'session_id': 's2',
+     'full_data': None, 'created_at': '2026-03-10 09:00:00'},
+]
+
+
+def snapshot(db):
+    return {dimension: db.get_analytics(dimension) for dimension in ('all', 'family', 'session', 'week')}
+
+
+@pytest.mark.parametrize('req_id, family', [('REQ-001', 'REQ'), ('REQ-002-001', 'REQ'), ('SYS_7', 'SYS'), ('ABC', 'ABC'), ('', '')])
+def test_req_family(req_id, family):
+    assert _req_family(req_id) == family
+
+
+def test_week_bucket():
+    assert _week_bucket('2026-03-02 09:00:00') == '2026-W10'
+    assert _week_bucket(None) == 'unknown'
+
+
+def test_incremental_stats_match_full_rebuild(db_service):
+    db_service.save_history_batch(ITEMS[:2])
+    db_service.save_history_item(dict(ITEMS[2], original='x'))
+    incremental = snapshot(db_service)
+
+    assert db_service.rebuild_analytics() == 3
+    # save_history_item은 현재 시각으로 저장하므로 week만 비교 대상에서 제외
+    rebuilt = snapshot(db_service)
+    for dimension in ('all', 'family', 'session'):
+        assert incremental[dimension] == rebuilt[dimension]
+
+
+def test_summary_averages_and_categories(db_service):
+    db_service.save_history_batch(ITEMS)
+    summary = db_service.get_analytics_summary()
+
+    assert summary['count'] == 3
+    assert summary['original_avg'] == 110.0  # 점수 없는 행은 평균에서 제외
+    assert summary['improved_avg'] == pytest.approx(176.7)
+    assert summary['gain_avg'] == pytest.approx(66.7)
+    assert summary['categories']['Clarity']['original'] == {'count': 2, 'avg_score': 5.0, 'avg_max': 10.0, 'percentage': 50.0}
+    assert summary['categories']['Clarity']['improved']['percentage'] == 85.0
+
+
+def test_dimension_buckets_and_order(db_service):
+    db_service.save_history_batch(ITEMS)
+
+    assert [(item['bucket'], item['count']) for item in db_service.get_analytics('family')['items']] == [('REQ', 2), ('SYS', 1)]
+    assert [item['bucket'] for item in db_service.get_analytics('week')['items']] == ['2026-W11', '2026-W10']
+    sessions = db_service.get_analytics('session', include_categories=False)['items']
+    assert [(item['bucket'], item['count']) for item in sessions] == [('s1', 2), ('s2', 1)]
+    assert 'categories' not in sessions[0]
+
+
+def test_delete_decrements_and_drops_empty_buckets(db_service):
+    db_service.save_history_batch(ITEMS)
+    ids = {row['req_id']: row['id'] for row in db_service.get_history_list()}
+
+    db_service.delete_history_item(ids['SYS_7'])
+    assert [item['bucket'] for item in db_service.get_analytics('family')['items']] == ['REQ']
+    assert db_service.get_analytics_summary()['improved_avg'] == 190.0
+
+    db_service.delete_history_item(ids['REQ-001'])
+    db_service.delete_history_item(ids['REQ-002-001'])
+    assert db_service.get_analytics_summary()['count'] == 0
+    for table in ('history_stats', 'history_category_stats'):
+        assert db_service.connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0
+
+
+def test_unknown_dimension_is_rejected(db_service, api_client):
+    with pytest.raises(ValueError, match='Unknown analytics dimension'):
+        db_service.get_analytics('month')
+    assert api_client.get('/api/analytics/month').status_code == 400
+    assert api_client.get('/api/analytics/family?limit=5').status_code == 200
+
+
+def test_v2_database_is_backfilled_on_open(home):
+    db = DatabaseService()
+    db.save_history_batch(ITEMS)
+    expected = snapshot(db)
+    db.close()
+
+    # 집계 테이블이 없던 v2 상태로 되돌림
+    conn = sqlite3.connect(home / '.Codelia' / 'history.db')
+    conn.execute("DROP TABLE history_stats")
+    conn.execute("DROP TABLE history_category_stats")
+    conn.execute("PRAGMA user_version = 2")
+    conn.commit()
+    conn.close()
+
+    reopened = DatabaseService()
+    try:
+        assert reopened.connection().execute("PRAGMA user_version").fetchone()[0] == 3
+        assert snapshot(reopened) == expected
+    finally:
+        reopened.close()
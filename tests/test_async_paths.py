@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from fakes import ALL_RULES, requested_rules, scores_json
+
+
+def max_overlap(spans):
+    """동시에 진행 중이던 호출 수의 최댓값"""
+    points = sorted([(start, 1) for start, _ in spans] + [(end, -1) for _, end in spans])
+    active = peak = 0
+    for _, step in points:
+        active += step
+        peak = max(peak, active)
+    return peak
+
+
+def test_aevaluate_batch_keeps_input_order_and_reports_item_errors(analysis_service, fake_client):
+    def respond(system_prompt, user_message):
+        if 'broken' in user_message:
+            raise RuntimeError('upstream failed')
+        return scores_json(requested_rules(system_prompt))
+
+    fake_client.respond = respond
+    results = asyncio.run(analysis_service.aevaluate_batch(['first', '', 'broken', 'last'], mode='full'))
+
+    assert [item['index'] for item in results] == [0, 1, 2, 3]
+    assert results[1]['error'] == 'No text provided'
+    assert 'upstream failed' in results[2]['error']
+    for item in (results[0], results[3]):
+        assert 'error' not in item
+        assert set(item['result']['scores']) >= set(ALL_RULES)
+
+
+def test_aevaluate_batch_runs_on_one_loop_within_concurrency(analysis_service, fake_client):
+    fake_client.delays = {'evaluate': 0.1}
+
+    started = time.perf_counter()
+    results = asyncio.run(analysis_service.aevaluate_batch([f'req {i}' for i in range(8)], concurrency=4, mode='full'))
+    elapsed = time.perf_counter() - started
+
+    assert len(results) == 8 and all('error' not in item for item in results)
+    assert max_overlap(fake_client.spans('evaluate')) == 4
+    # 4개씩 두 차례 - 순차 실행(0.8초)보다 훨씬 짧음
+    assert elapsed < 0.5
+
+
+def test_aevaluate_batch_validates_mode_up_front(analysis_service):
+    with pytest.raises(ValueError, match='Unsupported evaluate mode'):
+        asyncio.run(analysis_service.aevaluate_batch(['a'], mode='quick'))
+
+
+def test_aevaluate_rejects_empty_text(analysis_service):
+    with pytest.raises(ValueError, match='No text provided'):
+        asyncio.run(analysis_service.aevaluate(''))
+
+
+def test_aimprove_concurrent_overlaps_original_scoring(analysis_service, fake_client):
+    fake_client.delays = {'evaluate': 0.15, 'improve': 0.15}
+
+    result = asyncio.run(analysis_service.aimprove('시스템은 빨라야 한다.', {}, pipeline='concurrent'))
+
+    (improve_start, improve_end), = fake_client.spans('improve')
+    original, improved = sorted(fake_client.spans('evaluate'))
+    assert original[0] < improve_end and improve_start < original[1]
+    assert improved[0] >= improve_end
+    assert result['timings']['total'] < 0.15 * 3
+
+
+def test_aimprove_matches_sync_improve(analysis_service):
+    for pipeline in ('concurrent', 'sequential'):
+        async_result = asyncio.run(analysis_service.aimprove('시스템은 빨라야 한다.', {}, pipeline=pipeline))
+        sync_result = analysis_service.improve('시스템은 빨라야 한다.', {}, pipeline=pipeline)
+        assert async_result['pipeline'] == pipeline
+        for key in ('original_scores', 'improved_result', 'improved_scores', 'comparison', 'explanations'):
+            assert async_result[key] == sync_result[key]
+
+
+@pytest.mark.parametrize('text, pipeline', [('', None), ('text', 'parallel')])
+def test_aimprove_rejects_invalid_input(analysis_service, text, pipeline):
+    with pytest.raises(ValueError):
+        asyncio.run(analysis_service.aimprove(text, {}, pipeline=pipeline))
+
+
+@pytest.fixture
+def restore_async_http():
+    from modules.llm import async_http
+
+    configure = async_http.configure
+    yield async_http
+    configure()
+
+
+def test_async_client_sends_requests_through_configured_proxy(restore_async_http, llm_server):
+    # 모의 서버를 전달 프록시로 사용 - 대상 호스트는 존재하지 않으므로 프록시를 거쳐야만 응답
+    proxy = llm_server.url.rsplit('/v1', 1)[0]
+    restore_async_http.configure(proxies={'http': proxy, 'https': ''})
+    payload = {'model': 'm', 'messages': [{'role': 'system', 'content': 's'}, {'role': 'user', 'content': 'Improve'}]}
+
+    async def call():
+        try:
+            return await restore_async_http.apost_json('http://llm.invalid/v1/chat/completions', payload, {})
+        finally:
+            await restore_async_http.aclose()
+
+    response = asyncio.run(call())
+    assert response['choices'][0]['message']['content']
+    assert llm_server.connections
+
+
+def test_analysis_service_passes_proxy_settings_when_enabled(config_service, monkeypatch, restore_async_http):
+    import config
+    from modules.services.analysis_service import AnalysisService
+
+    configured = {}
+    monkeypatch.setattr(config, 'USE_PROXY', True)
+    monkeypatch.setattr(config, 'PROXY_SETTINGS', {'http': 'http://proxy:8080', 'https': 'http://proxy:8080'})
+    monkeypatch.setattr(restore_async_http, 'configure', lambda pool_size, proxies=None: configured.update(proxies=proxies))
+
+    service = AnalysisService(config_service)
+    service.executor.shutdown()
+    service.shard_executor.shutdown()
+
+    assert configured['proxies'] == config.PROXY_SETTINGS
+    assert service.provider_registry.proxies == config.PROXY_SETTINGS
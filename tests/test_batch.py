@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+
+import pytest
+
+import config
+from fakes import ALL_RULES, requested_rules, scores_json
+
+
+def respond_after(delays):
+    """요구사항 본문별 지연 후 채점 JSON 반환"""
+    def respond(system_prompt, user_message):
+        for text, delay in delays.items():
+            if text in user_message:
+                time.sleep(delay)
+        return scores_json(requested_rules(system_prompt))
+    return respond
+
+
+@pytest.mark.parametrize('method', ['evaluate_batch', 'improve_batch'])
+def test_invalid_order_fails_before_iteration(analysis_service, method):
+    with pytest.raises(ValueError, match='Unsupported batch order'):
+        getattr(analysis_service, method)(['a'], order='random')
+
+
+def test_invalid_mode_and_missing_key_fail_before_iteration(analysis_service, monkeypatch):
+    with pytest.raises(ValueError, match='Unsupported evaluate mode'):
+        analysis_service.evaluate_batch(['a'], mode='quick')
+
+    def no_key():
+        raise ValueError("API key for openai not found")
+
+    monkeypatch.setattr(analysis_service, '_create_ai_client', no_key)
+    with pytest.raises(ValueError, match='API key'):
+        analysis_service.evaluate_batch(['a'], mode='full')
+
+
+def test_input_order_is_kept(analysis_service, fake_client):
+    fake_client.respond = respond_after({'first': 0.2, 'second': 0.0})
+    results = list(analysis_service.evaluate_batch(['first', 'second', 'third'], concurrency=3, mode='full'))
+    assert [item['index'] for item in results] == [0, 1, 2]
+    assert all('error' not in item and item['result']['scores'].keys() == set(ALL_RULES) for item in results)
+
+
+def test_completion_order_yields_fastest_first(analysis_service, fake_client):
+    fake_client.respond = respond_after({'slow': 0.3})
+    results = list(analysis_service.evaluate_batch(['slow', 'fast'], concurrency=2, order='completion', mode='full'))
+    assert [item['index'] for item in results] == [1, 0]
+
+
+def test_item_errors_do_not_stop_the_batch(analysis_service):
+    results = list(analysis_service.evaluate_batch(['ok', '  ', 'ok again'], mode='full'))
+    assert [('error' in item) for item in results] == [False, True, False]
+    assert results[1] == {'index': 1, 'error': 'No text provided'}
+
+
+def test_input_is_consumed_lazily(analysis_service, fake_client):
+    fake_client.delays = {'evaluate': 0.05}
+    consumed = []
+
+    def texts():
+        for i in range(100):
+            consumed.append(i)
+            yield f"requirement {i}"
+
+    results = analysis_service.evaluate_batch(texts(), concurrency=2, mode='full')
+    next(results)
+    # 동시 실행 2개 + 출력 대기 결과는 concurrency * 2개까지만
+    assert len(consumed) <= 2 * 2 + 1
+    results.close()
+
+
+def test_concurrency_is_capped(analysis_service, fake_client):
+    fake_client.delays = {'evaluate': 0.05}
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def tracking(system_prompt, user_message):
+        with lock:
+            active.append(1)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return scores_json(requested_rules(system_prompt))
+
+    fake_client.respond = tracking
+    list(analysis_service.evaluate_batch([f"r{i}" for i in range(40)], concurrency=1000, mode='full'))
+    assert 1 < peak[0] <= config.BATCH_MAX_CONCURRENCY
+
+
+def test_batch_route_rejects_bad_order_with_400(api_client):
+    response = api_client.post('/api/evaluate/batch', json={'texts': ['a'], 'order': 'random'})
+    assert response.status_code == 400
+    assert 'Unsupported batch order' in response.get_json()['error']
+
+
+def test_batch_route_requires_texts(api_client):
+    assert api_client.post('/api/evaluate/batch', json={'texts': []}).status_code == 400
+
+
+def test_batch_route_streams_ndjson_with_summary(api_client, monkeypatch):
+    import api
+    from fakes import FakeAIClient
+
+    monkeypatch.setattr(api.analysis_service, '_create_ai_client', lambda: FakeAIClient())
+    response = api_client.post('/api/evaluate/batch', json={'texts': ['a', ''], 'mode': 'full'})
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert response.mimetype == 'application/x-ndjson'
+    assert [line.get('index') for line in lines[:2]] == [0, 1]
+    assert lines[-1]['done'] and lines[-1]['count'] == 2 and lines[-1]['errors'] == 1
@@ -0,0 +1,95 @@
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+import e2e_bench
+from mock_llm_server import MockState
+
+
+def post(url, body):
+    request = urllib.request.Request(url, data=json.dumps(body).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'}, method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def mock_url(server):
+    return server.url.rsplit('/v1', 1)[0] + '/__mock'
+
+
+CHAT = {'model': 'm', 'messages': [{'role': 'system', 'content': 's'}, {'role': 'user', 'content': 'Improve'}]}
+
+
+@pytest.mark.parametrize('settings, message', [
+    ({'latency': -1}, 'Invalid mock setting'),
+    ({'error_rate': 1.5}, 'Invalid mock setting'),
+    ({'speed': 1}, 'Unknown mock settings: speed'),
+])
+def test_mock_state_rejects_invalid_settings(settings, message):
+    state = MockState()
+    with pytest.raises(ValueError, match=message):
+        state.configure(**settings)
+
+
+def test_mock_state_error_injection_and_delays():
+    state = MockState(latency=0.2, jitter=0.1, token_rate=10, error_rate=1, error_status=503, seed=1)
+    assert state.injected_error() == 503
+    assert 0.2 <= state.first_token_delay() <= 0.3
+    assert state.generation_delay('a' * 400) > 0
+    assert state.snapshot()['requests'] == state.snapshot()['errors'] == 1
+
+    state.configure(error_rate=0)
+    assert state.injected_error() is None
+
+
+def test_mock_endpoint_reads_and_changes_settings(llm_server):
+    with urllib.request.urlopen(mock_url(llm_server), timeout=5) as response:
+        assert json.loads(response.read())['error_rate'] == 0.0
+
+    status, body = post(mock_url(llm_server), {'error_rate': 1, 'error_status': 429})
+    assert status == 200 and body['error_status'] == 429
+
+    status, body = post(llm_server.url + '/chat/completions', CHAT)
+    assert status == 429 and 'Injected error' in body['error']['message']
+    assert llm_server.state.snapshot()['errors'] == 1
+
+    status, body = post(mock_url(llm_server), {'error_rate': 2})
+    assert status == 400 and llm_server.state.error_rate == 1.0
+
+
+def test_mock_latency_is_applied(llm_server):
+    llm_server.state.configure(latency=0.2)
+    started = time.perf_counter()
+    status, _ = post(llm_server.url + '/chat/completions', CHAT)
+    assert status == 200 and time.perf_counter() - started >= 0.2
+
+
+@pytest.mark.parametrize('q, expected', [(50, 5), (95, 10), (99, 10), (1, 1)])
+def test_percentile_nearest_rank(q, expected):
+    assert e2e_bench.percentile(list(range(1, 11)), q) == expected
+
+
+def test_percentile_of_empty_list():
+    assert e2e_bench.percentile([], 50) is None
+
+
+def test_synthetic_history_is_deterministic():
+    first = list(e2e_bench.synthetic_history(50, seed=3))
+    assert first == list(e2e_bench.synthetic_history(50, seed=3))
+    assert len({item['req_id'] for item in first}) == 50
+    assert all((item['improved'] is None) == (item['improved_score'] is None) for item in first)
+
+
+def test_scenarios_build_requests():
+    rng = random.Random(0)
+    for name, build in e2e_bench.SCENARIOS.items():
+        method, path, body = build(rng, 1, 100, 'full')
+        assert method in ('GET', 'POST') and path.startswith('/api/')
+        assert (body is not None) == (method == 'POST')
@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+
+import pytest
+
+from modules.services.config_service import ConfigService
+
+SETTINGS = {'provider': 'openai', 'openai': {'key': 'sk-1', 'url': ''}, 'project': {'system': 'Codelia'}}
+
+
+@pytest.fixture
+def service(home):
+    # 매 호출마다 파일 변경 확인
+    return ConfigService(check_interval=0)
+
+
+def write_external(service, data):
+    """앱 밖에서 파일 수정 (mtime을 확실히 바꿔 변경 감지)"""
+    service.config_file.write_text(json.dumps(data), encoding='utf-8')
+    stat = os.stat(service.config_file)
+    os.utime(service.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_save_and_update_merge_top_level_keys(service):
+    assert service.load_config() == {}
+    assert service.save_config(SETTINGS)
+    assert service.update_config({'provider': 'claude', 'claude': {'key': 'ck'}})
+
+    saved = json.loads(service.config_file.read_text(encoding='utf-8'))
+    assert saved['provider'] == 'claude' and saved['openai'] == SETTINGS['openai']
+    assert ConfigService().load_config() == saved
+    assert not list(service.config_dir.glob('.config-*.tmp'))
+
+
+def test_load_config_returns_a_copy(service):
+    service.save_config(SETTINGS)
+    service.load_config()['openai']['key'] = 'changed'
+    assert service.get_provider_settings()['api_key'] == 'sk-1'
+
+
+def test_failed_write_keeps_previous_file(service, monkeypatch):
+    service.save_config(SETTINGS)
+
+    def broken(new_config):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(service, '_write_atomic', broken)
+    assert not service.save_config({'provider': 'gemini'})
+    assert service.load_config() == SETTINGS
+
+
+def test_external_edit_is_reloaded_and_notified(service):
+    service.save_config(SETTINGS)
+    changes = []
+    service.subscribe(lambda previous, current: changes.append((previous, current)))
+
+    write_external(service, dict(SETTINGS, provider='gemini'))
+
+    assert service.get_provider_settings()['provider'] == 'gemini'
+    assert changes == [(SETTINGS, dict(SETTINGS, provider='gemini'))]
+
+
+def test_unreadable_file_keeps_last_settings(service):
+    service.save_config(SETTINGS)
+    service.config_file.write_text('{"provider": ', encoding='utf-8')
+    assert service.load_config() == SETTINGS
+
+
+def test_subscribers_are_notified_outside_the_lock(service):
+    service.save_config(SETTINGS)
+    lock_free = []
+
+    def try_lock():
+        acquired = service._lock.acquire(timeout=1)
+        if acquired:
+            service._lock.release()
+        lock_free.append(acquired)
+
+    def subscriber(previous, current):
+        # 다른 스레드에서 잠금을 잡을 수 있으면 알림 시점에 잠금이 풀려 있음
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+
+    service.subscribe(subscriber)
+    service.update_config({'provider': 'claude'})
+    service.save_config(SETTINGS)
+    write_external(service, dict(SETTINGS, provider='gemini'))
+    service.load_config()
+
+    assert lock_free == [True, True, True]
+
+
+def test_config_update_while_clients_are_created_does_not_deadlock(service):
+    from modules.services.analysis_service import AnalysisService
+
+    service.save_config(dict(SETTINGS, fallback_providers=['claude'], claude={'key': 'ck'}))
+    analysis = AnalysisService(service)
+    errors = []
+
+    def create_clients():
+        try:
+            for _ in range(300):
+                analysis._create_ai_client()
+        except Exception as e:
+            errors.append(e)
+
+    def update_config():
+        try:
+            for i in range(300):
+                service.update_config({'openai': {'key': f'sk-{i % 3}', 'url': ''}})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=create_clients, daemon=True), threading.Thread(target=update_config, daemon=True)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(20)
+        assert not any(thread.is_alive() for thread in threads), 'config lock / clients lock deadlock'
+        assert errors == []
+    finally:
+        analysis.executor.shutdown(wait=False, cancel_futures=True)
+        analysis.shard_executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,164 @@
+import signal
+import sqlite3
+import threading
+import time
+
+import pytest
+
+
+def in_thread(func):
+    result = {}
+
+    def run():
+        result['value'] = func()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join(5)
+    return result['value'], thread
+
+
+def test_connections_use_wal_and_configured_pragmas(db_service):
+    conn = db_service.connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == db_service.busy_timeout_ms
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -db_service.cache_size_kb
+
+
+def test_connection_is_reused_per_thread(db_service):
+    conn = db_service.connection()
+    assert db_service.connection() is conn
+    assert db_service._get_connection() is conn
+
+    other, _ = in_thread(db_service.connection)
+    assert other is not conn
+
+
+def test_connections_of_finished_threads_are_closed(db_service):
+    stale, thread = in_thread(db_service.connection)
+    assert not thread.is_alive()
+
+    in_thread(db_service.connection)
+
+    assert thread not in db_service._connections
+    with pytest.raises(sqlite3.ProgrammingError):
+        stale.execute("SELECT 1")
+
+
+def test_reader_is_not_blocked_by_open_write_transaction(db_service):
+    db_service.save_history_item({'req_id': 'REQ-001', 'original': 'committed'})
+    writer = db_service.connection()
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("INSERT INTO history (req_id, original_text) VALUES ('REQ-002', 'pending')")
+    try:
+        # WAL: 다른 스레드는 대기 없이 마지막 커밋 시점의 데이터를 읽음
+        items, _ = in_thread(lambda: db_service.get_history_page()['items'])
+        assert [item['req_id'] for item in items] == ['REQ-001']
+    finally:
+        writer.rollback()
+
+
+def test_close_checkpoints_wal_and_closes_every_connection(db_service):
+    conn = db_service.connection()
+    other, _ = in_thread(db_service.connection)
+    db_service.save_history_batch([{'req_id': f'REQ-{i}', 'original': 'x' * 1000} for i in range(50)])
+    wal = db_service.db_path.with_name(db_service.db_path.name + '-wal')
+    assert wal.stat().st_size > 0
+
+    db_service.close()
+
+    assert not wal.exists() or wal.stat().st_size == 0
+    for closed in (conn, other):
+        with pytest.raises(sqlite3.ProgrammingError):
+            closed.execute("SELECT 1")
+    # 종료 후 다시 사용하면 새 연결을 엶
+    assert len(db_service.get_history_list()) == 50
+
+
+def test_ping(db_service):
+    db_service.ping()
+    db_service.connection().close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        db_service.ping()
+
+
+def test_health_reports_db_readiness(api_client, monkeypatch):
+    import api
+
+    response = api_client.get('/health')
+    assert response.status_code == 200 and response.get_json()['status'] == 'ok'
+
+    def unavailable():
+        raise sqlite3.OperationalError('unable to open database file')
+
+    monkeypatch.setattr(api.db_service, 'ping', unavailable)
+    response = api_client.get('/health')
+    assert response.status_code == 503
+    assert response.get_json() == {'status': 'unavailable', 'error': 'unable to open database file'}
+
+
+def test_checkpoint_applies_wal_without_closing(db_service):
+    db_service.save_history_batch([{'req_id': f'REQ-{i}', 'original': 'x' * 1000} for i in range(50)])
+
+    result = db_service.checkpoint()
+
+    assert result['busy'] == 0 and result['log'] > 0 and result['checkpointed'] == result['log']
+    assert len(db_service.get_history_list()) == 50
+    with pytest.raises(ValueError):
+        db_service.checkpoint('everything')
+
+
+def test_periodic_checkpoint_runs_until_close(home, monkeypatch):
+    from modules.services.database_service import DatabaseService
+
+    modes = []
+    monkeypatch.setattr(DatabaseService, 'checkpoint', lambda self, mode='PASSIVE': modes.append(mode))
+    service = DatabaseService(checkpoint_interval=0.01)
+    checkpointer = service._checkpoint_thread
+    for _ in range(500):
+        if modes:
+            break
+        time.sleep(0.01)
+
+    service.close()
+    checkpointer.join(2)
+
+    assert modes and set(modes) == {'PASSIVE'}
+    assert not checkpointer.is_alive()
+
+
+@pytest.fixture
+def shutdown_calls(monkeypatch):
+    import api
+
+    calls = []
+    monkeypatch.setattr(api, '_shutdown_done', False)
+    monkeypatch.setattr(api.job_service, 'shutdown', lambda: calls.append('jobs'))
+    monkeypatch.setattr(api.db_service, 'close', lambda: calls.append('db'))
+    return calls
+
+
+def test_shutdown_route_closes_services_once(api_client, shutdown_calls):
+    forbidden = api_client.post('/shutdown', environ_base={'REMOTE_ADDR': '10.0.0.2'})
+    assert forbidden.status_code == 403 and shutdown_calls == []
+
+    for _ in range(2):
+        response = api_client.post('/shutdown')
+        assert response.status_code == 200 and response.get_json() == {'status': 'stopped'}
+
+    assert shutdown_calls == ['jobs', 'db']
+
+
+def test_sigterm_closes_services_before_exit(shutdown_calls):
+    import api
+
+    previous = signal.getsignal(signal.SIGTERM)
+    try:
+        api.install_signal_handlers()
+        with pytest.raises(SystemExit):
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+    assert shutdown_calls == ['jobs', 'db']
@@ -0,0 +1,133 @@
+import sqlite3
+
+import pytest
+
+
+def item(req_id, **extra):
+    data = {'req_id': req_id, 'original': 'o', 'improved': 'i', 'original_score': 100,
+            'improved_score': 150, 'session_id': 's1', 'full_data': {'req': req_id}}
+    data.update(extra)
+    return data
+
+
+def counts(db):
+    conn = db.connection()
+    return {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ('history', 'history_blobs', 'history_stats')}
+
+
+def test_batch_saves_all_rows_with_one_session_blob(db_service):
+    shared = {'session': 'full response'}
+    assert db_service.save_history_batch([item(f'REQ-00{i}', full_data=shared) for i in range(1, 4)]) == 3
+
+    assert counts(db_service)['history'] == 3
+    assert counts(db_service)['history_blobs'] == 1
+    assert db_service.get_analytics_summary()['count'] == 3
+
+
+def test_batch_is_rolled_back_when_any_row_fails(db_service):
+    db_service.save_history_item(item('REQ-000'))
+    before = counts(db_service)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db_service.save_history_batch([item('REQ-001'), item(None), item('REQ-003', full_data={'new': True})])
+
+    assert counts(db_service) == before
+    assert db_service.get_analytics_summary()['count'] == 1
+
+
+def test_batch_keeps_given_created_at_and_defaults_the_rest(db_service):
+    db_service.save_history_batch([item('REQ-001', created_at='2025-01-02 03:04:05'), item('REQ-002')])
+    rows = {row['req_id']: row['created_at'] for row in db_service.get_history_list()}
+
+    assert rows['REQ-001'] == '2025-01-02 03:04:05'
+    assert rows['REQ-002'] > '2026'
+
+
+def test_empty_batch_is_a_no_op(db_service):
+    assert db_service.save_history_batch([]) == 0
+    assert counts(db_service)['history'] == 0
+
+
+def test_import_route_restores_exported_rows(api_client):
+    exported = [
+        {'req_id': 'IMP-001', 'original_text': 'a', 'improved_text': 'b', 'original_score': 1,
+         'improved_score': 2, 'session_id': 'import-s', 'full_data': '{"x": 1}', 'created_at': '2024-05-06 07:08:09'},
+        {'req_id': 'IMP-002', 'original': 'c', 'improved': 'd'},
+    ]
+    response = api_client.post('/api/history/import', json={'items': exported})
+    assert response.status_code == 200
+    assert response.get_json() == {'status': 'success', 'imported': 2}
+
+    page = api_client.get('/api/history/page?req_id_prefix=IMP-').get_json()['items']
+    assert [(row['req_id'], row['original_text']) for row in page] == [('IMP-001', 'a'), ('IMP-002', 'c')]
+    assert page[0]['created_at'] == '2024-05-06 07:08:09'
+    assert page[1]['session_id']
+
+
+@pytest.mark.parametrize('body', [{}, {'items': 'nope'}, {'items': [{'req_id': 'OK-1'}, {'original_text': 'x'}]}])
+def test_import_route_validates_before_writing(api_client, body):
+    import api
+
+    before = len(api.db_service.get_history_list())
+    response = api_client.post('/api/history/import', json=body)
+    assert response.status_code == 400
+    assert len(api.db_service.get_history_list()) == before
+
+
+def test_save_route_splits_numbered_requirements_into_one_session(api_client):
+    import api
+
+    improved = "**요구사항 1**\n첫째 본문\n### 평가\n...\n**요구사항 2**\n둘째 본문"
+    response = api_client.post('/api/history', json={
+        'original_text': '원문', 'improved_text': improved, 'original_score': 100,
+        'improved_score': 180, 'parent_id': 'SPLIT-007', 'full_data': {'k': 'v'}
+    })
+    assert response.status_code == 200
+
+    rows = api.db_service.get_history_page(req_id_prefix='SPLIT-007')['items']
+    assert sorted((row['req_id'], row['improved_text']) for row in rows) == [
+        ('SPLIT-007-001', '첫째 본문'), ('SPLIT-007-002', '둘째 본문')
+    ]
+    assert len({row['session_id'] for row in rows}) == 1
+
+
+def test_numeric_string_scores_are_converted(db_service):
+    db_service.save_history_batch([item('REQ-001', original_score='80', improved_score=' 92.5 '),
+                                   item('REQ-002', original_score='', improved_score=None)])
+    db_service.save_history_item(item('REQ-003', original_score='70', improved_score='90'))
+
+    rows = {row['req_id']: (row['original_score'], row['improved_score']) for row in db_service.get_history_list()}
+    assert rows == {'REQ-001': (80, 92.5), 'REQ-002': (None, None), 'REQ-003': (70, 90)}
+    summary = db_service.get_analytics_summary()
+    assert summary['count'] == 3
+
+
+@pytest.mark.parametrize('score', ['high', True, [80], float('nan')])
+def test_invalid_scores_are_rejected_before_writing(db_service, score):
+    before = counts(db_service)
+
+    with pytest.raises(ValueError, match=r'items\[1\]\.improved_score'):
+        db_service.save_history_batch([item('REQ-001'), item('REQ-002', improved_score=score)])
+    with pytest.raises(ValueError, match='original_score'):
+        db_service.save_history_item(item('REQ-003', original_score=score))
+
+    assert counts(db_service) == before
+
+
+def test_import_route_converts_numeric_strings_and_rejects_bad_scores(api_client):
+    import api
+
+    response = api_client.post('/api/history/import', json={'items': [
+        {'req_id': 'STR-001', 'original_text': 'a', 'original_score': '80', 'improved_score': '95'}
+    ]})
+    assert response.status_code == 200
+    assert api.db_service.get_history_page(req_id_prefix='STR-')['items'][0]['original_score'] == 80
+
+    before = len(api.db_service.get_history_list())
+    response = api_client.post('/api/history/import', json={'items': [
+        {'req_id': 'BAD-001', 'original_score': 10}, {'req_id': 'BAD-002', 'original_score': 'eighty'}
+    ]})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': "items[1].original_score must be a number, got 'eighty'"}
+    assert len(api.db_service.get_history_list()) == before
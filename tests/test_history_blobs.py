@@ -0,0 +1,133 @@
+import json
+import sqlite3
+import zlib
+
+import pytest
+
+from modules.services import database_service
+from modules.services.database_service import DatabaseService, SCHEMA_VERSION
+
+FULL_DATA = {'original_scores': {'total': 120, 'categories': {}}, 'notes': '요구사항 ' * 200}
+
+
+def item(req_id, full_data=FULL_DATA, session_id='s1'):
+    return {'req_id': req_id, 'original': 'o', 'improved': 'i', 'original_score': 1,
+            'improved_score': 2, 'session_id': session_id, 'full_data': full_data}
+
+
+def blob_rows(db):
+    return db.connection().execute("SELECT hash, codec, data, raw_size FROM history_blobs").fetchall()
+
+
+def test_same_full_data_is_stored_once_and_compressed(db_service):
+    ids = [db_service.save_history_item(item(f'REQ-{i}')) for i in range(3)]
+    db_service.save_history_batch([item('REQ-9'), item('REQ-10')])
+
+    (blob,) = blob_rows(db_service)
+    raw = json.dumps(FULL_DATA)
+    assert blob['codec'] == 'zlib'
+    assert blob['raw_size'] == len(raw)
+    assert len(blob['data']) < len(raw) / 5
+    assert zlib.decompress(blob['data']).decode('utf-8') == raw
+
+    inline = db_service.connection().execute("SELECT COUNT(*) FROM history WHERE full_data IS NOT NULL").fetchone()[0]
+    assert inline == 0
+    for history_id in ids:
+        assert json.loads(db_service.get_history_item(history_id)['full_data']) == FULL_DATA
+
+
+def test_string_full_data_is_kept_verbatim(db_service):
+    history_id = db_service.save_history_item(item('REQ-1', full_data='{"raw": true}'))
+    assert db_service.get_history_item(history_id)['full_data'] == '{"raw": true}'
+    assert db_service.get_history_item(db_service.save_history_item(item('REQ-2', full_data=None)))['full_data'] is None
+
+
+def test_orphan_blob_is_removed_only_after_last_reference(db_service):
+    first = db_service.save_history_item(item('REQ-1'))
+    second = db_service.save_history_item(item('REQ-2'))
+
+    db_service.delete_history_item(first)
+    assert len(blob_rows(db_service)) == 1
+    db_service.delete_history_item(second)
+    assert blob_rows(db_service) == []
+
+
+def test_clear_all_history_removes_blobs(db_service):
+    db_service.save_history_batch([item('REQ-1'), item('REQ-2', full_data={'other': 1})])
+    db_service.clear_all_history()
+    assert blob_rows(db_service) == []
+
+
+def test_zstd_codec_falls_back_to_zlib_without_zstandard(home, monkeypatch):
+    monkeypatch.setattr(database_service, 'zstandard', None)
+    db = DatabaseService(blob_codec='zstd')
+    try:
+        history_id = db.save_history_item(item('REQ-1'))
+        assert blob_rows(db)[0]['codec'] == 'zlib'
+        assert json.loads(db.get_history_item(history_id)['full_data']) == FULL_DATA
+    finally:
+        db.close()
+
+
+def test_reading_zstd_blob_without_zstandard_fails_clearly(monkeypatch):
+    monkeypatch.setattr(database_service, 'zstandard', None)
+    with pytest.raises(RuntimeError, match='zstandard'):
+        database_service._decompress('zstd', b'...')
+
+
+def create_legacy_db(home, rows):
+    """user_version 0 스키마 (full_data 인라인 저장, full_data_hash/blob/집계 테이블 없음)"""
+    db_dir = home / '.Codelia'
+    db_dir.mkdir()
+    conn = sqlite3.connect(db_dir / 'history.db')
+    conn.execute("""
+        CREATE TABLE history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            req_id TEXT NOT NULL,
+            original_text TEXT,
+            improved_text TEXT,
+            original_score INTEGER,
+            improved_score INTEGER,
+            session_id TEXT,
+            full_data TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO history (req_id, original_text, original_score, improved_score, session_id, full_data) VALUES (?, ?, ?, ?, ?, ?)",
+        rows
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_inline_full_data_is_migrated_to_blobs(home):
+    shared = json.dumps({'improved_scores': {'categories': {'Clarity': {'score': 8, 'max': 10}}}})
+    create_legacy_db(home, [
+        ('REQ-001', '첫 번째', 100, 150, 's1', shared),
+        ('REQ-002', '두 번째', 110, 160, 's1', shared),
+        ('REQ-003', '세 번째', 120, 170, 's2', None),
+    ])
+
+    db = DatabaseService()
+    try:
+        conn = db.connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert conn.execute("SELECT COUNT(*) FROM history WHERE full_data IS NOT NULL").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM history WHERE full_data_hash IS NOT NULL").fetchone()[0] == 2
+        assert len(blob_rows(db)) == 1
+
+        items = db.get_history_list(include_full_data=True)
+        assert [row['full_data'] for row in items] == [shared, shared, None]
+        # 기존 행으로 집계 테이블도 채워짐
+        assert db.get_analytics_summary()['count'] == 3
+    finally:
+        db.close()
+
+    # 다시 열어도 재이동하지 않음
+    reopened = DatabaseService()
+    try:
+        assert len(reopened.get_history_list()) == 3
+        assert len(blob_rows(reopened)) == 1
+    finally:
+        reopened.close()
@@ -0,0 +1,111 @@
+import pytest
+
+
+def make_items():
+    items = []
+    for i in range(23):
+        items.append({
+            'req_id': f"{'REQ' if i % 2 else 'SYS'}-{i % 5:03d}",
+            'original': f'original {i}',
+            'improved': f'improved {i}',
+            'original_score': i,
+            'improved_score': 100 + i,
+            'session_id': f'session-{i % 3}',
+            'full_data': {'index': i},
+            # 같은 시각의 행이 여럿 있어도 id로 순서가 결정되어야 함
+            'created_at': f'2026-03-{1 + i % 4:02d} 10:00:00',
+        })
+    return items
+
+
+@pytest.fixture
+def history(db_service):
+    db_service.save_history_batch(make_items())
+    return db_service
+
+
+def expected_order(db_service, where=''):
+    rows = db_service.connection().execute(
+        f"SELECT id FROM history {where} ORDER BY req_id ASC, created_at DESC, id DESC"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def collect(db_service, limit, **filters):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = db_service.get_history_page(limit=limit, cursor=cursor, **filters)
+        ids += [item['id'] for item in page['items']]
+        pages += 1
+        cursor = page['next_cursor']
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize('limit', [1, 4, 23, 50])
+def test_cursor_pages_cover_every_row_once_in_order(history, limit):
+    ids, pages = collect(history, limit)
+    assert ids == expected_order(history)
+    assert pages == max(1, -(-23 // limit))
+
+
+def test_page_excludes_full_data(history):
+    item = history.get_history_page(limit=1)['items'][0]
+    assert 'full_data' not in item and 'full_data_hash' not in item
+    assert history.get_history_item(item['id'])['full_data'] is not None
+
+
+def test_rows_added_behind_the_cursor_do_not_shift_later_pages(history):
+    first = history.get_history_page(limit=5)
+    history.save_history_item({'req_id': 'AAA-000', 'original': 'new', 'session_id': 'late'})
+    ids, _ = collect(history, 5)
+
+    rest = ids[ids.index(first['items'][-1]['id']) + 1:]
+    second = history.get_history_page(limit=5, cursor=first['next_cursor'])
+    assert [item['id'] for item in second['items']] == rest[:5]
+
+
+@pytest.mark.parametrize('filters, where', [
+    ({'session_id': 'session-1'}, "WHERE session_id = 'session-1'"),
+    ({'req_id_prefix': 'REQ'}, "WHERE req_id LIKE 'REQ%'"),
+    ({'req_id_prefix': 'SYS-00'}, "WHERE req_id LIKE 'SYS-00%'"),
+    ({'date_from': '2026-03-02', 'date_to': '2026-03-03'}, "WHERE created_at BETWEEN '2026-03-02' AND '2026-03-03 23:59:59'"),
+    ({'min_score': 105, 'max_score': 110}, "WHERE improved_score BETWEEN 105 AND 110"),
+    ({'session_id': 'session-0', 'min_score': 110}, "WHERE session_id = 'session-0' AND improved_score >= 110"),
+])
+def test_filters_combine_with_cursor(history, filters, where):
+    ids, _ = collect(history, 3, **filters)
+    assert ids == expected_order(history, where)
+    assert ids
+
+
+def test_invalid_cursor_is_rejected(history):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        history.get_history_page(cursor='not-a-cursor')
+
+
+def test_limit_is_clamped(history):
+    assert len(history.get_history_page(limit=0)['items']) == 1
+    assert len(history.get_history_page(limit=10_000)['items']) == 23
+
+
+def test_page_route_returns_400_for_bad_cursor_or_score(api_client):
+    assert api_client.get('/api/history/page?cursor=%%%').status_code == 400
+    assert api_client.get('/api/history/page?min_score=abc').status_code == 400
+    response = api_client.get('/api/history/page?limit=5')
+    assert response.status_code == 200
+    assert set(response.get_json()) == {'items', 'next_cursor'}
+
+
+def test_history_list_excludes_full_data_unless_requested(history):
+    assert not any('full_data' in item for item in history.get_history_list())
+    assert all(item['full_data'] is not None for item in history.get_history_list(include_full_data=True))
+
+
+def test_legacy_list_route_excludes_full_data(api_client):
+    import api
+
+    api.db_service.save_history_item({'req_id': 'LEGACY-001', 'original': 'o', 'full_data': {'big': 'x' * 100}})
+    items = api_client.get('/api/history').get_json()
+    assert any(item['req_id'] == 'LEGACY-001' for item in items)
+    assert not any('full_data' in item for item in items)
@@ -0,0 +1,95 @@
+import pytest
+
+from modules.services.database_service import DatabaseService
+
+XSS = '<script>alert(1)</script> 시스템은 로그인 요청을 & 처리해야 한다'
+
+
+@pytest.fixture
+def history(db_service):
+    db_service.save_history_batch([
+        {'req_id': 'REQ-001', 'original': XSS, 'improved': '시스템은 로그인 요청을 1초 이내에 처리해야 한다.'},
+        {'req_id': 'REQ-002', 'original': '시스템은 데이터를 암호화해야 한다.', 'improved': '"quoted" AND NEAR(x) 로그'},
+        {'req_id': 'REQ-003', 'original': '관리자는 사용자 계정을 잠글 수 있어야 한다.', 'improved': None},
+    ])
+    return db_service
+
+
+def by_req(result):
+    return {item['req_id']: item for item in result['items']}
+
+
+def test_fts_search_uses_index_and_ranks_matches(history):
+    assert history.fts_enabled
+    result = history.search_history('로그인 요청을')
+    assert result['mode'] == 'fts'
+    assert list(by_req(result)) == ['REQ-001']
+
+
+@pytest.mark.parametrize('query, mode', [('로그인 <script>', 'fts'), ('로그 <script>', 'like')])
+def test_snippets_escape_html_and_only_add_mark_tags(history, query, mode):
+    result = history.search_history(query)
+    assert result['mode'] == mode
+    snippet = by_req(result)['REQ-001']['original_snippet']
+
+    assert '<script>' not in snippet
+    assert '&lt;script&gt;' in snippet
+    assert '<mark>' in snippet and '</mark>' in snippet
+    assert snippet.replace('<mark>', '').replace('</mark>', '').count('<') == 0
+
+
+def test_like_snippet_marks_every_term_inside_the_window():
+    snippet = DatabaseService._make_snippet('a<b> 로그 x 로그 & z', ['로그'], width=10)
+    assert snippet == 'a&lt;b&gt; <mark>로그</mark> x <mark>로그</mark> &amp; z'
+
+    long_text = 'x' * 100 + '<로그>' + 'y' * 100
+    snippet = DatabaseService._make_snippet(long_text, ['로그'], width=3)
+    assert snippet == '…xx&lt;<mark>로그</mark>&gt;yy…'
+
+
+def test_fts_operators_in_query_are_searched_literally(history):
+    result = history.search_history('"quoted" NEAR(x)')
+    assert list(by_req(result)) == ['REQ-002']
+    assert list(by_req(history.search_history('AND'))) == ['REQ-002']
+
+
+def test_terms_are_combined_with_and(history):
+    assert list(by_req(history.search_history('시스템은 암호화'))) == ['REQ-002']
+    assert history.search_history('시스템은 계정을')['items'] == []
+
+
+def test_like_fallback_escapes_wildcards(history):
+    assert history.search_history('%')['items'] == []
+    assert history.search_history('_')['items'] == []
+
+
+def test_search_pagination_reports_has_more(history):
+    first = history.search_history('시스템은', limit=1)
+    second = history.search_history('시스템은', limit=1, offset=1)
+    assert first['has_more'] and not second['has_more']
+    assert first['items'][0]['id'] != second['items'][0]['id']
+
+
+def test_search_route_requires_query(api_client):
+    assert api_client.get('/api/history/search?q=%20').status_code == 400
+    assert api_client.get('/api/history/search?q=anything').status_code == 200
+
+
+@pytest.mark.parametrize('query', ['시스템은', '시스'])  # fts / like
+def test_search_applies_page_filters(history, query):
+    assert set(by_req(history.search_history(query))) == {'REQ-001', 'REQ-002'}
+    assert set(by_req(history.search_history(query, req_id_prefix='REQ-002'))) == {'REQ-002'}
+    assert by_req(history.search_history(query, req_id_prefix='SYS')) == {}
+
+
+def test_search_route_passes_filters(api_client):
+    import api
+
+    api.db_service.save_history_batch([
+        {'req_id': 'FILTER-001', 'original': '필터 검색 대상 요구사항', 'improved_score': 90},
+        {'req_id': 'FILTER-002', 'original': '필터 검색 대상 요구사항', 'improved_score': 40},
+    ])
+    response = api_client.get('/api/history/search?q=필터 검색&req_id_prefix=FILTER&min_score=50')
+    assert response.status_code == 200
+    assert [item['req_id'] for item in response.get_json()['items']] == ['FILTER-001']
+    assert api_client.get('/api/history/search?q=필터&min_score=abc').status_code == 400
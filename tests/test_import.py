@@ -0,0 +1,155 @@
+import io
+import json
+
+import pytest
+
+from modules.services.import_service import ImportService, RequirementReader
+
+
+def reader(content, filename, **options):
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    return RequirementReader(io.BytesIO(data), filename, **options)
+
+
+def rows(content, filename, **options):
+    return [(r['row'], r['req_id'], r['text']) for r in reader(content, filename, **options)]
+
+
+def xlsx_bytes(*sheets):
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for title, data in sheets:
+        sheet = workbook.create_sheet(title)
+        for row in data:
+            sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_csv_with_bom_and_auto_detected_columns():
+    content = '﻿설명,요구사항 ID\n시스템은 로그인해야 한다.,REQ-010\n,REQ-011\n"쉼표, 포함",\n'
+    assert rows(content, 'reqs.csv') == [
+        (2, 'REQ-010', '시스템은 로그인해야 한다.'),
+        (4, 'REQ-002', '쉼표, 포함'),  # 빈 본문 행은 건너뛰고, ID가 없으면 가져온 순번으로 ID 생성
+    ]
+
+
+def test_tsv_with_leading_blank_rows_and_custom_prefix():
+    content = '\n\nno\ttext\n7\t첫째\n\t둘째\n'
+    assert rows(content, 'reqs.tsv', id_prefix='SYS') == [(4, '7', '첫째'), (5, 'SYS-002', '둘째')]
+
+
+@pytest.mark.parametrize('id_column, text_column', [('Key', 'Body'), ('B', 'C'), ('2', '3'), ('key', 'body')])
+def test_columns_by_name_letter_or_number(id_column, text_column):
+    content = 'Memo,Key,Body\nx,K-1,본문\n'
+    assert rows(content, 'r.csv', id_column=id_column, text_column=text_column) == [(2, 'K-1', '본문')]
+
+
+def test_text_column_defaults_to_first_non_id_column():
+    assert rows('id,whatever\nA-1,본문\n', 'r.csv') == [(2, 'A-1', '본문')]
+
+
+@pytest.mark.parametrize('content, filename, options, message', [
+    ('a,b\n', 'r.pdf', {}, 'Unsupported import file type'),
+    ('', 'r.csv', {}, 'no header row'),
+    ('id\nREQ-1\n', 'r.csv', {}, 'no requirement text column'),
+    ('id,text\n', 'r.csv', {'text_column': 'missing'}, 'text column not found'),
+    ('id,text\n', 'r.csv', {'id_column': 'Z'}, 'ID column not found'),
+])
+def test_reader_errors(content, filename, options, message):
+    with pytest.raises(ValueError, match=message):
+        reader(content, filename, **options)
+
+
+def test_markdown_table_stops_after_first_table():
+    content = '# 요구사항\n\n| ID | 요구사항 |\n|---|:---:|\n| REQ-1 | 첫째 |\n| REQ-2 | 둘째 |\n\n다음 문단\n| X | Y |\n'
+    assert rows(content, 'r.md') == [(5, 'REQ-1', '첫째'), (6, 'REQ-2', '둘째')]
+
+
+def test_markdown_list_items_with_optional_ids():
+    content = '요구사항 목록\n- REQ-001: 첫째\n* **SYS-IF-2** 둘째\n1. [REQ-003] 셋째\n2) ID 없는 항목\n본문 아닌 줄\n'
+    assert rows(content, 'r.md') == [
+        (2, 'REQ-001', '첫째'), (3, 'SYS-IF-2', '둘째'), (4, 'REQ-003', '셋째'), (5, 'REQ-004', 'ID 없는 항목')
+    ]
+
+
+def test_xlsx_sheet_selection_and_numeric_ids():
+    data = xlsx_bytes(
+        ('Notes', [['memo'], ['ignored']]),
+        ('Reqs', [[None, None], ['번호', '요구사항'], [1.0, '첫째'], [2, None], [3, '셋째']]),
+    )
+    assert rows(data, 'r.xlsx', sheet='Reqs') == [(3, '1', '첫째'), (5, '3', '셋째')]
+    assert rows(data, 'r.xlsx', sheet='2') == [(3, '1', '첫째'), (5, '3', '셋째')]
+    with pytest.raises(ValueError, match='Sheet not found'):
+        reader(data, 'r.xlsx', sheet='Missing')
+
+
+def test_reader_does_not_close_the_upload_stream():
+    stream = io.BytesIO(b'id,text\n1,a\n')
+    list(RequirementReader(stream, 'r.csv'))
+    assert not stream.closed
+
+
+@pytest.fixture
+def import_service(analysis_service, db_service):
+    return ImportService(analysis_service, db_service, flush_size=2, flush_seconds=60)
+
+
+def test_import_evaluates_and_saves_with_summary(import_service, db_service):
+    content = 'id,text\nREQ-1,시스템은 로그인해야 한다.\nREQ-2,시스템은 로그아웃해야 한다.\nREQ-3,시스템은 저장해야 한다.\n'
+    items = list(import_service.run(reader(content, 'r.csv'), mode='full'))
+
+    summary = items[-1]
+    results = items[:-1]
+    assert sorted(item['req_id'] for item in results) == ['REQ-1', 'REQ-2', 'REQ-3']
+    assert {item['row'] for item in results} == {2, 3, 4}
+    assert summary['done'] and summary['count'] == 3 and summary['errors'] == 0 and summary['saved'] == 3
+
+    saved = db_service.get_history_page()['items']
+    assert [row['req_id'] for row in saved] == ['REQ-1', 'REQ-2', 'REQ-3']
+    assert {row['session_id'] for row in saved} == {summary['session_id']}
+    assert all(row['original_score'] is not None and row['improved_score'] is None for row in saved)
+
+
+def test_import_improve_saves_improved_text(import_service, db_service):
+    list(import_service.run(reader('id,text\nREQ-1,시스템은 빨라야 한다.\n', 'r.csv'), action='improve'))
+    (row,) = db_service.get_history_page()['items']
+    assert row['improved_text'] and row['improved_score'] is not None
+
+
+def test_import_without_save_and_invalid_action(import_service, db_service):
+    summary = list(import_service.run(reader('id,text\n1,a\n', 'r.csv'), mode='full', save=False))[-1]
+    assert summary['saved'] == 0 and summary['session_id'] is None
+    assert db_service.get_history_page()['items'] == []
+
+    with pytest.raises(ValueError, match='Unsupported import action'):
+        import_service.run(reader('id,text\n1,a\n', 'r.csv'), action='delete')
+
+
+def test_import_route_streams_ndjson(api_client, monkeypatch):
+    import api
+    from fakes import FakeAIClient
+
+    monkeypatch.setattr(api.analysis_service, '_create_ai_client', lambda: FakeAIClient())
+    response = api_client.post('/api/requirements/import', data={
+        'file': (io.BytesIO('id,text\nIMPORT-1,시스템은 저장해야 한다.\n'.encode('utf-8')), 'r.csv'),
+        'mode': 'full', 'save': 'false'
+    }, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]['req_id'] == 'IMPORT-1'
+    assert lines[-1]['done'] and lines[-1]['saved'] == 0
+
+
+@pytest.mark.parametrize('data', [
+    {},
+    {'file': (io.BytesIO(b'a,b\n'), 'r.pdf')},
+    {'file': (io.BytesIO(b'id,text\n1,a\n'), 'r.csv'), 'mode': 'quick'},
+])
+def test_import_route_rejects_bad_uploads(api_client, data):
+    response = api_client.post('/api/requirements/import', data=data, content_type='multipart/form-data')
+    assert response.status_code == 400
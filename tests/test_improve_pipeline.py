@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from fakes import IMPROVED_TEXT
+
+
+@pytest.fixture
+def slow_client(fake_client):
+    fake_client.delays = {'evaluate': 0.15, 'improve': 0.15}
+    return fake_client
+
+
+def test_concurrent_pipeline_overlaps_original_scoring_and_improvement(analysis_service, slow_client):
+    result = analysis_service.improve('시스템은 빨라야 한다.', {}, pipeline='concurrent')
+
+    (improve_start, improve_end), = slow_client.spans('improve')
+    evaluations = sorted(slow_client.spans('evaluate'))
+    assert len(evaluations) == 2
+    original_start, original_end = evaluations[0]
+    # 원본 평가는 개선 호출이 끝나기 전에 시작
+    assert original_start < improve_end and improve_start < original_end
+    # 개선본 평가는 개선 결과가 나온 뒤 시작
+    assert evaluations[1][0] >= improve_end
+
+    assert result['pipeline'] == 'concurrent'
+    assert result['improved_result']['improved'] == IMPROVED_TEXT
+    assert set(result['timings']) >= {'original_evaluation', 'improvement', 'improved_evaluation', 'total'}
+    assert result['timings']['total'] < 0.15 * 3
+
+
+def test_sequential_pipeline_runs_stages_in_order(analysis_service, slow_client):
+    result = analysis_service.improve('시스템은 빨라야 한다.', {}, pipeline='sequential')
+
+    kinds = [kind for kind, _, _ in sorted(slow_client.calls, key=lambda call: call[1])]
+    assert kinds == ['evaluate', 'improve', 'evaluate']
+    assert result['pipeline'] == 'sequential'
+    assert result['timings']['total'] >= 0.15 * 3
+
+
+def test_improve_response_matches_between_pipelines(analysis_service):
+    concurrent = analysis_service.improve('시스템은 빨라야 한다.', {}, pipeline='concurrent')
+    sequential = analysis_service.improve('시스템은 빨라야 한다.', {}, pipeline='sequential')
+    for key in ('original_scores', 'improved_result', 'improved_scores', 'comparison', 'explanations'):
+        assert concurrent[key] == sequential[key]
+
+
+@pytest.mark.parametrize('text, pipeline', [('', None), ('text', 'parallel')])
+def test_improve_rejects_invalid_input(analysis_service, text, pipeline):
+    with pytest.raises(ValueError):
+        analysis_service.improve(text, {}, pipeline=pipeline)
+
+
+def test_concurrent_batch_is_not_throttled_by_shared_pool(analysis_service, fake_client):
+    # 공유 analysis 풀(4개)보다 큰 배치 - 항목마다 풀 작업을 두 개씩 쓰면 순차보다 느려짐
+    fake_client.delays = {'evaluate': 0.1, 'improve': 0.1}
+    texts = [f'시스템은 요청 {n}을 처리해야 한다.' for n in range(8)]
+
+    def run(pipeline):
+        started = time.perf_counter()
+        items = list(analysis_service.improve_batch(texts, concurrency=8, pipeline=pipeline))
+        assert [item['index'] for item in items] == list(range(8))
+        assert all('result' in item for item in items)
+        return time.perf_counter() - started
+
+    concurrent, sequential = run('concurrent'), run('sequential')
+    assert concurrent < 0.1 * 2.5 < sequential
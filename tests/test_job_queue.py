@@ -0,0 +1,128 @@
+import pytest
+
+from modules.services.job_service import JobService
+
+TEXTS = ['시스템은 로그인해야 한다.', '시스템은 로그아웃해야 한다.', '시스템은 저장해야 한다.']
+
+
+@pytest.fixture
+def job_service(analysis_service, db_service):
+    service = JobService(analysis_service, db_service, workers=1, item_concurrency=2)
+    yield service
+    service.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def drain(service):
+    """등록된 작업이 모두 끝날 때까지 대기"""
+    service.executor.shutdown(wait=True)
+
+
+def test_submitted_job_runs_to_completion(job_service):
+    job_id = job_service.submit('evaluate', TEXTS, {'mode': 'full'})
+    drain(job_service)
+
+    job = job_service.results(job_id)
+    assert job['status'] == 'completed' and job['progress'] == 100.0
+    assert (job['completed'], job['failed'], job['total']) == (3, 0, 3)
+    assert [item['index'] for item in job['items']] == [0, 1, 2]
+    assert all(item['result']['total'] > 0 for item in job['items'])
+    assert job['started_at'] and job['finished_at']
+
+
+def test_results_are_paged(job_service):
+    job_id = job_service.submit('evaluate', TEXTS, {'mode': 'full'})
+    drain(job_service)
+
+    page = job_service.results(job_id, offset=1, limit=1)
+    assert [item['index'] for item in page['items']] == [1]
+    assert page['has_more']
+    assert not job_service.results(job_id, offset=2, limit=5)['has_more']
+
+
+@pytest.mark.parametrize('kind, texts, options, message', [
+    ('delete', TEXTS, {}, 'Unsupported job kind'),
+    ('evaluate', [], {}, 'non-empty list'),
+    ('evaluate', 'text', {}, 'non-empty list'),
+    ('evaluate', TEXTS, {'mode': 'quick'}, 'Unsupported evaluate mode'),
+])
+def test_submit_validates_input(job_service, kind, texts, options, message):
+    with pytest.raises(ValueError, match=message):
+        job_service.submit(kind, texts, options)
+
+
+def test_cancel_during_final_write_stays_cancelled(job_service, db_service, monkeypatch):
+    job_ids = []
+    save_job_item = db_service.save_job_item
+    saved = []
+
+    def save_then_cancel(job_id, *args, **kwargs):
+        save_job_item(job_id, *args, **kwargs)
+        saved.append(job_id)
+        # 마지막 항목 저장 직후(completed 기록 전)에 취소
+        if len(saved) == len(TEXTS):
+            job_service.cancel(job_ids[0])
+
+    monkeypatch.setattr(db_service, 'save_job_item', save_then_cancel)
+    job_ids.append(job_service.submit('evaluate', TEXTS, {'mode': 'full'}))
+    drain(job_service)
+
+    job = job_service.status(job_ids[0])
+    assert job['status'] == 'cancelled'
+    assert job['completed'] == len(TEXTS)
+
+
+def test_failed_batch_marks_job_failed(job_service, analysis_service, monkeypatch):
+    def broken(*args, **kwargs):
+        raise ValueError('API key is not configured')
+
+    monkeypatch.setattr(analysis_service, 'evaluate_batch', broken)
+    job_id = job_service.submit('evaluate', TEXTS)
+    drain(job_service)
+
+    job = job_service.status(job_id)
+    assert job['status'] == 'failed' and 'API key' in job['error']
+
+
+def test_resume_runs_only_unsaved_items(analysis_service, db_service, fake_client):
+    # 재시작 전: 첫 항목만 저장된 채 running으로 남은 작업
+    db_service.create_job('job-1', 'evaluate', {'texts': TEXTS, 'options': {'mode': 'full'}}, len(TEXTS))
+    db_service.update_job_status('job-1', 'running')
+    db_service.save_job_item('job-1', 0, {'total': 1})
+    db_service.create_job('job-2', 'evaluate', {'texts': TEXTS[:1], 'options': {}}, 1)
+    db_service.update_job_status('job-2', 'completed')
+
+    service = JobService(analysis_service, db_service, workers=1)
+    assert service.resume() == 1
+    drain(service)
+
+    job = service.results('job-1')
+    assert job['status'] == 'completed'
+    assert job['completed'] == len(TEXTS)
+    assert job['items'][0]['result'] == {'total': 1}
+    assert len(fake_client.calls) == len(TEXTS) - 1
+
+
+def test_conditional_status_update(db_service):
+    db_service.create_job('job-1', 'evaluate', {'texts': TEXTS}, len(TEXTS))
+    db_service.update_job_status('job-1', 'cancelled')
+
+    assert not db_service.update_job_status('job-1', 'completed', expected_status='running')
+    assert db_service.get_job('job-1')['status'] == 'cancelled'
+    assert db_service.update_job_status('job-1', 'queued')
+
+
+def test_job_routes(api_client):
+    import api
+
+    response = api_client.post('/api/jobs', json={'kind': 'evaluate', 'texts': []})
+    assert response.status_code == 400
+    assert api_client.get('/api/jobs/missing').status_code == 404
+    assert api_client.get('/api/jobs/missing/result').status_code == 404
+    assert api_client.post('/api/jobs/missing/cancel').status_code == 404
+    assert api_client.get('/api/jobs?status=bogus').status_code == 400
+
+    api.db_service.create_job('route-job', 'evaluate', {'texts': TEXTS}, len(TEXTS))
+    response = api_client.post('/api/jobs/route-job/cancel')
+    assert response.status_code == 200 and response.get_json()['status'] == 'cancelled'
+    assert api_client.get('/api/jobs/route-job').get_json()['progress'] == 0.0
+    assert any(job['id'] == 'route-job' for job in api_client.get('/api/jobs?status=cancelled').get_json())
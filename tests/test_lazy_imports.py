@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+import startup_bench
+
+
+def test_importing_api_does_not_load_deferred_modules(tmp_path):
+    env = startup_bench.isolated_env(str(tmp_path))
+    assert startup_bench.loaded_deferred_modules(sys.executable, env) == []
+
+
+def test_lazy_exports_load_on_first_access():
+    code = (
+        "import sys, modules.llm as llm; "
+        "assert 'modules.llm.claude' not in sys.modules; "
+        "provider = llm.ClaudeProvider; "
+        "assert 'modules.llm.claude' in sys.modules and llm.ClaudeProvider is provider; "
+        "assert 'ClaudeProvider' in dir(llm)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=startup_bench.ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize('package', ['modules', 'modules.llm'])
+def test_unknown_export_raises_attribute_error(package):
+    module = __import__(package, fromlist=['_'])
+    with pytest.raises(AttributeError, match='has no attribute'):
+        module.Missing
@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+import config
+from fakes import ALL_RULES, requested_rules, scores_json
+from modules.evaluator import RequirementEvaluator, _normalize_entry, salvage_rule_entries
+from modules.prompt_store import PromptStore
+
+TEXT = '시스템은 요청을 1초 이내에 처리해야 한다.'
+
+
+def test_salvage_keeps_complete_entries_from_truncated_json():
+    response = '```json\n{"P1": {"score": 5, "reason": "ok"}, "P2": {"score": 4, "reason": "또한 \\"인용\\""}, "P3": {"score": 3, "rea'
+    assert salvage_rule_entries(response) == {
+        'P1': {'score': 5, 'reason': 'ok'},
+        'P2': {'score': 4, 'reason': '또한 "인용"'},
+    }
+
+
+def test_salvage_skips_broken_entry_and_continues():
+    response = '{"R1": {"score": 5, "reason": "a"}, "R2": {"score": , "reason": "b"}, "R3": 4, "R4": {"score": 2}}'
+    assert salvage_rule_entries(response) == {'R1': {'score': 5, 'reason': 'a'}, 'R3': 4, 'R4': {'score': 2}}
+
+
+@pytest.mark.parametrize('response', ['', None, 'no json here', '{"total": 3}'])
+def test_salvage_returns_empty_for_unusable_text(response):
+    assert salvage_rule_entries(response) == {}
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'score': 4, 'reason': 'r'}, {'score': 4, 'reason': 'r'}),
+    ({'score': '3.0'}, {'score': 3, 'reason': ''}),
+    (5, {'score': 5, 'reason': ''}),
+    ({'score': 6}, None),
+    ({'score': -1}, None),
+    ({'score': True}, None),
+    ({'reason': 'no score'}, None),
+    ('high', None),
+])
+def test_normalize_entry(value, expected):
+    assert _normalize_entry(value) == expected
+
+
+@pytest.fixture
+def evaluator(fake_client):
+    return RequirementEvaluator(fake_client, PromptStore().get(config.SCORING_PROMPT_FILE))
+
+
+def truncated_after(count):
+    """전체 채점 요청에는 count개 규칙까지만 쓰고 잘린 응답, 재요청에는 정상 응답"""
+    def respond(system_prompt, user_message):
+        rules = requested_rules(system_prompt)
+        if rules == ALL_RULES:
+            text = scores_json(rules)
+            cut = text.index(f'"{rules[count]}"')
+            return text[:cut + 12]
+        return scores_json(rules, score=2)
+    return respond
+
+
+def test_missing_rules_are_reasked_and_merged(evaluator, fake_client):
+    fake_client.respond = truncated_after(40)
+
+    result = evaluator.evaluate(TEXT)
+
+    assert len(fake_client.calls) == 2
+    # 잘린 응답은 캐시에 남기지 않음
+    assert len(fake_client.discarded) == 1
+    assert set(result['scores']) == set(ALL_RULES)
+    completeness = result['completeness']
+    assert {completeness[rule] for rule in ALL_RULES[:40]} == {'complete'}
+    assert {completeness[rule] for rule in ALL_RULES[40:]} == {'recovered'}
+    assert result['scores'][ALL_RULES[41]]['score'] == 2
+    assert 'missing_rules' not in result
+
+
+def test_reask_prompt_lists_only_missing_rules(evaluator, fake_client):
+    prompts = []
+
+    def respond(system_prompt, user_message):
+        prompts.append(system_prompt)
+        rules = requested_rules(system_prompt)
+        scores = json.loads(scores_json(rules))
+        if rules == ALL_RULES:
+            scores['R5'] = {'score': 'bad'}
+            del scores['C3']
+        return json.dumps(scores)
+
+    fake_client.respond = respond
+    result = evaluator.evaluate(TEXT)
+
+    assert requested_rules(prompts[1]) == ['C3', 'R5']
+    assert len(prompts[1]) < len(prompts[0]) / 4
+    assert result['completeness']['C3'] == result['completeness']['R5'] == 'recovered'
+
+
+def test_failed_reask_reports_missing_rules(evaluator, fake_client):
+    def respond(system_prompt, user_message):
+        rules = requested_rules(system_prompt)
+        if rules != ALL_RULES:
+            raise RuntimeError('timeout')
+        return scores_json(rules[:-3])
+
+    fake_client.respond = respond
+    result = evaluator.evaluate(TEXT)
+
+    assert result['missing_rules'] == ALL_RULES[-3:]
+    assert 'error' not in result
+
+
+def test_recovery_can_be_disabled(fake_client):
+    evaluator = RequirementEvaluator(fake_client, PromptStore().get(config.SCORING_PROMPT_FILE), recover_missing=False)
+    fake_client.respond = truncated_after(10)
+
+    result = evaluator.evaluate(TEXT)
+
+    assert len(fake_client.calls) == 1
+    assert len(result['missing_rules']) == len(ALL_RULES) - 10
+
+
+def test_unparseable_response_without_entries_is_an_error(evaluator, fake_client):
+    fake_client.respond = lambda system_prompt, user_message: 'I cannot evaluate this.'
+
+    result = evaluator.evaluate(TEXT)
+
+    assert result['total'] == 0 and 'error' in result
+    assert fake_client.discarded
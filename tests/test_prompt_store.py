@@ -0,0 +1,94 @@
+import builtins
+import os
+
+import pytest
+
+from modules.prompt_store import PromptStore
+
+TEMPLATE = "Role\n{PROJECT_CONTEXT}\n{Developer} builds {System} for {Client}."
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = tmp_path / 'Quality.md'
+    path.write_text(TEMPLATE, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def opens(monkeypatch):
+    """builtins.open 호출 경로 기록"""
+    calls = []
+    real_open = builtins.open
+
+    def recording_open(file, *args, **kwargs):
+        calls.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, 'open', recording_open)
+    return calls
+
+
+def bump(path, text):
+    """내용 변경 + mtime 증가 (파일 시스템 시간 해상도와 무관하게 변경 감지)"""
+    stat = os.stat(path)
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_template_is_read_once(template, opens):
+    store = PromptStore(check_interval=0)
+    assert store.get(template) == TEMPLATE
+    assert store.get(template) == TEMPLATE
+    assert opens.count(str(template)) == 1
+
+
+def test_changed_file_is_reloaded(template):
+    store = PromptStore(check_interval=0)
+    store.get(template)
+    bump(template, 'v2')
+    assert store.get(template) == 'v2'
+
+
+def test_check_interval_skips_stat(template):
+    store = PromptStore(check_interval=60)
+    store.get(template)
+    bump(template, 'v2')
+    assert store.get(template) == TEMPLATE
+
+
+def test_render_substitutes_project_context_with_defaults(template):
+    store = PromptStore()
+    rendered = store.render_quality_prompt(template, {'developer': ' ACME ', 'system': 'Brake'})
+    assert '- **Developer**: ACME' in rendered
+    assert 'ACME builds Brake for Client.' in rendered
+    assert '{PROJECT_CONTEXT}' not in rendered
+
+    assert store.render_quality_prompt(template, {}).endswith('Supplier builds System for Client.')
+
+
+def test_rendered_prompt_is_memoized_per_context(template):
+    store = PromptStore(check_interval=0)
+    first = store.render_quality_prompt(template, {'system': 'Brake'})
+    assert store.render_quality_prompt(template, {'system': 'Brake'}) is first
+    assert store.render_quality_prompt(template, {'system': 'Door'}) is not first
+
+
+def test_rendered_cache_is_bounded_and_follows_template(template):
+    store = PromptStore(check_interval=0, max_rendered=2)
+    for system in ('A', 'B', 'C'):
+        store.render_quality_prompt(template, {'system': system})
+    assert len(store._rendered) == 2
+
+    bump(template, '{System} v2')
+    assert store.render_quality_prompt(template, {'system': 'C'}) == 'C v2'
+    assert len(store._rendered) == 1
+
+
+def test_clear_rendered_keeps_templates(template, opens):
+    store = PromptStore(check_interval=60)
+    first = store.render_quality_prompt(template, {'system': 'Brake'})
+    store.clear_rendered()
+    second = store.render_quality_prompt(template, {'system': 'Brake'})
+    assert second == first and second is not first
+    assert opens.count(str(template)) == 1
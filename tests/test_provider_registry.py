@@ -0,0 +1,60 @@
+from modules.llm import ProviderRegistry
+
+
+def test_same_settings_reuse_one_provider():
+    registry = ProviderRegistry(pool_size=4)
+    first = registry.get('openai', 'key', 'http://127.0.0.1:1/v1')
+    assert registry.get('OpenAI', 'key', 'http://127.0.0.1:1/v1') is first
+    assert registry.get('openai', 'other-key', 'http://127.0.0.1:1/v1') is not first
+    assert len(registry) == 2
+
+    adapter = first.session.get_adapter('http://127.0.0.1:1/')
+    assert adapter._pool_maxsize == 4
+
+
+def test_invalidate_closes_sessions_but_keeps_breakers_and_usage():
+    registry = ProviderRegistry()
+    llm = registry.get('openai', 'key', 'http://127.0.0.1:1/v1')
+    breaker = registry.breaker('openai', 'key', 'http://127.0.0.1:1/v1')
+    llm.usage.record(input_tokens=10)
+    closed = []
+    llm.session.close = lambda: closed.append(True)
+
+    assert registry.invalidate('claude') == 0
+    assert registry.invalidate() == 1
+    assert closed == [True]
+
+    replacement = registry.get('openai', 'key', 'http://127.0.0.1:1/v1')
+    assert replacement is not llm
+    assert registry.breaker('openai', 'key', 'http://127.0.0.1:1/v1') is breaker
+    assert replacement.usage.snapshot()['input_tokens'] == 10
+
+
+def test_requests_share_keep_alive_connections(llm_server):
+    registry = ProviderRegistry()
+    for _ in range(5):
+        registry.get('openai', 'key', llm_server.url).generate('system', 'improve this')
+    assert len(llm_server.connections) == 1
+
+
+def test_analysis_service_reuses_client_until_config_changes(config_service, llm_server):
+    from modules.services.analysis_service import AnalysisService
+
+    config_service.save_config({'provider': 'openai', 'openai': {'key': 'k1', 'url': llm_server.url}})
+    service = AnalysisService(config_service)
+    try:
+        client = service._create_ai_client()
+        assert service._create_ai_client() is client
+        assert client.call_api('system', 'improve this', use_cache=False)
+
+        # 프로젝트 컨텍스트만 바뀌면 Client 유지
+        config_service.update_config({'project': {'system': 'Brake'}})
+        assert service._create_ai_client() is client
+
+        config_service.update_config({'openai': {'key': 'k2', 'url': llm_server.url}})
+        replacement = service._create_ai_client()
+        assert replacement is not client
+        assert replacement.api_key == 'k2'
+    finally:
+        service.executor.shutdown(wait=False)
+        service.shard_executor.shutdown(wait=False)
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from modules.llm import rate_limit
+from modules.llm.rate_limit import RateLimiter, RateLimiterRegistry, TokenBucket, estimate_tokens
+
+
+def test_token_bucket_allows_burst_then_spaces_reservations():
+    bucket = TokenBucket(per_minute=60)  # 초당 1개
+    now = bucket.updated
+
+    assert [bucket.reserve(1, now) for _ in range(60)] == [0.0] * 60
+    # 잔량이 음수가 되면서 예약 순서대로 1초씩 뒤로 밀림
+    assert bucket.reserve(1, now) == pytest.approx(1.0)
+    assert bucket.reserve(1, now) == pytest.approx(2.0)
+    # 시간이 지나면 다시 채워짐 (용량 이상으로는 채워지지 않음)
+    assert bucket.reserve(1, now + 3.0) == pytest.approx(0.0)
+    assert bucket.reserve(0, now + 1000.0) == 0.0
+    assert bucket.tokens == bucket.capacity
+
+
+def test_token_bucket_caps_oversized_requests_at_capacity():
+    bucket = TokenBucket(per_minute=600)
+    now = bucket.updated
+    # 용량보다 큰 요청도 버킷 전체만큼만 차감 (영구 대기 방지)
+    assert bucket.reserve(10_000, now) == 0.0
+    assert bucket.reserve(10, now) == pytest.approx(1.0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(rate_limit.time, 'sleep', recorded.append)
+    return recorded
+
+
+def test_limiter_waits_for_the_stricter_bucket(sleeps):
+    limiter = RateLimiter(rpm=600, tpm=60)
+
+    assert limiter.acquire(60) == 0.0
+    wait = limiter.acquire(30)
+    assert wait == pytest.approx(30.0, abs=0.1)  # TPM 버킷이 더 엄격
+    assert sleeps == [wait]
+
+    stats = limiter.stats()
+    assert stats['acquired'] == 2 and stats['delayed'] == 1
+    assert stats['max_wait'] == pytest.approx(30.0, abs=0.1)
+    assert stats['queue_depth'] == 0
+
+
+def test_concurrent_callers_get_distinct_fifo_slots(sleeps):
+    limiter = RateLimiter(rpm=60)
+    for _ in range(60):
+        limiter.acquire()
+
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 10개 스레드가 같은 자리를 받지 않고 1초 간격으로 예약
+    assert sorted(round(wait) for wait in sleeps) == list(range(1, 11))
+    assert limiter.stats()['queue_depth'] == 0
+
+
+def test_unlimited_limiter_never_waits(sleeps):
+    limiter = RateLimiter()
+    assert all(limiter.acquire(10_000) == 0.0 for _ in range(100))
+    assert sleeps == []
+    assert limiter.current_wait() == 0.0
+
+
+def test_current_wait_does_not_reserve(sleeps):
+    limiter = RateLimiter(rpm=60)
+    for _ in range(60):
+        limiter.acquire()
+
+    assert limiter.current_wait() == pytest.approx(1.0, abs=0.05)
+    assert limiter.current_wait() == pytest.approx(1.0, abs=0.05)
+    assert limiter.stats()['acquired'] == 60
+
+
+def test_aacquire_waits_without_blocking_the_loop():
+    limiter = RateLimiter(tpm=6000)  # 초당 100토큰
+
+    async def main():
+        await limiter.aacquire(6000)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        started = time.perf_counter()
+        wait, _ = await asyncio.gather(limiter.aacquire(10), ticker())
+        return wait, time.perf_counter() - started, ticks
+
+    wait, elapsed, ticks = asyncio.run(main())
+    assert wait == pytest.approx(0.1, abs=0.02)
+    assert elapsed >= 0.09
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.09
+
+
+def test_registry_shares_limiter_per_key_and_applies_new_limits():
+    registry = RateLimiterRegistry()
+    limiter = registry.get('OpenAI', 'sk-aaaa1234', rpm=60)
+
+    assert registry.get('openai', 'sk-aaaa1234', rpm=60) is limiter
+    assert registry.get('openai', 'sk-bbbb5678', rpm=60) is not limiter
+
+    assert registry.get('openai', 'sk-aaaa1234', rpm=120, tpm=1000) is limiter
+    assert (limiter.rpm, limiter.tpm) == (120, 1000)
+    assert set(registry.stats()) == {'openai:...1234', 'openai:...5678'}
+
+
+def test_estimate_tokens_includes_max_tokens():
+    assert estimate_tokens('abc', 'def') == 3
+    assert estimate_tokens('abc', 'def', max_tokens=100) == 103
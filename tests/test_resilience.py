@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+
+from modules.llm.base import LLMError, LLMProvider
+from modules.llm.resilience import CircuitBreaker, ProviderSlot, ResilientProvider, RetryPolicy
+
+
+class ScriptedProvider(LLMProvider):
+    """outcomes를 순서대로 반환/발생 (소진 후에는 마지막 항목 반복)"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def generate(self, system_prompt, user_message):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def retryable(status=503):
+    return LLMError(f"HTTP {status}", status_code=status, retryable=True)
+
+
+def fatal():
+    return LLMError("HTTP 400", status_code=400, retryable=False)
+
+
+def slot(name, llm, threshold=5, recovery=60.0):
+    return ProviderSlot(name, llm, CircuitBreaker(failure_threshold=threshold, recovery_timeout=recovery))
+
+
+def resilient(*slots, attempts=3):
+    return ResilientProvider(list(slots), RetryPolicy(max_attempts=attempts, base_delay=0.0))
+
+
+def test_retries_retryable_errors_then_succeeds():
+    llm = ScriptedProvider(retryable(), retryable(429), 'ok')
+    primary = slot('openai', llm)
+
+    assert resilient(primary).generate('s', 'u') == 'ok'
+    assert llm.calls == 3
+    assert primary.breaker.snapshot() == {'state': 'closed', 'consecutive_failures': 0}
+
+
+def test_fails_over_to_fallback_after_retries_are_exhausted():
+    primary = slot('openai', ScriptedProvider(retryable()))
+    fallback = slot('claude', ScriptedProvider('from fallback'))
+
+    assert resilient(primary, fallback, attempts=2).generate('s', 'u') == 'from fallback'
+    assert primary.llm.calls == 2
+    assert primary.breaker.snapshot()['consecutive_failures'] == 2
+
+
+def test_non_retryable_error_is_not_retried_and_leaves_breaker_unchanged():
+    primary = slot('openai', ScriptedProvider(fatal()), threshold=3)
+    primary.breaker.record_failure()
+    primary.breaker.record_failure()
+
+    with pytest.raises(LLMError, match='400'):
+        resilient(primary).generate('s', 'u')
+
+    assert primary.llm.calls == 1
+    # 연속 실패 횟수가 초기화되지 않음 - 다음 가용성 실패 한 번으로 차단
+    assert primary.breaker.snapshot() == {'state': 'closed', 'consecutive_failures': 2}
+    primary.breaker.record_failure()
+    assert primary.breaker.state == CircuitBreaker.OPEN
+
+
+def test_breaker_opens_after_threshold_and_skips_provider():
+    primary = slot('openai', ScriptedProvider(retryable()), threshold=2)
+    fallback = slot('claude', ScriptedProvider('ok'))
+    provider = resilient(primary, fallback, attempts=5)
+
+    assert provider.generate('s', 'u') == 'ok'
+    # 임계값에 도달하면 남은 재시도를 중단
+    assert primary.llm.calls == 2
+    assert primary.breaker.state == CircuitBreaker.OPEN
+
+    assert provider.generate('s', 'u') == 'ok'
+    assert primary.llm.calls == 2
+
+
+def test_all_breakers_open_raises_retryable_error():
+    primary = slot('openai', ScriptedProvider('ok'), threshold=1)
+    primary.breaker.record_failure()
+
+    with pytest.raises(LLMError) as excinfo:
+        resilient(primary).generate('s', 'u')
+    assert excinfo.value.retryable
+    assert primary.llm.calls == 0
+
+
+def test_half_open_allows_one_probe_and_closes_on_success():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+    for _ in range(3):
+        breaker.record_failure()
+    breaker.recovery_timeout = 0.0
+    assert breaker.allow()
+    breaker.recovery_timeout = 60.0
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_non_retryable_half_open_probe_releases_slot_without_closing():
+    primary = slot('openai', ScriptedProvider(fatal(), 'ok'), threshold=1, recovery=0.0)
+    primary.breaker.record_failure()
+    provider = resilient(primary)
+
+    with pytest.raises(LLMError):
+        provider.generate('s', 'u')
+    assert primary.breaker.state == CircuitBreaker.HALF_OPEN
+
+    # 시험 호출 자리가 반납되어 다음 호출이 가능
+    assert provider.generate('s', 'u') == 'ok'
+    assert primary.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_after_takes_precedence_and_is_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert policy.delay(0, retry_after=2.0) == 2.0
+    assert policy.delay(0, retry_after=30.0) == 5.0
+    assert all(0 <= policy.delay(10) <= 5.0 for _ in range(20))
+
+
+def test_agenerate_and_stream_follow_the_same_policy():
+    primary = slot('openai', ScriptedProvider(retryable(), 'async ok'))
+    assert asyncio.run(resilient(primary).agenerate('s', 'u')) == 'async ok'
+
+    primary = slot('openai', ScriptedProvider(fatal()))
+    fallback = slot('claude', ScriptedProvider('streamed'))
+    assert list(resilient(primary, fallback).stream('s', 'u')) == ['streamed']
+    assert primary.breaker.snapshot()['consecutive_failures'] == 0
+
+
+class ChunkedProvider(ScriptedProvider):
+    def stream(self, system_prompt, user_message):
+        yield from self.generate(system_prompt, user_message).split()
+
+    async def agenerate(self, system_prompt, user_message):
+        await asyncio.sleep(10)
+
+
+def half_open_slot(llm):
+    primary = slot('openai', llm, threshold=1, recovery=0.0)
+    primary.breaker.record_failure()
+    return primary
+
+
+def test_abandoned_half_open_stream_releases_probe_slot():
+    primary = half_open_slot(ChunkedProvider('a b c'))
+    stream = resilient(primary).stream('s', 'u')
+
+    assert next(stream) == 'a'
+    assert not primary.breaker.allow()  # 시험 호출 진행 중
+    stream.close()  # 클라이언트 연결 종료
+
+    assert primary.breaker.state == CircuitBreaker.HALF_OPEN
+    assert list(resilient(primary).stream('s', 'u')) == ['a', 'b', 'c']
+    assert primary.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_half_open_agenerate_releases_probe_slot():
+    primary = half_open_slot(ChunkedProvider('ok'))
+
+    async def cancelled():
+        await asyncio.wait_for(resilient(primary).agenerate('s', 'u'), timeout=0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(cancelled())
+    assert primary.breaker.allow()
+
+
+@pytest.fixture
+def cached_client(db_service):
+    from modules.ai_client import AIClient
+    from modules.response_cache import ResponseCache
+
+    def make(provider):
+        return AIClient('openai', 'key', llm=provider, cache=ResponseCache(db_service))
+
+    return make
+
+
+@pytest.mark.parametrize('call', ['call_api', 'acall_api', 'stream_api'])
+def test_fallback_responses_are_not_cached_under_primary_key(cached_client, call):
+    primary = slot('openai', ScriptedProvider(fatal(), 'primary'))
+    fallback = slot('claude', ScriptedProvider('fallback'))
+    client = cached_client(resilient(primary, fallback))
+
+    def run():
+        if call == 'acall_api':
+            return asyncio.run(client.acall_api('s', 'u'))
+        if call == 'stream_api':
+            return ''.join(client.stream_api('s', 'u'))
+        return client.call_api('s', 'u')
+
+    assert run() == 'fallback'
+    assert client.cache.stats()['stores'] == 0
+    # 주 Provider가 회복되면 주 Provider 응답을 받아 캐시
+    assert run() == 'primary'
+    assert run() == 'primary'
+    assert client.cache.stats()['stores'] == 1 and client.cache.stats()['hits'] == 1
+
+
+def test_plain_provider_responses_are_cached(cached_client):
+    client = cached_client(ScriptedProvider('ok'))
+    client.call_api('s', 'u')
+    assert client.cache.stats()['stores'] == 1
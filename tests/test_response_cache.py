@@ -0,0 +1,158 @@
+import sqlite3
+import time
+
+import pytest
+
+from modules.response_cache import ResponseCache
+
+
+def disk_count(db_service):
+    return db_service.connection().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+def last_access(db_service, key):
+    return db_service.connection().execute("SELECT last_access FROM llm_cache WHERE key = ?", (key,)).fetchone()[0]
+
+
+def test_make_key_depends_on_every_part():
+    base = ResponseCache.make_key('openai', 'gpt', 0.2, 'system', 'user')
+    assert base == ResponseCache.make_key('openai', 'gpt', 0.2, 'system', 'user')
+    assert base != ResponseCache.make_key('claude', 'gpt', 0.2, 'system', 'user')
+    assert base != ResponseCache.make_key('openai', 'gpt', 0.3, 'system', 'user')
+    assert base != ResponseCache.make_key('openai', 'gpt', 0.2, 'system', 'user2')
+
+
+def test_memory_then_disk_hit(db_service):
+    cache = ResponseCache(db_service)
+    cache.set('k', 'response')
+    assert cache.get('k') == 'response'
+
+    # 새 인스턴스(빈 메모리 계층)는 디스크에서 읽음
+    reopened = ResponseCache(db_service)
+    assert reopened.get('k') == 'response'
+    assert reopened.get('missing') is None
+    stats = reopened.stats()
+    assert (stats['disk_hits'], stats['misses'], stats['disk_entries']) == (1, 1, 1)
+
+
+def test_uses_database_service_connection(db_service, monkeypatch):
+    cache = ResponseCache(db_service)
+
+    def no_new_connections(*args, **kwargs):
+        raise AssertionError("ResponseCache opened its own sqlite connection")
+
+    monkeypatch.setattr(sqlite3, 'connect', no_new_connections)
+    cache.set('k', 'v')
+    assert ResponseCache(db_service).get('k') == 'v'
+
+
+def test_disk_hit_does_not_write_until_flush(db_service):
+    ResponseCache(db_service).set('k', 'v')
+    written = last_access(db_service, 'k')
+
+    cache = ResponseCache(db_service, access_flush_size=3)
+    time.sleep(0.01)
+    assert cache.get('k') == 'v'
+    conn = db_service.connection()
+    assert not conn.in_transaction
+    assert last_access(db_service, 'k') == written
+
+    # 다음 쓰기에서 함께 기록
+    cache.set('other', 'x')
+    assert last_access(db_service, 'k') > written
+
+
+def test_disk_hits_flush_in_batches(db_service):
+    writer = ResponseCache(db_service)
+    for i in range(3):
+        writer.set(f"k{i}", 'v')
+    before = {f"k{i}": last_access(db_service, f"k{i}") for i in range(3)}
+
+    cache = ResponseCache(db_service, access_flush_size=3)
+    time.sleep(0.01)
+    cache.get('k0')
+    cache.get('k1')
+    assert all(last_access(db_service, key) == before[key] for key in ('k0', 'k1'))
+    cache.get('k2')
+    assert all(last_access(db_service, key) > before[key] for key in before)
+
+
+def test_expired_entries_are_misses(db_service):
+    cache = ResponseCache(db_service, ttl_seconds=60)
+    cache.set('k', 'v')
+    db_service.connection().execute("UPDATE llm_cache SET created_at = ?", (time.time() - 120,))
+    db_service.connection().commit()
+
+    assert ResponseCache(db_service, ttl_seconds=60).get('k') is None
+
+
+def expire(db_service, keys, age):
+    db_service.connection().executemany(
+        "UPDATE llm_cache SET created_at = ? WHERE key = ?", [(time.time() - age, key) for key in keys]
+    )
+    db_service.connection().commit()
+
+
+def test_expired_rows_are_purged_at_startup_in_batches(db_service):
+    cache = ResponseCache(db_service, ttl_seconds=60)
+    for n in range(5):
+        cache.set(f'old-{n}', 'v')
+    cache.set('fresh', 'v')
+    expire(db_service, [f'old-{n}' for n in range(5)], 120)
+
+    reopened = ResponseCache(db_service, ttl_seconds=60, purge_batch_size=2)
+
+    assert {row[0] for row in db_service.connection().execute("SELECT key FROM llm_cache")} == {'fresh'}
+    assert reopened.stats()['disk_entries'] == 1
+
+
+def test_expired_rows_are_purged_periodically_on_store(db_service):
+    cache = ResponseCache(db_service, ttl_seconds=60, purge_interval=0)
+    cache.set('old', 'v')
+    expire(db_service, ['old'], 120)
+
+    cache.set('new', 'v')
+
+    assert disk_count(db_service) == cache.stats()['disk_entries'] == 1
+
+
+def test_max_disk_entries_evicts_least_recently_used(db_service):
+    cache = ResponseCache(db_service, max_disk_entries=3, access_flush_size=1)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+        time.sleep(0.002)
+    # 'a'를 디스크에서 다시 읽어 최근 사용으로 갱신
+    ResponseCache(db_service, max_disk_entries=3, access_flush_size=1).get('a')
+    cache.set('d', 'd')
+
+    keys = {row[0] for row in db_service.connection().execute("SELECT key FROM llm_cache")}
+    assert keys == {'a', 'c', 'd'}
+    assert cache.stats()['disk_entries'] == 3
+
+
+def test_entry_count_is_tracked(db_service):
+    cache = ResponseCache(db_service)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.set('a', 'replaced')  # 같은 키 덮어쓰기는 개수 유지
+    assert cache.stats()['disk_entries'] == disk_count(db_service) == 2
+    assert ResponseCache(db_service).get('a') == 'replaced'
+
+    cache.discard('a')
+    cache.discard('missing')
+    assert cache.stats()['disk_entries'] == disk_count(db_service) == 1
+    assert ResponseCache(db_service).stats()['disk_entries'] == 1
+
+    cache.clear()
+    assert cache.stats()['disk_entries'] == disk_count(db_service) == 0
+    assert cache.get('b') is None
+
+
+@pytest.mark.parametrize('entries, limit', [(5, 3), (4, 4)])
+def test_memory_lru_limits(db_service, entries, limit):
+    cache = ResponseCache(db_service, max_memory_entries=limit)
+    for i in range(entries):
+        cache.set(str(i), 'v')
+    stats = cache.stats()
+    assert stats['memory_entries'] == min(entries, limit)
+    assert stats['evictions'] == max(0, entries - limit)
@@ -0,0 +1,94 @@
+import pytest
+
+from modules.rule_engine import LocalRuleEngine
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return LocalRuleEngine()
+
+
+def score(engine, text, rule):
+    return engine.evaluate(text)[rule]['score']
+
+
+def test_every_local_rule_is_scored_with_local_source(engine):
+    result = engine.evaluate('시스템은 요청을 1초 이내에 처리해야 한다.')
+    assert set(result) == set(LocalRuleEngine.RULES)
+    assert all(entry['source'] == 'local' and entry['reason'] for entry in result.values())
+
+
+@pytest.mark.parametrize('text', [
+    'REQ-001-002: 시스템은 사용자 요청에 100ms 응답해야 한다.',
+    'SYS-IF-12에서 시스템은 요청을 3초에 처리해야 한다.',
+    '시스템은 2024-01-01부터 로그를 5년 보관해야 한다.',
+])
+def test_ids_and_dates_are_not_ranges(engine, text):
+    result = engine.evaluate(text)['R33']
+    assert result['score'] == 3, result['reason']
+
+
+@pytest.mark.parametrize('text', [
+    'REQ-001: 시스템은 요청에 10-20ms 안에 응답해야 한다.',
+    '응답 시간은 10 ~ 20 ms 사이여야 한다.',
+    '응답 시간은 10ms-20ms여야 한다.',
+    'The supply voltage shall be 10 to 20 V.',
+    '오차는 ±5%여야 한다.',
+    '시스템은 요청을 1초 이내에 처리해야 한다.',
+])
+def test_ranges_and_tolerances_are_recognized(engine, text):
+    assert score(engine, text, 'R33') == 5
+
+
+def test_ids_and_dates_alone_are_not_quantities(engine):
+    assert score(engine, 'REQ-001-002: 시스템은 로그를 보관해야 한다.', 'R33') == 0
+    assert score(engine, '시스템은 2024-01-01까지 배포되어야 한다.', 'R33') == 0
+
+
+@pytest.mark.parametrize('text', [
+    '시스템은 오류 없이 데이터를 저장해야 한다.',
+    '권한이 없는 사용자가 접근하면 시스템은 접근을 거부해야 한다.',
+    '시스템은 안전하게 데이터를 저장해야 한다.',
+    '시스템은 안내 메시지를 표시해야 한다.',
+    '시스템은 비밀번호를 평문으로 저장하지 않아야 한다.',
+    'The system shall not store plain-text passwords.',
+])
+def test_negation_free_or_allowed_negation_scores_full(engine, text):
+    result = engine.evaluate(text)['R16']
+    assert result['score'] == 5, result['reason']
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('시스템은 비밀번호를 평문으로 저장하지 않는다.', 3),
+    ('시스템은 데이터 손실이 없어야 한다.', 3),
+    ('사용자는 기록을 삭제할 수 없다.', 3),
+    ('시스템은 평문을 저장해서는 안 된다.', 3),
+    ('시스템은 로그를 삭제하지 않지 않아야 한다.', 1),
+])
+def test_negative_constructions_are_penalized(engine, text, expected):
+    assert score(engine, text, 'R16') == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('시스템은 요청을 처리해야 한다.', 5),
+    ('The system should log requests.', 3),
+    ('시스템은 요청을 처리한다.', 2),
+])
+def test_modal_verbs(engine, text, expected):
+    assert score(engine, text, 'P2') == expected
+
+
+def test_slash_ignores_urls_and_units(engine):
+    assert score(engine, '시스템은 https://example.com/api 에 100 km/h 값을 보내야 한다.', 'R17') == 5
+    assert score(engine, '시스템은 읽기/쓰기를 지원해야 한다.', 'R17') == 4
+
+
+def test_each_is_preferred_over_universal_quantifier(engine):
+    assert score(engine, '시스템은 각 사용자를 인증해야 한다.', 'R32') == 5
+    assert score(engine, '시스템은 모든 사용자를 인증해야 한다.', 'R32') == 3
+    assert score(engine, '시스템은 사용자를 인증해야 한다.', 'R32') == 0
+
+
+def test_vague_terms_are_counted(engine):
+    assert score(engine, '시스템은 빠르게 응답해야 한다.', 'R7') == 3
+    assert score(engine, '시스템은 적절하고 효율적이며 안정적이고 편리해야 한다.', 'R7') == 1
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import config
+from fakes import ALL_RULES, requested_rules, scores_json
+from modules.evaluator import RequirementEvaluator
+from modules.prompt_store import PromptStore
+
+CATEGORIES = RequirementEvaluator.CATEGORIES
+TEXT = '시스템은 요청을 1초 이내에 처리해야 한다.'
+
+
+@pytest.fixture
+def make_evaluator(fake_client):
+    executor = ThreadPoolExecutor(max_workers=len(CATEGORIES))
+    scoring_prompt = PromptStore().get(config.SCORING_PROMPT_FILE)
+
+    def make(shard_retries=1, recover_missing=True):
+        return RequirementEvaluator(fake_client, scoring_prompt, shard_executor=executor,
+                                    shard_retries=shard_retries, recover_missing=recover_missing)
+
+    yield make
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def failing_for(category, times):
+    """지정한 카테고리 규칙만 요청받은 호출을 times번 실패시키는 응답 함수 (호출 기록 포함)"""
+    target = CATEGORIES[category]
+    lock = threading.Lock()
+    state = {'failures': 0, 'requests': []}
+
+    def respond(system_prompt, user_message):
+        rules = requested_rules(system_prompt)
+        with lock:
+            state['requests'].append(rules)
+            fail = rules == target and state['failures'] < times
+            if fail:
+                state['failures'] += 1
+        if fail:
+            raise RuntimeError(f'shard {category} failed')
+        return scores_json(rules)
+
+    respond.state = state
+    return respond
+
+
+def test_one_call_per_category_merged_into_full_result(make_evaluator, fake_client):
+    fake_client.respond = failing_for(next(iter(CATEGORIES)), times=0)
+
+    result = make_evaluator().evaluate(TEXT, mode='sharded')
+
+    requests = fake_client.respond.state['requests']
+    assert sorted(map(tuple, requests)) == sorted(map(tuple, CATEGORIES.values()))
+    assert result['mode'] == 'sharded'
+    assert set(result['scores']) == set(ALL_RULES)
+    assert set(result['completeness'].values()) == {'complete'}
+    assert 'failed_shards' not in result and 'missing_rules' not in result
+    for name, rules in CATEGORIES.items():
+        assert result['categories'][name]['score'] == 4 * len(rules)
+
+
+def test_shards_run_concurrently(make_evaluator, fake_client):
+    fake_client.delays = {'evaluate': 0.1}
+
+    started = time.perf_counter()
+    make_evaluator().evaluate(TEXT, mode='sharded')
+
+    assert time.perf_counter() - started < 0.1 * len(CATEGORIES) / 2
+
+
+def test_failed_shard_is_retried_alone(make_evaluator, fake_client):
+    category = 'Modularity (모듈성)'
+    fake_client.respond = failing_for(category, times=1)
+
+    result = make_evaluator(shard_retries=1).evaluate(TEXT, mode='sharded')
+
+    requests = fake_client.respond.state['requests']
+    assert len(requests) == len(CATEGORIES) + 1
+    assert requests.count(CATEGORIES[category]) == 2
+    assert 'failed_shards' not in result
+    assert set(result['scores']) == set(ALL_RULES)
+
+
+def test_shard_failing_after_retries_is_reported_and_recovered(make_evaluator, fake_client):
+    category = 'Modularity (모듈성)'
+    fake_client.respond = failing_for(category, times=2)
+
+    result = make_evaluator(shard_retries=1).evaluate(TEXT, mode='sharded')
+
+    assert 'shard Modularity' in result['failed_shards'][category]
+    # 실패한 카테고리 규칙은 마지막에 한 번 더 모아서 재요청
+    assert fake_client.respond.state['requests'][-1] == CATEGORIES[category]
+    assert {result['completeness'][rule] for rule in CATEGORIES[category]} == {'recovered'}
+    assert set(result['scores']) == set(ALL_RULES)
+
+
+def test_unrecoverable_shard_leaves_missing_rules(make_evaluator, fake_client):
+    category = 'Modularity (모듈성)'
+    fake_client.respond = failing_for(category, times=10)
+
+    result = make_evaluator(shard_retries=1).evaluate(TEXT, mode='sharded')
+
+    assert result['missing_rules'] == CATEGORIES[category]
+    assert result['categories'][category]['score'] == 0
+    assert category in result['failed_shards']
+
+
+def test_all_shards_failing_returns_error_result(make_evaluator, fake_client):
+    def respond(system_prompt, user_message):
+        raise RuntimeError('provider down')
+
+    fake_client.respond = respond
+    result = make_evaluator(shard_retries=0, recover_missing=False).evaluate(TEXT, mode='sharded')
+
+    assert result['total'] == 0 and result['scores'] == {}
+    assert 'provider down' in result['error']
+
+
+def test_shard_without_its_rules_counts_as_failure(make_evaluator, fake_client):
+    category = 'Modularity (모듈성)'
+
+    def respond(system_prompt, user_message):
+        rules = requested_rules(system_prompt)
+        return scores_json(['P1'] if rules == CATEGORIES[category] else rules)
+
+    fake_client.respond = respond
+    result = make_evaluator(shard_retries=0, recover_missing=False).evaluate(TEXT, mode='sharded')
+
+    assert 'No scores for' in result['failed_shards'][category]
+    assert fake_client.discarded
+
+
+def test_stream_emits_one_shard_event_per_category(make_evaluator, fake_client):
+    fake_client.respond = failing_for('Modularity (모듈성)', times=2)
+
+    events = list(make_evaluator(shard_retries=1).evaluate_stream(TEXT, mode='sharded'))
+
+    shards = [data for event, data in events[:-1]]
+    assert [event for event, _ in events] == ['shard'] * len(CATEGORIES) + ['scored']
+    assert {shard['category'] for shard in shards} == set(CATEGORIES)
+    assert [shard['category'] for shard in shards if 'error' in shard] == ['Modularity (모듈성)']
+    assert events[-1][1]['mode'] == 'sharded'
+
+
+def test_async_sharded_matches_sync(make_evaluator, fake_client):
+    fake_client.respond = failing_for('Modularity (모듈성)', times=1)
+    async_result = asyncio.run(make_evaluator().aevaluate(TEXT, mode='sharded'))
+    fake_client.respond = failing_for('Modularity (모듈성)', times=1)
+    sync_result = make_evaluator().evaluate(TEXT, mode='sharded')
+
+    assert async_result == sync_result
+    assert 'failed_shards' not in async_result
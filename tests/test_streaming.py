@@ -0,0 +1,85 @@
+import json
+import time
+
+import pytest
+
+from fakes import FakeAIClient, IMPROVED_TEXT, requested_rules, scores_json
+
+ORIGINAL_TEXT = '시스템은 빨라야 한다.'
+
+
+def respond_after(original_delay, improved_delay):
+    """원본/개선본 평가에 각각 다른 지연을 주는 응답 함수 (개선 요청은 지연 없이 개선 텍스트)"""
+    def respond(system_prompt, user_message):
+        if FakeAIClient.kind(user_message) != 'evaluate':
+            return IMPROVED_TEXT
+        time.sleep(improved_delay if IMPROVED_TEXT in user_message else original_delay)
+        return scores_json(requested_rules(system_prompt))
+    return respond
+
+
+def timed_events(events):
+    started = time.perf_counter()
+    return [(event, data, time.perf_counter() - started) for event, data in events]
+
+
+def test_original_scored_is_sent_while_improved_evaluation_runs(analysis_service, fake_client):
+    # 원본 평가는 마지막 토큰 이후, 개선본 평가 완료 이전에 끝남
+    fake_client.delays = {'improve': 0.1}
+    fake_client.respond = respond_after(original_delay=0.3, improved_delay=0.6)
+
+    events = timed_events(analysis_service.improve_stream(ORIGINAL_TEXT, {}, pipeline='concurrent'))
+    names = [event for event, _, _ in events]
+    at = {event: elapsed for event, _, elapsed in events}
+
+    assert names[0] == 'start' and names[-1] == 'result'
+    assert names.count('original_scored') == 1
+    assert names.index('improved') < names.index('original_scored') < names.index('improved_scored')
+    # 개선본 평가(약 0.7초 시점 완료)를 기다리지 않고 원본 평가 완료 직후 전달
+    assert at['original_scored'] < 0.5
+    assert at['improved_scored'] >= 0.6
+
+
+def test_improved_scored_can_arrive_before_original_scored(analysis_service, fake_client):
+    fake_client.respond = respond_after(original_delay=0.5, improved_delay=0.0)
+
+    events = [event for event, _ in analysis_service.improve_stream(ORIGINAL_TEXT, {}, pipeline='concurrent')]
+
+    assert events.index('improved_scored') < events.index('original_scored') < events.index('result')
+
+
+@pytest.mark.parametrize('pipeline', ['concurrent', 'sequential'])
+def test_stream_result_matches_improve(analysis_service, pipeline):
+    events = list(analysis_service.improve_stream(ORIGINAL_TEXT, {}, pipeline=pipeline))
+    streamed = dict(events)['result']
+    direct = analysis_service.improve(ORIGINAL_TEXT, {}, pipeline=pipeline)
+
+    assert ''.join(data['text'] for event, data in events if event == 'improvement_token') == IMPROVED_TEXT
+    for key in ('original_scores', 'improved_result', 'improved_scores', 'comparison'):
+        assert streamed[key] == direct[key]
+
+
+def test_sequential_stream_keeps_stage_order(analysis_service):
+    events = [event for event, _ in analysis_service.improve_stream(ORIGINAL_TEXT, {}, pipeline='sequential')]
+    stages = [event for event in events if event != 'improvement_token']
+    assert stages == ['start', 'original_scored', 'improved', 'improved_scored', 'result']
+
+
+def test_improve_stream_route_sends_sse_events(api_client, monkeypatch):
+    import api
+
+    monkeypatch.setattr(api.analysis_service, '_create_ai_client', lambda: FakeAIClient())
+    response = api_client.post('/api/improve/stream', json={'text': ORIGINAL_TEXT, 'pipeline': 'concurrent'})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    messages = [block.split('\n') for block in response.get_data(as_text=True).strip().split('\n\n')]
+    events = [(lines[0][len('event: '):], json.loads(lines[1][len('data: '):])) for lines in messages]
+    names = [event for event, _ in events]
+    assert names[-2:] == ['result', 'done']
+    assert {'original_scored', 'improvement_token', 'improved', 'improved_scored'} <= set(names)
+
+
+def test_improve_stream_route_rejects_invalid_pipeline(api_client):
+    response = api_client.post('/api/improve/stream', json={'text': ORIGINAL_TEXT, 'pipeline': 'parallel'})
+    assert response.status_code == 400